@@ -0,0 +1,32 @@
+"""add_user_session_epoch
+
+Revision ID: 4f1c2a9e7b30
+Revises: d2991ea69294
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1c2a9e7b30'
+down_revision: str | Sequence[str] | None = 'd2991ea69294'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column('session_epoch', sa.Integer(), server_default=sa.text('0'), nullable=False)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'session_epoch')
@@ -0,0 +1,45 @@
+"""add_service_access_decision_indexes
+
+Revision ID: 7c3e91d4a5f2
+Revises: 4f1c2a9e7b30
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e91d4a5f2'
+down_revision: str | Sequence[str] | None = '4f1c2a9e7b30'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_service_access_decision',
+        'service_accesses',
+        ['user_id', 'service_name'],
+        unique=False,
+        postgresql_include=['is_allowed', 'revoked_at', 'allowed_features']
+    )
+    op.drop_index('idx_service_access_lookup', table_name='service_accesses', postgresql_where=sa.text('is_allowed = true'))
+    op.create_index(
+        'idx_userplan_active_expiry',
+        'user_plans',
+        ['user_id', 'expires_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'ACTIVE'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_userplan_active_expiry', table_name='user_plans', postgresql_where=sa.text("status = 'ACTIVE'"))
+    op.create_index('idx_service_access_lookup', 'service_accesses', ['user_id', 'service_name'], unique=False, postgresql_where=sa.text('is_allowed = true'))
+    op.drop_index('idx_service_access_decision', table_name='service_accesses')
@@ -0,0 +1,27 @@
+"""add_quota_reset_at_index
+
+Revision ID: a91d6e2c4b57
+Revises: 7c3e91d4a5f2
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91d6e2c4b57'
+down_revision: str | Sequence[str] | None = '7c3e91d4a5f2'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_quota_reset_at', 'quotas', ['reset_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_quota_reset_at', table_name='quotas')
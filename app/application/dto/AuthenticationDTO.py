@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 
@@ -26,3 +27,4 @@ class AuthenticationResult:
 class AuthenticatedUser:
     user_id : UUID
     session_id : UUID
+    expires_at : datetime | None = None
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.application.dto.QuotaCheckDTO import QuotaCheckResult
+
+
+@dataclass
+class IntrospectionResult:
+    is_valid: bool
+    user_id: UUID | None = None
+    session_id: UUID | None = None
+    is_allowed: bool = False
+    allowed_features: list[str] | None = None
+    quota: QuotaCheckResult | None = None
+    error_message: str | None = None
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from app.domain.authorization.RevocationEvent import RevocationEvent
+
+
+@dataclass
+class RevocationFeedPage:
+    events: list[RevocationEvent]
+    cursor: str | None
+    retention_seconds: int
+    snapshot_complete: bool = False
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 
@@ -9,3 +10,4 @@ class TokenValidationResult:
     session_id: UUID | None = None
     error_message: str | None = None
     refresh_token: str | None = None
+    expires_at: datetime | None = None
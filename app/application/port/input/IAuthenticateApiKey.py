@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from app.domain.authorization.ApiKey import ApiKey
+
+
+class IAuthenticateApiKey(ABC):
+    @abstractmethod
+    async def execute(self, raw_key: str, scope: str) -> ApiKey:
+        pass
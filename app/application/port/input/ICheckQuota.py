@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from app.application.dto.QuotaCheckDTO import QuotaCheckResult
+from app.domain.service.QuotaCharge import QuotaCharge
 
 
 class ICheckQuota(ABC):
@@ -10,5 +11,16 @@ class ICheckQuota(ABC):
         pass
 
     @abstractmethod
-    async def consume(self, user_id: UUID, service_name: str, quota_type: str, amount: int) -> bool:
+    async def consume(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        amount: int,
+        idempotency_key: str | None = None
+    ) -> QuotaCheckResult:
+        pass
+
+    @abstractmethod
+    async def consume_many(self, user_id: UUID, charges: list[QuotaCharge]) -> list[QuotaCheckResult]:
         pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from app.application.dto.IntrospectionDTO import IntrospectionResult
+
+
+class IIntrospectToken(ABC):
+    @abstractmethod
+    async def execute(
+        self,
+        token: str,
+        service_name: str,
+        quota_type: str,
+        amount: int,
+        consume: bool,
+    ) -> IntrospectionResult:
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Any
+from uuid import UUID
+
+from app.domain.authorization.ServiceRegistry import ServiceRegistry
+
+
+class IIssueEntitlementClaims(ABC):
+    @abstractmethod
+    async def claims_for(self, user_id: UUID) -> dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def registry(self) -> ServiceRegistry:
+        pass
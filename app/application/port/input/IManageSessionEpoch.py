@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from app.domain.authorization.SessionEpoch import SessionEpoch
+
+
+class IManageSessionEpoch(ABC):
+    @abstractmethod
+    async def current(self, user_id: UUID) -> SessionEpoch:
+        pass
+
+    @abstractmethod
+    async def bump(self, user_id: UUID) -> SessionEpoch:
+        pass
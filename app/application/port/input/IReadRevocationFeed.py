@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+
+from app.application.dto.RevocationFeedDTO import RevocationFeedPage
+
+
+class IReadRevocationFeed(ABC):
+    @abstractmethod
+    async def execute(self, cursor: str | None, limit: int) -> RevocationFeedPage:
+        pass
+
+    @abstractmethod
+    def stream(self, cursor: str | None, heartbeat_seconds: int) -> AsyncIterator[RevocationFeedPage]:
+        pass
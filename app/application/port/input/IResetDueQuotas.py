@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+
+
+class IResetDueQuotas(ABC):
+    @abstractmethod
+    async def execute(self, batch_size: int) -> int:
+        pass
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from app.application.dto.ServiceAccessDTO import ServiceAccessResult
+from app.domain.authorization.EntitlementSnapshot import EntitlementSnapshot
 
 
 class IValidateServiceAccess(ABC):
@@ -9,6 +10,14 @@ class IValidateServiceAccess(ABC):
     async def execute(self, user_id: UUID, service_name: str) -> ServiceAccessResult:
         pass
 
+    @abstractmethod
+    async def execute_bulk(self, user_id: UUID, service_names: list[str]) -> dict[str, ServiceAccessResult]:
+        pass
+
     @abstractmethod
     async def check_feature_access(self, user_id: UUID, service_name: str, feature: str) -> bool:
         pass
+
+    @abstractmethod
+    async def load_entitlements(self, user_id: UUID) -> EntitlementSnapshot:
+        pass
@@ -7,3 +7,7 @@ class IValidateToken(ABC):
     @abstractmethod
     async def execute(self, token: str) -> TokenValidationResult:
         pass
+
+    @abstractmethod
+    async def execute_batch(self, tokens: list[str]) -> list[TokenValidationResult]:
+        pass
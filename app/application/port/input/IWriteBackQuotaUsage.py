@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from app.domain.service.QuotaCounter import QuotaCounter
+
+
+class IWriteBackQuotaUsage(ABC):
+    @abstractmethod
+    async def execute(self, counters: list[QuotaCounter]) -> None:
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from app.domain.authorization.EntitlementSnapshot import EntitlementSnapshot
+
+
+class IEntitlementCache(ABC):
+    @abstractmethod
+    async def get(self, user_id: UUID) -> EntitlementSnapshot | None:
+        pass
+
+    @abstractmethod
+    async def generation(self, user_id: UUID) -> int | None:
+        pass
+
+    @abstractmethod
+    async def fill(self, snapshot: EntitlementSnapshot, generation: int) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate(self, user_id: UUID) -> None:
+        pass
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from app.domain.service.IdempotencyClaim import IdempotencyClaim
+
+
+class IIdempotencyStore(ABC):
+    @abstractmethod
+    async def claim(self, key: str, fingerprint: str) -> IdempotencyClaim:
+        pass
+
+    @abstractmethod
+    async def complete(self, key: str, fingerprint: str, outcome: dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        pass
@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from app.domain.service.Quota import Quota
+from app.domain.service.QuotaCharge import QuotaCharge
+from app.domain.service.QuotaCounter import QuotaCounter, QuotaCounterBatchResult, QuotaCounterResult
+from app.domain.service.QuotaLease import QuotaLease
+
+
+class IQuotaCounterStore(ABC):
+    @abstractmethod
+    async def apply(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        amount: int,
+        consume: bool,
+        current_time: datetime,
+        reset_period: timedelta,
+        seed: Quota | None = None,
+    ) -> QuotaCounterResult:
+        pass
+
+    @abstractmethod
+    async def apply_many(
+        self,
+        user_id: UUID,
+        charges: list[QuotaCharge],
+        current_time: datetime,
+        reset_period: timedelta,
+        seeds: dict[tuple[str, str], Quota] | None = None,
+    ) -> QuotaCounterBatchResult:
+        pass
+
+    @abstractmethod
+    async def reserve(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        block: int,
+        minimum: int,
+        overshoot_tolerance: int,
+        current_time: datetime,
+        reset_period: timedelta,
+        seed: Quota | None = None,
+    ) -> QuotaCounterResult:
+        pass
+
+    @abstractmethod
+    async def release(self, leases: list[QuotaLease]) -> None:
+        pass
+
+    @abstractmethod
+    async def drain(self, limit: int) -> list[QuotaCounter]:
+        pass
+
+    @abstractmethod
+    async def requeue(self, counters: list[QuotaCounter]) -> None:
+        pass
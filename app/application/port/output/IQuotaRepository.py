@@ -3,6 +3,10 @@ from datetime import datetime
 from uuid import UUID
 
 from app.domain.service.Quota import Quota
+from app.domain.service.QuotaCharge import QuotaCharge
+from app.domain.service.QuotaConsumption import QuotaConsumption
+from app.domain.service.QuotaCounter import QuotaCounter
+from app.domain.service.QuotaDefaults import QuotaDefaults
 
 
 class IQuotaRepository(ABC):
@@ -11,13 +15,35 @@ class IQuotaRepository(ABC):
         pass
 
     @abstractmethod
-    async def update_usage(self, quota_id: UUID, amount: int) -> bool:
+    async def consume(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        amount: int,
+        current_time: datetime,
+        quota_defaults: QuotaDefaults,
+    ) -> QuotaConsumption:
         pass
 
     @abstractmethod
-    async def reset_if_needed(self, quota_id: UUID, current_time: datetime) -> Quota:
+    async def consume_many(
+        self,
+        user_id: UUID,
+        charges: list[QuotaCharge],
+        current_time: datetime,
+        quota_defaults: QuotaDefaults,
+    ) -> list[QuotaConsumption]:
+        pass
+
+    @abstractmethod
+    async def reset_due(self, current_time: datetime, quota_defaults: QuotaDefaults, limit: int) -> int:
         pass
 
     @abstractmethod
     async def save(self, quota: Quota) -> Quota:
         pass
+
+    @abstractmethod
+    async def write_back(self, counters: list[QuotaCounter], current_time: datetime) -> list[QuotaConsumption]:
+        pass
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+
+from app.application.port.output.IPlanRepository import IPlanRepository
+from app.application.port.output.IServiceAccessRepository import IServiceAccessRepository
+from app.application.port.output.ISessionRepository import ISessionRepository
+from app.application.port.output.IUserPlanRepository import IUserPlanRepository
+
+
+@dataclass(frozen=True)
+class ReadRepositories:
+    session_repository: ISessionRepository
+    service_access_repository: IServiceAccessRepository
+    user_plan_repository: IUserPlanRepository
+    plan_repository: IPlanRepository
+
+
+class IReadScope(ABC):
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+    @abstractmethod
+    def open(self) -> AbstractAsyncContextManager[ReadRepositories]:
+        pass
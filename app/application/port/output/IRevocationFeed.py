@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from app.domain.authorization.RevocationEvent import RevocationEvent
+
+
+class IRevocationFeed(ABC):
+    @abstractmethod
+    async def publish(self, event: RevocationEvent) -> None:
+        pass
+
+    @abstractmethod
+    async def read_after(self, cursor: str | None, limit: int) -> list[RevocationEvent]:
+        pass
+
+    @abstractmethod
+    async def wait_after(self, cursor: str | None, limit: int, timeout_seconds: int) -> list[RevocationEvent]:
+        pass
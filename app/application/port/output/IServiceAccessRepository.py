@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from app.domain.authorization.ServiceAccess import ServiceAccess
+from app.domain.authorization.ServiceAccessDecision import ServiceAccessDecision
 
 
 class IServiceAccessRepository(ABC):
@@ -10,7 +11,15 @@ class IServiceAccessRepository(ABC):
         pass
 
     @abstractmethod
-    async def find_all_by_user(self, user_id: UUID) -> list[ServiceAccess]:
+    async def find_by_user_and_services(self, user_id: UUID, service_names: list[str]) -> list[ServiceAccess]:
+        pass
+
+    @abstractmethod
+    async def find_decision(self, user_id: UUID, service_name: str) -> ServiceAccessDecision | None:
+        pass
+
+    @abstractmethod
+    async def find_all_by_user(self, user_id: UUID, include_revoked: bool = False) -> list[ServiceAccess]:
         pass
 
     @abstractmethod
@@ -17,6 +17,10 @@ class IServiceRepository(ABC):
     async def find_all_active(self) -> list[Service]:
         pass
 
+    @abstractmethod
+    async def find_all(self) -> list[Service]:
+        pass
+
     @abstractmethod
     async def find_by_ids(self, service_ids: list[UUID]) -> list[Service]:
         pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class ISessionEpochStore(ABC):
+    @abstractmethod
+    async def get(self, user_id: UUID) -> int | None:
+        pass
+
+    @abstractmethod
+    async def seed(self, user_id: UUID, epoch: int) -> None:
+        pass
+
+    @abstractmethod
+    async def increment(self, user_id: UUID) -> int | None:
+        pass
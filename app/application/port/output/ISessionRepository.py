@@ -9,6 +9,10 @@ class ISessionRepository(ABC):
     async def find_by_id(self, session_id: UUID) -> Session | None:
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, session_ids: list[UUID]) -> list[Session]:
+        pass
+
     @abstractmethod
     async def find_active_by_user(self, user_id: UUID) -> list[Session]:
         pass
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from app.domain.authorization.SessionState import SessionState
+
+
+class ISessionStateCache(ABC):
+    @abstractmethod
+    async def get(self, session_id: UUID) -> SessionState | None:
+        pass
+
+    @abstractmethod
+    async def get_many(self, session_ids: list[UUID]) -> dict[UUID, SessionState]:
+        pass
+
+    @abstractmethod
+    async def set(self, state: SessionState) -> None:
+        pass
+
+    @abstractmethod
+    async def set_if_absent(self, state: SessionState) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, session_id: UUID) -> None:
+        pass
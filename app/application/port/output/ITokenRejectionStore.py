@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from app.domain.authorization.TokenRejection import TokenRejection
+
+
+class ITokenRejectionStore(ABC):
+    @abstractmethod
+    async def get(self, token: str) -> TokenRejection | None:
+        pass
+
+    @abstractmethod
+    async def set(self, token: str, rejection: TokenRejection) -> None:
+        pass
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+
+class ITransactionHooks(ABC):
+    @abstractmethod
+    def after_commit(self, action: Callable[[], Awaitable[None]]) -> None:
+        pass
+
+    @abstractmethod
+    def after_rollback(self, action: Callable[[], Awaitable[None]]) -> None:
+        pass
@@ -28,3 +28,15 @@ class IUserRepository(ABC):
     @abstractmethod
     async def delete(self, user_id: UUID) -> None:
         pass
+
+    @abstractmethod
+    async def find_session_epoch(self, user_id: UUID) -> int | None:
+        pass
+
+    @abstractmethod
+    async def increment_session_epoch(self, user_id: UUID) -> int:
+        pass
+
+    @abstractmethod
+    async def mirror_session_epoch(self, user_id: UUID, epoch: int) -> None:
+        pass
@@ -0,0 +1,22 @@
+from app.application.port.input.IAuthenticateApiKey import IAuthenticateApiKey
+from app.application.port.output.IApiKeyRepository import IApiKeyRepository
+from app.domain.authorization.ApiKey import ApiKey
+from app.shared.DateTime import DateTimeProtocol
+from app.domain.exceptions import AccessDeniedException, InvalidCredentialsException
+
+
+class ApiKeyAuthenticationService(IAuthenticateApiKey):
+    def __init__(self, api_key_repository: IApiKeyRepository, datetime_converter: DateTimeProtocol):
+        self.api_key_repository = api_key_repository
+        self.datetime_converter = datetime_converter
+
+    async def execute(self, raw_key: str, scope: str) -> ApiKey:
+        api_key = await self.api_key_repository.find_by_key_hash(ApiKey.hash_key(raw_key))
+
+        if api_key is None or not api_key.is_valid(self.datetime_converter.now_utc()):
+            raise InvalidCredentialsException()
+
+        if not api_key.has_scope(scope):
+            raise AccessDeniedException(resource=scope)
+
+        return api_key
@@ -3,12 +3,16 @@ from uuid import UUID
 
 from app.application.dto.AuthenticationDTO import AuthenticationResult
 from app.application.port.input.IAuthenticateUser import IAuthenticateUser
+from app.application.port.input.IIssueEntitlementClaims import IIssueEntitlementClaims
+from app.application.port.input.IManageSessionEpoch import IManageSessionEpoch
 from app.application.port.output.IAuthProviderRepository import IAuthProviderRepository
 from app.application.port.output.IOtpCodeRepository import IOtpCodeRepository
 from app.application.port.output.ISessionRepository import ISessionRepository
 from app.application.port.output.ITransactionLogger import ITransactionLogger
 from app.application.port.output.IUserRepository import IUserRepository
+from app.domain.authentication.User import User
 from app.domain.authorization.Session import Session
+from app.domain.authorization.SessionEpoch import SessionEpoch
 from app.domain.log.UserBehaviorLog import UserBehaviorLog
 from app.domain.ValueObjects import OtpPurpose, UserBehaviorAction
 from app.shared.Cryptography import Salter
@@ -40,6 +44,8 @@ class AuthenticationService(IAuthenticateUser):
         logger: ILogger,
         rate_limiter: OtpRateLimiter,
         token_policy: TokenPolicy,
+        session_epoch_service: IManageSessionEpoch | None = None,
+        entitlement_claims: IIssueEntitlementClaims | None = None,
     ):
         self.user_repository = user_repository
         self.auth_provider_repository = auth_provider_repository
@@ -53,6 +59,8 @@ class AuthenticationService(IAuthenticateUser):
         self.logger = logger.bind(service="authentication")
         self.token_policy = token_policy
         self.rate_limiter = rate_limiter
+        self.session_epoch_service = session_epoch_service
+        self.entitlement_claims = entitlement_claims
 
 
     async def execute_with_email(self, email: str, password: str, device_info: str, ip_address: str) -> AuthenticationResult:
@@ -120,7 +128,7 @@ class AuthenticationService(IAuthenticateUser):
             )
             raise InvalidCredentialsException()
 
-        result = await self._create_session(user.id, device_info, ip_address)
+        result = await self._create_session(user.id, device_info, ip_address, await self._resolve_session_epoch(user))
 
         await self.transaction_logger.log_user_behavior(
             UserBehaviorLog(
@@ -211,7 +219,7 @@ class AuthenticationService(IAuthenticateUser):
         await self.otp_repository.mark_used(otp.id)
         await self.rate_limiter.reset_rate_limit(user.id, operation="otp_validation_phone")
 
-        result = await self._create_session(user.id, device_info, ip_address)
+        result = await self._create_session(user.id, device_info, ip_address, await self._resolve_session_epoch(user))
 
         self.logger.info("otp_authentication_success", user_id=str(user.id))
 
@@ -232,7 +240,18 @@ class AuthenticationService(IAuthenticateUser):
     async def execute_with_oauth2(self, provider: str, code: str, device_info: str, ip_address: str) -> AuthenticationResult:
         raise NotImplementedError("OAuth2 authentication not yet implemented")
 
-    async def _create_session(self, user_id: UUID, device_info: str, ip_address: str) -> AuthenticationResult:
+    async def _resolve_session_epoch(self, user: User) -> SessionEpoch:
+        if self.session_epoch_service is None:
+            return SessionEpoch(value=user.session_epoch)
+        return await self.session_epoch_service.current(user.id)
+
+    async def _create_session(
+        self,
+        user_id: UUID,
+        device_info: str,
+        ip_address: str,
+        session_epoch: SessionEpoch,
+    ) -> AuthenticationResult:
         current_time = self.datetime_converter.now_utc()
 
         session_id = self.uuid_generator.generate()
@@ -240,8 +259,11 @@ class AuthenticationService(IAuthenticateUser):
         access_token_payload = {
             "user_id": str(user_id),
             "session_id": str(session_id),
+            SessionEpoch.CLAIM: session_epoch.value,
             "type": "access"
         }
+        if self.entitlement_claims is not None:
+            access_token_payload.update(await self.entitlement_claims.claims_for(user_id))
         access_token = self.token_generator.generate(
             access_token_payload,
             expires_delta=self.token_policy.get_access_token_expiry()
@@ -250,6 +272,7 @@ class AuthenticationService(IAuthenticateUser):
         refresh_token_payload = {
             "user_id": str(user_id),
             "session_id": str(session_id),
+            SessionEpoch.CLAIM: session_epoch.value,
             "type": "refresh"
         }
         refresh_token = self.token_generator.generate(
@@ -0,0 +1,64 @@
+from typing import Any
+from uuid import UUID
+
+from app.application.port.input.IIssueEntitlementClaims import IIssueEntitlementClaims
+from app.application.port.input.IValidateServiceAccess import IValidateServiceAccess
+from app.application.port.output.IServiceRepository import IServiceRepository
+from app.domain.authorization.EntitlementClaim import EntitlementClaim
+from app.domain.authorization.ServiceRegistry import ServiceRegistry
+from app.shared.DateTime import DateTimeProtocol
+from app.shared.TtlCache import ITtlCache
+
+
+class EntitlementClaimService(IIssueEntitlementClaims):
+    REGISTRY_KEY = "service_registry"
+
+    def __init__(
+        self,
+        service_repository: IServiceRepository,
+        service_access_validator: IValidateServiceAccess,
+        datetime_converter: DateTimeProtocol,
+        registry_cache: ITtlCache[ServiceRegistry] | None = None,
+        registry_ttl_seconds: int = 60,
+    ):
+        self.service_repository = service_repository
+        self.service_access_validator = service_access_validator
+        self.datetime_converter = datetime_converter
+        self.registry_cache = registry_cache
+        self.registry_ttl_seconds = registry_ttl_seconds
+
+    async def claims_for(self, user_id: UUID) -> dict[str, Any]:
+        snapshot = await self.service_access_validator.load_entitlements(user_id)
+        registry = self._cached_registry()
+        if registry is None or any(registry.index_of(service_name) is None for service_name in snapshot.services):
+            registry = await self._load_registry()
+
+        return {
+            EntitlementClaim.CLAIM: EntitlementClaim.encode(
+                snapshot,
+                registry,
+                self.datetime_converter.now_utc()
+            )
+        }
+
+    async def registry(self) -> ServiceRegistry:
+        cached_registry = self._cached_registry()
+        if cached_registry is not None:
+            return cached_registry
+
+        return await self._load_registry()
+
+    def _cached_registry(self) -> ServiceRegistry | None:
+        if self.registry_cache is None:
+            return None
+        return self.registry_cache.get(self.REGISTRY_KEY)
+
+    async def _load_registry(self) -> ServiceRegistry:
+        registry = ServiceRegistry.from_services(await self.service_repository.find_all())
+        if self.registry_cache is not None:
+            self.registry_cache.set(
+                self.REGISTRY_KEY,
+                registry,
+                self.datetime_converter.now_utc().timestamp() + self.registry_ttl_seconds
+            )
+        return registry
@@ -1,25 +1,41 @@
-from datetime import timedelta
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from typing import Any, TypeVar
 from uuid import UUID
 
 from app.application.dto.QuotaCheckDTO import QuotaCheckResult
 from app.application.port.input.ICheckQuota import ICheckQuota
 from app.application.port.input.IValidateServiceAccess import IValidateServiceAccess
+from app.application.port.output.IIdempotencyStore import IIdempotencyStore
 from app.application.port.output.IPlanRepository import IPlanRepository
+from app.application.port.output.IQuotaCounterStore import IQuotaCounterStore
 from app.application.port.output.IQuotaRepository import IQuotaRepository
+from app.application.port.output.IReadScope import IReadScope
+from app.application.port.output.ITransactionHooks import ITransactionHooks
 from app.application.port.output.ITransactionLogger import ITransactionLogger
 from app.application.port.output.IUserPlanRepository import IUserPlanRepository
 from app.domain.log.DatabaseTransactionLog import DatabaseTransactionLog
 from app.domain.service.Quota import Quota
+from app.domain.service.QuotaCharge import QuotaCharge
+from app.domain.service.QuotaCounter import QuotaCounter, QuotaCounterResult
 from app.domain.service.QuotaDefaults import QuotaDefaults
-from app.domain.ValueObjects import DatabaseOperation
+from app.domain.service.QuotaLease import QuotaLease
+from app.domain.ValueObjects import DatabaseOperation, IdempotencyState, QuotaCounterOutcome
 from app.shared.DateTime import DateTimeProtocol
+from app.shared.QuotaLeasePool import IQuotaLeasePool
+from app.shared.SingleFlight import ISingleFlight
 from app.shared.UuidGenerator import UuidGeneratorProtocol
 from app.domain.exceptions import (
     AccessDeniedException,
+    IdempotencyKeyInProgressException,
+    IdempotencyKeyReusedException,
     InsufficientQuotaException,
 )
 
 
+T = TypeVar("T")
+
+
 class QuotaManagementService(ICheckQuota):
     def __init__(
         self,
@@ -31,6 +47,12 @@ class QuotaManagementService(ICheckQuota):
         uuid_generator: UuidGeneratorProtocol,
         service_access_validator: IValidateServiceAccess,
         quota_defaults: QuotaDefaults,
+        single_flight: ISingleFlight | None = None,
+        quota_counter_store: IQuotaCounterStore | None = None,
+        quota_lease_pool: IQuotaLeasePool | None = None,
+        idempotency_store: IIdempotencyStore | None = None,
+        read_scope: IReadScope | None = None,
+        transaction_hooks: ITransactionHooks | None = None,
     ):
         self.quota_repository = quota_repository
         self.user_plan_repository = user_plan_repository
@@ -40,134 +62,428 @@ class QuotaManagementService(ICheckQuota):
         self.uuid_generator = uuid_generator
         self.service_access_validator = service_access_validator
         self.quota_defaults = quota_defaults
+        self.single_flight = single_flight
+        self.quota_counter_store = quota_counter_store
+        self.quota_lease_pool = quota_lease_pool
+        self.idempotency_store = idempotency_store
+        self.read_scope = read_scope
+        self.transaction_hooks = transaction_hooks
 
     async def execute(self, user_id: UUID, service_name: str, quota_type: str, amount: int) -> QuotaCheckResult:
         current_time = self.datetime_converter.now_utc()
 
-        quota = await self.quota_repository.find_by_user_and_service(
-            user_id, service_name, quota_type
-        )
+        if self.quota_counter_store is not None:
+            counter_result = await self.quota_counter_store.apply(
+                user_id, service_name, quota_type, amount, False, current_time, self.quota_defaults.get_reset_period()
+            )
+            if counter_result.is_resolved():
+                return self._to_check_result(counter_result.counter, counter_result.is_accepted())
 
-        if not quota:
-            quota = await self._create_default_quota(user_id, service_name, quota_type, current_time)
+        next_reset_at = self.quota_defaults.next_reset_at(current_time)
+        quota = await self.quota_repository.find_by_user_and_service(user_id, service_name, quota_type)
+
+        if quota is None:
+            limit = await self._default_limit(user_id, quota_type)
+            can_proceed = amount <= limit
+            return QuotaCheckResult(
+                can_proceed=can_proceed,
+                current_usage=0,
+                limit=limit,
+                remaining=limit,
+                reset_at=self.datetime_converter.to_iso_string(next_reset_at),
+                error_message=None if can_proceed else "Quota limit exceeded"
+            )
 
         if quota.needs_reset(current_time):
-            quota = await self.quota_repository.reset_if_needed(quota.id, current_time)
+            quota = quota.in_window(current_time, next_reset_at, await self._default_limit(user_id, quota_type))
+        return self._to_quota_result(quota, quota.can_consume(amount))
 
-        can_proceed = quota.can_consume(amount)
+    async def consume(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        amount: int,
+        idempotency_key: str | None = None
+    ) -> QuotaCheckResult:
+        if idempotency_key is None or self.idempotency_store is None:
+            return await self._consume(user_id, service_name, quota_type, amount)
 
-        return QuotaCheckResult(
-            can_proceed=can_proceed,
-            current_usage=quota.current_usage,
-            limit=quota.limit,
-            remaining=quota.remaining(),
-            reset_at=self.datetime_converter.to_iso_string(quota.reset_at),
-            error_message=None if can_proceed else "Quota limit exceeded"
-        )
+        key = f"quota_consume:{user_id}:{idempotency_key}"
+        fingerprint = f"{service_name}:{quota_type}:{amount}"
+        claim = await self.idempotency_store.claim(key, fingerprint)
+
+        if claim.state == IdempotencyState.COMPLETED:
+            return self._replay(claim.outcome)
+        if claim.state == IdempotencyState.IN_PROGRESS:
+            raise IdempotencyKeyInProgressException(idempotency_key)
+        if claim.state == IdempotencyState.MISMATCH:
+            raise IdempotencyKeyReusedException(idempotency_key)
+        if claim.state == IdempotencyState.UNAVAILABLE:
+            return await self._consume(user_id, service_name, quota_type, amount)
+
+        try:
+            result = await self._consume(user_id, service_name, quota_type, amount)
+        except (InsufficientQuotaException, AccessDeniedException) as e:
+            await self.idempotency_store.complete(key, fingerprint, {"error": type(e).__name__, "details": e.details})
+            raise
+        except Exception:
+            await self.idempotency_store.release(key)
+            raise
+
+        outcome = {"result": asdict(result)}
+        if self.transaction_hooks is None:
+            await self.idempotency_store.complete(key, fingerprint, outcome)
+        else:
+            self.transaction_hooks.after_commit(lambda: self.idempotency_store.complete(key, fingerprint, outcome))
+            self.transaction_hooks.after_rollback(lambda: self.idempotency_store.release(key))
+        return result
 
-    async def consume(self, user_id: UUID, service_name: str, quota_type: str, amount: int) -> bool:
+    async def _consume(self, user_id: UUID, service_name: str, quota_type: str, amount: int) -> QuotaCheckResult:
         current_time = self.datetime_converter.now_utc()
 
         service_access_result = await self.service_access_validator.execute(user_id, service_name)
         if not service_access_result.is_allowed:
             raise AccessDeniedException(resource=service_name)
 
-        quota = await self.quota_repository.find_by_user_and_service(
-            user_id, service_name, quota_type
-        )
+        if self.quota_counter_store is not None and self.quota_lease_pool is not None:
+            lease = await self._consume_from_lease(user_id, service_name, quota_type, amount, current_time)
+            if lease is not None:
+                return self._to_lease_result(lease)
 
-        if not quota:
-            quota = await self._create_default_quota(user_id, service_name, quota_type, current_time)
+        if self.quota_counter_store is not None:
+            counter_result = await self._apply_counter(
+                user_id, service_name, quota_type, amount, True, current_time
+            )
+            if counter_result.is_resolved():
+                if not counter_result.is_accepted():
+                    raise InsufficientQuotaException(
+                        quota_type=quota_type,
+                        current=counter_result.counter.current_usage,
+                        required=amount
+                    )
+                return self._to_check_result(counter_result.counter, True)
 
-        if quota.needs_reset(current_time):
-            quota = await self.quota_repository.reset_if_needed(quota.id, current_time)
+        consumption = await self.quota_repository.consume(
+            user_id, service_name, quota_type, amount, current_time, self.quota_defaults
+        )
+        quota = consumption.quota
+
+        if consumption.created:
+            await self._log_quota_created(quota, current_time, self.uuid_generator.generate())
 
-        if not quota.can_consume(amount):
+        if not consumption.consumed:
             raise InsufficientQuotaException(
                 quota_type=quota_type,
                 current=quota.current_usage,
                 required=amount
             )
 
-        update_success = await self.quota_repository.update_usage(quota.id, amount)
+        await self._log_quota_consumed(quota, amount, current_time, self.uuid_generator.generate())
 
-        if not update_success:
-            raise InsufficientQuotaException(
-                quota_type=quota_type,
-                current=quota.current_usage,
-                required=amount
+        return self._to_quota_result(quota, True)
+
+    async def consume_many(self, user_id: UUID, charges: list[QuotaCharge]) -> list[QuotaCheckResult]:
+        current_time = self.datetime_converter.now_utc()
+        combined = QuotaCharge.combine(charges)
+
+        access_results = await self.service_access_validator.execute_bulk(
+            user_id, [charge.service_name for charge in combined]
+        )
+        for service_name, access_result in access_results.items():
+            if not access_result.is_allowed:
+                raise AccessDeniedException(resource=service_name)
+
+        results = None
+        if self.quota_counter_store is not None:
+            results = await self._apply_counters(user_id, combined, current_time)
+
+        if results is None:
+            results = await self._consume_many_in_database(user_id, combined, current_time)
+
+        return [results[charge.key] for charge in charges]
+
+    async def _apply_counters(
+        self,
+        user_id: UUID,
+        charges: list[QuotaCharge],
+        current_time
+    ) -> dict[tuple[str, str], QuotaCheckResult] | None:
+        reset_period = self.quota_defaults.get_reset_period()
+        batch_result = await self.quota_counter_store.apply_many(user_id, charges, current_time, reset_period)
+
+        if batch_result.outcome == QuotaCounterOutcome.NOT_LOADED:
+            seeds = {
+                charge.key: await self._load_quota(user_id, charge.service_name, charge.quota_type, current_time)
+                for charge in batch_result.missing
+            }
+            batch_result = await self.quota_counter_store.apply_many(
+                user_id, charges, current_time, reset_period, seeds=seeds
+            )
+
+        if not batch_result.is_resolved():
+            return None
+
+        if not batch_result.is_accepted():
+            for charge, counter in zip(charges, batch_result.counters, strict=True):
+                if counter.current_usage + charge.amount > counter.limit:
+                    raise InsufficientQuotaException(
+                        quota_type=charge.quota_type,
+                        current=counter.current_usage,
+                        required=charge.amount
+                    )
+
+        return {
+            charge.key: self._to_check_result(counter, True)
+            for charge, counter in zip(charges, batch_result.counters, strict=True)
+        }
+
+    async def _consume_many_in_database(
+        self,
+        user_id: UUID,
+        charges: list[QuotaCharge],
+        current_time
+    ) -> dict[tuple[str, str], QuotaCheckResult]:
+        consumptions = await self.quota_repository.consume_many(
+            user_id, charges, current_time, self.quota_defaults
+        )
+
+        for charge, consumption in zip(charges, consumptions, strict=True):
+            if not consumption.consumed and not consumption.quota.can_consume(charge.amount):
+                raise InsufficientQuotaException(
+                    quota_type=charge.quota_type,
+                    current=consumption.quota.current_usage,
+                    required=charge.amount
+                )
+
+        transaction_id = self.uuid_generator.generate()
+        for charge, consumption in zip(charges, consumptions, strict=True):
+            if consumption.created:
+                await self._log_quota_created(consumption.quota, current_time, transaction_id)
+            await self._log_quota_consumed(consumption.quota, charge.amount, current_time, transaction_id)
+
+        return {
+            charge.key: self._to_quota_result(consumption.quota, True)
+            for charge, consumption in zip(charges, consumptions, strict=True)
+        }
+
+    async def _log_quota_created(self, quota: Quota, current_time, transaction_id: UUID) -> None:
+        await self.transaction_logger.log_database_transaction(
+            DatabaseTransactionLog(
+                id=self.uuid_generator.generate(),
+                table_name="quotas",
+                operation=DatabaseOperation.INSERT,
+                record_id=quota.id,
+                user_id=quota.user_id,
+                old_value={},
+                new_value={
+                    "service_name": quota.service_name,
+                    "quota_type": quota.quota_type,
+                    "limit": quota.limit
+                },
+                created_at=current_time,
+                transaction_id=transaction_id
             )
+        )
 
+    async def _log_quota_consumed(self, quota: Quota, amount: int, current_time, transaction_id: UUID) -> None:
         await self.transaction_logger.log_database_transaction(
             DatabaseTransactionLog(
                 id=self.uuid_generator.generate(),
                 table_name="quotas",
                 operation=DatabaseOperation.UPDATE,
                 record_id=quota.id,
-                user_id=user_id,
-                old_value={"current_usage": quota.current_usage},
-                new_value={"current_usage": quota.current_usage + amount},
-                created_at=self.datetime_converter.now_utc(),
-                transaction_id=self.uuid_generator.generate()
+                user_id=quota.user_id,
+                old_value={"current_usage": quota.current_usage - amount},
+                new_value={"current_usage": quota.current_usage},
+                created_at=current_time,
+                transaction_id=transaction_id
             )
         )
 
-        return True
+    async def _load_quota(self, user_id: UUID, service_name: str, quota_type: str, current_time) -> Quota:
+        quota = await self.quota_repository.find_by_user_and_service(
+            user_id, service_name, quota_type
+        )
 
-    async def _create_default_quota(
+        if not quota:
+            return await self._virtual_quota(user_id, service_name, quota_type, current_time)
+
+        if quota.needs_reset(current_time):
+            quota = quota.in_window(
+                current_time,
+                self.quota_defaults.next_reset_at(current_time),
+                await self._default_limit(user_id, quota_type)
+            )
+
+        return quota
+
+    async def _apply_counter(
         self,
         user_id: UUID,
         service_name: str,
         quota_type: str,
+        amount: int,
+        consume: bool,
         current_time
-    ) -> Quota:
-        user_plan = await self.user_plan_repository.find_active_by_user(user_id)
-
-        if user_plan:
-            plan = await self.plan_repository.find_by_id(user_plan.plan_id)
-            if plan:
-                quota_limit = plan.get_quota_limit(quota_type)
-                default_limit = self.quota_defaults.get_limit_for_plan(quota_limit)
-            else:
-                default_limit = self.quota_defaults.fallback_limit
-        else:
-            default_limit = self.quota_defaults.get_anonymous_limit()
+    ) -> QuotaCounterResult:
+        reset_period = self.quota_defaults.get_reset_period()
+        return await self._seeded(
+            user_id,
+            service_name,
+            quota_type,
+            current_time,
+            lambda seed: self.quota_counter_store.apply(
+                user_id, service_name, quota_type, amount, consume, current_time, reset_period, seed=seed
+            )
+        )
 
-        reset_at = self.datetime_converter.add_timedelta(
+    async def _consume_from_lease(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        amount: int,
+        current_time
+    ) -> QuotaLease | None:
+        lease = self.quota_lease_pool.take(user_id, service_name, quota_type, amount, current_time)
+        if lease is not None:
+            return lease
+
+        previous = self.quota_lease_pool.retire(user_id, service_name, quota_type, current_time)
+        if previous is not None:
+            await self.quota_counter_store.release([previous])
+
+        block = self.quota_lease_pool.block_size(user_id, service_name, quota_type, amount, current_time)
+        tolerance = self.quota_lease_pool.overshoot_tolerance()
+        reset_period = self.quota_defaults.get_reset_period()
+        counter_result = await self._seeded(
+            user_id,
+            service_name,
+            quota_type,
             current_time,
-            self.quota_defaults.get_reset_period()
+            lambda seed: self.quota_counter_store.reserve(
+                user_id, service_name, quota_type, block, amount, tolerance, current_time, reset_period, seed=seed
+            )
+        )
+
+        if not counter_result.is_resolved():
+            return None
+
+        if not counter_result.is_accepted():
+            raise InsufficientQuotaException(
+                quota_type=quota_type,
+                current=counter_result.counter.current_usage,
+                required=amount
+            )
+
+        lease = self.quota_lease_pool.install(counter_result.counter, counter_result.granted, current_time)
+        lease.take(amount, current_time)
+        return lease
+
+    async def _seeded(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        current_time,
+        call: Callable[[Quota | None], Awaitable[QuotaCounterResult]]
+    ) -> QuotaCounterResult:
+        counter_result = await call(None)
+
+        if counter_result.outcome == QuotaCounterOutcome.NOT_LOADED:
+            quota = await self._load_quota(user_id, service_name, quota_type, current_time)
+            counter_result = await call(quota)
+
+        return counter_result
+
+    def _replay(self, outcome: dict[str, Any]) -> QuotaCheckResult:
+        if "result" in outcome:
+            return QuotaCheckResult(**outcome["result"])
+        if outcome["error"] == AccessDeniedException.__name__:
+            raise AccessDeniedException(**outcome["details"])
+        raise InsufficientQuotaException(**outcome["details"])
+
+    def _to_quota_result(self, quota: Quota, can_proceed: bool) -> QuotaCheckResult:
+        return QuotaCheckResult(
+            can_proceed=can_proceed,
+            current_usage=quota.current_usage,
+            limit=quota.limit,
+            remaining=quota.remaining(),
+            reset_at=self.datetime_converter.to_iso_string(quota.reset_at),
+            error_message=None if can_proceed else "Quota limit exceeded"
+        )
+
+    def _to_check_result(self, counter: QuotaCounter, can_proceed: bool) -> QuotaCheckResult:
+        return QuotaCheckResult(
+            can_proceed=can_proceed,
+            current_usage=counter.current_usage,
+            limit=counter.limit,
+            remaining=counter.remaining(),
+            reset_at=self.datetime_converter.to_iso_string(counter.reset_at),
+            error_message=None if can_proceed else "Quota limit exceeded"
         )
 
-        quota = Quota(
+    def _to_lease_result(self, lease: QuotaLease) -> QuotaCheckResult:
+        return QuotaCheckResult(
+            can_proceed=True,
+            current_usage=lease.current_usage(),
+            limit=lease.limit,
+            remaining=lease.remaining(),
+            reset_at=self.datetime_converter.to_iso_string(lease.reset_at),
+            error_message=None
+        )
+
+    async def _virtual_quota(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        current_time
+    ) -> Quota:
+        return Quota(
             id=self.uuid_generator.generate(),
             user_id=user_id,
             service_name=service_name,
             quota_type=quota_type,
             current_usage=0,
-            limit=default_limit,
-            reset_at=reset_at,
+            limit=await self._default_limit(user_id, quota_type),
+            reset_at=self.quota_defaults.next_reset_at(current_time),
             created_at=current_time,
             updated_at=current_time
         )
 
-        saved_quota = await self.quota_repository.save(quota)
-
-        await self.transaction_logger.log_database_transaction(
-            DatabaseTransactionLog(
-                id=self.uuid_generator.generate(),
-                table_name="quotas",
-                operation=DatabaseOperation.INSERT,
-                record_id=saved_quota.id,
-                user_id=user_id,
-                old_value={},
-                new_value={
-                    "service_name": service_name,
-                    "quota_type": quota_type,
-                    "limit": default_limit
-                },
-                created_at=current_time,
-                transaction_id=self.uuid_generator.generate()
+    async def _default_limit(self, user_id: UUID, quota_type: str) -> int:
+        return await self._coalesce(
+            f"default_quota_limit:{user_id}:{quota_type}",
+            lambda user_plan_repository, plan_repository: self._read_default_limit(
+                user_plan_repository, plan_repository, user_id, quota_type
             )
         )
 
-        return saved_quota
+    async def _read_default_limit(
+        self,
+        user_plan_repository: IUserPlanRepository,
+        plan_repository: IPlanRepository,
+        user_id: UUID,
+        quota_type: str
+    ) -> int:
+        user_plan = await user_plan_repository.find_active_by_user(user_id)
+        if not user_plan:
+            return self.quota_defaults.get_anonymous_limit()
+
+        plan = await plan_repository.find_by_id(user_plan.plan_id)
+        if not plan:
+            return self.quota_defaults.fallback_limit
+
+        return self.quota_defaults.get_limit_for_plan(plan.get_quota_limit(quota_type))
+
+    async def _coalesce(self, key: str, read: Callable[[IUserPlanRepository, IPlanRepository], Awaitable[T]]) -> T:
+        if self.single_flight is None or self.read_scope is None:
+            return await read(self.user_plan_repository, self.plan_repository)
+
+        async def load() -> T:
+            async with self.read_scope.open() as repositories:
+                return await read(repositories.user_plan_repository, repositories.plan_repository)
+
+        return await self.single_flight.do(f"{self.read_scope.name}:{key}", load)
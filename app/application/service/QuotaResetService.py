@@ -0,0 +1,20 @@
+from app.application.port.input.IResetDueQuotas import IResetDueQuotas
+from app.application.port.output.IQuotaRepository import IQuotaRepository
+from app.domain.service.QuotaDefaults import QuotaDefaults
+from app.shared.DateTime import DateTimeProtocol
+
+
+class QuotaResetService(IResetDueQuotas):
+    def __init__(
+        self,
+        quota_repository: IQuotaRepository,
+        datetime_converter: DateTimeProtocol,
+        quota_defaults: QuotaDefaults,
+    ):
+        self.quota_repository = quota_repository
+        self.datetime_converter = datetime_converter
+        self.quota_defaults = quota_defaults
+
+    async def execute(self, batch_size: int) -> int:
+        current_time = self.datetime_converter.now_utc()
+        return await self.quota_repository.reset_due(current_time, self.quota_defaults, batch_size)
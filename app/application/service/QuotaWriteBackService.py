@@ -0,0 +1,85 @@
+from app.application.port.input.IWriteBackQuotaUsage import IWriteBackQuotaUsage
+from app.application.port.output.IQuotaRepository import IQuotaRepository
+from app.application.port.output.ITransactionLogger import ITransactionLogger
+from app.domain.log.DatabaseTransactionLog import DatabaseTransactionLog
+from app.domain.service.QuotaCounter import QuotaCounter
+from app.domain.ValueObjects import DatabaseOperation
+from app.shared.DateTime import DateTimeProtocol
+from app.shared.Logger import ILogger
+from app.shared.UuidGenerator import UuidGeneratorProtocol
+
+
+class QuotaWriteBackService(IWriteBackQuotaUsage):
+    def __init__(
+        self,
+        quota_repository: IQuotaRepository,
+        transaction_logger: ITransactionLogger,
+        datetime_converter: DateTimeProtocol,
+        uuid_generator: UuidGeneratorProtocol,
+        logger: ILogger,
+    ):
+        self.quota_repository = quota_repository
+        self.transaction_logger = transaction_logger
+        self.datetime_converter = datetime_converter
+        self.uuid_generator = uuid_generator
+        self.logger = logger.bind(component="quota_write_back")
+
+    async def execute(self, counters: list[QuotaCounter]) -> None:
+        if not counters:
+            return
+
+        current_time = self.datetime_converter.now_utc()
+        persisted = {
+            (consumption.quota.user_id, consumption.quota.service_name, consumption.quota.quota_type): consumption
+            for consumption in await self.quota_repository.write_back(counters, current_time)
+        }
+
+        transaction_id = self.uuid_generator.generate()
+        for counter in counters:
+            consumption = persisted.get((counter.user_id, counter.service_name, counter.quota_type))
+            if consumption is None:
+                self.logger.warning(
+                    "quota_write_back_row_missing",
+                    user_id=str(counter.user_id),
+                    service_name=counter.service_name,
+                    quota_type=counter.quota_type,
+                    pending_usage=counter.pending_usage
+                )
+                continue
+
+            quota = consumption.quota
+            if consumption.created:
+                await self.transaction_logger.log_database_transaction(
+                    DatabaseTransactionLog(
+                        id=self.uuid_generator.generate(),
+                        table_name="quotas",
+                        operation=DatabaseOperation.INSERT,
+                        record_id=quota.id,
+                        user_id=quota.user_id,
+                        old_value={},
+                        new_value={
+                            "service_name": quota.service_name,
+                            "quota_type": quota.quota_type,
+                            "limit": counter.limit
+                        },
+                        created_at=current_time,
+                        transaction_id=transaction_id
+                    )
+                )
+
+            await self.transaction_logger.log_database_transaction(
+                DatabaseTransactionLog(
+                    id=self.uuid_generator.generate(),
+                    table_name="quotas",
+                    operation=DatabaseOperation.UPDATE,
+                    record_id=quota.id,
+                    user_id=counter.user_id,
+                    old_value=None,
+                    new_value={
+                        "current_usage": quota.current_usage,
+                        "consumed": counter.pending_usage
+                    },
+                    created_at=current_time,
+                    transaction_id=transaction_id
+                )
+            )
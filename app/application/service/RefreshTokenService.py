@@ -1,11 +1,13 @@
-from datetime import timedelta
 from uuid import UUID
 
 from app.application.dto.AuthenticationDTO import AuthenticationResult
+from app.application.port.input.IIssueEntitlementClaims import IIssueEntitlementClaims
 from app.application.port.input.IRefreshToken import IRefreshToken
 from app.application.port.output.ISessionRepository import ISessionRepository
 from app.application.port.output.ITransactionLogger import ITransactionLogger
 from app.domain.authorization.Session import Session
+from app.domain.authorization.SessionEpoch import SessionEpoch
+from app.domain.authorization.TokenPolicy import TokenPolicy
 from app.domain.log.UserBehaviorLog import UserBehaviorLog
 from app.domain.ValueObjects import UserBehaviorAction
 from app.shared.Cryptography import Salter
@@ -30,6 +32,8 @@ class RefreshTokenService(IRefreshToken):
         token_generator: ITokenGenerator,
         uuid_generator: UuidGeneratorProtocol,
         datetime_converter: DateTimeProtocol,
+        token_policy: TokenPolicy,
+        entitlement_claims: IIssueEntitlementClaims | None = None,
     ):
         self.session_repository = session_repository
         self.transaction_logger = transaction_logger
@@ -37,6 +41,8 @@ class RefreshTokenService(IRefreshToken):
         self.token_generator = token_generator
         self.uuid_generator = uuid_generator
         self.datetime_converter = datetime_converter
+        self.token_policy = token_policy
+        self.entitlement_claims = entitlement_claims
 
     async def execute(self, refresh_token: str) -> AuthenticationResult:
         try:
@@ -84,25 +90,30 @@ class RefreshTokenService(IRefreshToken):
         await self.session_repository.revoke(matching_session.id)
 
         new_session_id = self.uuid_generator.generate()
+        session_epoch = SessionEpoch.from_claims(payload)
 
         access_token_payload = {
             "user_id": str(user_id),
             "session_id": str(new_session_id),
+            SessionEpoch.CLAIM: session_epoch.value,
             "type": "access"
         }
+        if self.entitlement_claims is not None:
+            access_token_payload.update(await self.entitlement_claims.claims_for(user_id))
         access_token = self.token_generator.generate(
             access_token_payload,
-            expires_delta=timedelta(hours=1)
+            expires_delta=self.token_policy.get_access_token_expiry()
         )
 
         new_refresh_token_payload = {
             "user_id": str(user_id),
             "session_id": str(new_session_id),
+            SessionEpoch.CLAIM: session_epoch.value,
             "type": "refresh"
         }
         new_refresh_token = self.token_generator.generate(
             new_refresh_token_payload,
-            expires_delta=timedelta(days=7)
+            expires_delta=self.token_policy.get_refresh_token_expiry()
         )
         new_refresh_token_hash = self.salter.hash_password(new_refresh_token)
 
@@ -114,7 +125,7 @@ class RefreshTokenService(IRefreshToken):
             ip_address=matching_session.ip_address,
             expires_at=self.datetime_converter.add_timedelta(
                 current_time,
-                timedelta(days=7)
+                self.token_policy.get_refresh_token_expiry()
             ),
             revoked_at=None,
             created_at=current_time,
@@ -139,6 +150,6 @@ class RefreshTokenService(IRefreshToken):
             session_id=new_session_id,
             access_token=access_token,
             refresh_token=new_refresh_token,
-            expires_in=3600,
+            expires_in=self.token_policy.get_access_token_expiry_seconds(),
             token_type="Bearer",
         )
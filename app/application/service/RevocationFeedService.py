@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterator
+
+from app.application.dto.RevocationFeedDTO import RevocationFeedPage
+from app.application.port.input.IReadRevocationFeed import IReadRevocationFeed
+from app.application.port.output.IRevocationFeed import IRevocationFeed
+
+
+class RevocationFeedService(IReadRevocationFeed):
+    STREAM_PAGE_SIZE = 500
+
+    def __init__(self, revocation_feed: IRevocationFeed, retention_seconds: int):
+        self.revocation_feed = revocation_feed
+        self.retention_seconds = retention_seconds
+
+    async def execute(self, cursor: str | None, limit: int) -> RevocationFeedPage:
+        events = await self.revocation_feed.read_after(cursor, limit)
+        return RevocationFeedPage(
+            events=events,
+            cursor=events[-1].cursor if events else cursor,
+            retention_seconds=self.retention_seconds
+        )
+
+    async def stream(self, cursor: str | None, heartbeat_seconds: int) -> AsyncIterator[RevocationFeedPage]:
+        while True:
+            page = await self.execute(cursor, self.STREAM_PAGE_SIZE)
+            cursor = page.cursor
+            if page.events:
+                yield page
+            if len(page.events) < self.STREAM_PAGE_SIZE:
+                break
+
+        yield RevocationFeedPage(
+            events=[],
+            cursor=cursor,
+            retention_seconds=self.retention_seconds,
+            snapshot_complete=True
+        )
+
+        while True:
+            events = await self.revocation_feed.wait_after(cursor, self.STREAM_PAGE_SIZE, heartbeat_seconds)
+            if events:
+                cursor = events[-1].cursor
+            yield RevocationFeedPage(events=events, cursor=cursor, retention_seconds=self.retention_seconds)
@@ -1,5 +1,7 @@
+from typing import Any
 from uuid import UUID
 
+from app.application.port.input.IManageSessionEpoch import IManageSessionEpoch
 from app.application.port.input.IRevokeSession import IRevokeSession
 from app.application.port.output.ISessionRepository import ISessionRepository
 from app.application.port.output.ITransactionLogger import ITransactionLogger
@@ -20,11 +22,13 @@ class RevokeSessionService(IRevokeSession):
         transaction_logger: ITransactionLogger,
         uuid_generator: UuidGeneratorProtocol,
         datetime_converter: DateTimeProtocol,
+        session_epoch_service: IManageSessionEpoch | None = None,
     ):
         self.session_repository = session_repository
         self.transaction_logger = transaction_logger
         self.uuid_generator = uuid_generator
         self.datetime_converter = datetime_converter
+        self.session_epoch_service = session_epoch_service
 
     async def execute(self, session_id: UUID, authenticated_user_id: UUID | None = None) -> None:
         session = await self.session_repository.find_by_id(session_id)
@@ -57,6 +61,11 @@ class RevokeSessionService(IRevokeSession):
         )
 
     async def execute_all_by_user(self, user_id: UUID) -> None:
+        metadata: dict[str, Any] = {"action": "logout_all"}
+        if self.session_epoch_service is not None:
+            session_epoch = await self.session_epoch_service.bump(user_id)
+            metadata["session_epoch"] = session_epoch.value
+
         await self.session_repository.revoke_all_by_user(user_id)
 
         await self.transaction_logger.log_user_behavior(
@@ -66,7 +75,7 @@ class RevokeSessionService(IRevokeSession):
                 action=UserBehaviorAction.LOGOUT,
                 ip_address="unknown",
                 user_agent="logout_all_sessions",
-                additional_metadata={"action": "logout_all"},
+                additional_metadata=metadata,
                 created_at=self.datetime_converter.now_utc()
             )
         )
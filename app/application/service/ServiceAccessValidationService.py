@@ -1,10 +1,19 @@
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
 from uuid import UUID
 
 from app.application.dto.ServiceAccessDTO import ServiceAccessResult
 from app.application.port.input.IValidateServiceAccess import IValidateServiceAccess
+from app.application.port.output.IEntitlementCache import IEntitlementCache
+from app.application.port.output.IReadScope import IReadScope
 from app.application.port.output.IServiceAccessRepository import IServiceAccessRepository
 from app.application.port.output.IUserPlanRepository import IUserPlanRepository
+from app.domain.authorization.EntitlementSnapshot import EntitlementSnapshot, ServiceEntitlement
 from app.shared.DateTime import DateTimeProtocol
+from app.shared.SingleFlight import ISingleFlight
+
+
+T = TypeVar("T")
 
 
 class ServiceAccessValidationService(IValidateServiceAccess):
@@ -13,38 +22,45 @@ class ServiceAccessValidationService(IValidateServiceAccess):
         service_access_repository: IServiceAccessRepository,
         user_plan_repository: IUserPlanRepository,
         datetime_converter: DateTimeProtocol,
+        single_flight: ISingleFlight | None = None,
+        entitlement_cache: IEntitlementCache | None = None,
+        read_scope: IReadScope | None = None,
     ):
         self.service_access_repository = service_access_repository
         self.user_plan_repository = user_plan_repository
         self.datetime_converter = datetime_converter
+        self.single_flight = single_flight
+        self.entitlement_cache = entitlement_cache
+        self.read_scope = read_scope
 
     async def execute(self, user_id: UUID, service_name: str) -> ServiceAccessResult:
-        service_access = await self.service_access_repository.find_by_user_and_service(
-            user_id, service_name
+        if self.entitlement_cache is not None:
+            return self._evaluate_snapshot(await self.load_entitlements(user_id), service_name)
+
+        decision = await self._coalesce(
+            f"service_access_decision:{user_id}:{service_name}",
+            lambda service_access_repository, _: service_access_repository.find_decision(user_id, service_name)
         )
 
-        if not service_access:
+        if not decision:
             return ServiceAccessResult(
                 is_allowed=False,
                 error_message=f"No access configured for service: {service_name}"
             )
 
-        if not service_access.is_active():
+        if not decision.is_active():
             return ServiceAccessResult(
                 is_allowed=False,
                 error_message="Service access has been revoked or disabled"
             )
 
-        user_plan = await self.user_plan_repository.find_active_by_user(user_id)
-
-        if not user_plan:
+        if not decision.has_plan:
             return ServiceAccessResult(
                 is_allowed=False,
                 error_message="User has no active plan"
             )
 
-        current_time = self.datetime_converter.now_utc()
-        if not user_plan.is_active(current_time):
+        if not decision.plan_is_active(self.datetime_converter.now_utc()):
             return ServiceAccessResult(
                 is_allowed=False,
                 error_message="User plan has expired or is inactive"
@@ -52,15 +68,129 @@ class ServiceAccessValidationService(IValidateServiceAccess):
 
         return ServiceAccessResult(
             is_allowed=True,
-            allowed_features=service_access.allowed_features
+            allowed_features=list(decision.allowed_features) if decision.allowed_features is not None else None
         )
 
+    async def execute_bulk(self, user_id: UUID, service_names: list[str]) -> dict[str, ServiceAccessResult]:
+        requested_names = list(dict.fromkeys(service_names))
+
+        if self.entitlement_cache is not None:
+            snapshot = await self.load_entitlements(user_id)
+        else:
+            snapshot = await self._coalesce(
+                f"entitlements:{user_id}:{','.join(sorted(requested_names))}",
+                lambda service_access_repository, user_plan_repository: self._read_snapshot(
+                    service_access_repository, user_plan_repository, user_id, requested_names
+                )
+            )
+
+        return {service_name: self._evaluate_snapshot(snapshot, service_name) for service_name in requested_names}
+
     async def check_feature_access(self, user_id: UUID, service_name: str, feature: str) -> bool:
-        service_access = await self.service_access_repository.find_by_user_and_service(
-            user_id, service_name
+        if self.entitlement_cache is not None:
+            snapshot = await self.load_entitlements(user_id)
+            entitlement = snapshot.entitlement_for(service_name)
+            return entitlement is not None and entitlement.has_feature(feature)
+
+        entitlement = await self._coalesce(
+            f"service_entitlement:{user_id}:{service_name}",
+            lambda service_access_repository, _: self._read_entitlement(service_access_repository, user_id, service_name)
+        )
+        return entitlement is not None and entitlement.has_feature(feature)
+
+    def _evaluate_snapshot(self, snapshot: EntitlementSnapshot, service_name: str) -> ServiceAccessResult:
+        entitlement = snapshot.entitlement_for(service_name)
+
+        if not entitlement:
+            return ServiceAccessResult(
+                is_allowed=False,
+                error_message=f"No access configured for service: {service_name}"
+            )
+
+        if not entitlement.is_active:
+            return ServiceAccessResult(
+                is_allowed=False,
+                error_message="Service access has been revoked or disabled"
+            )
+
+        if not snapshot.has_plan:
+            return ServiceAccessResult(
+                is_allowed=False,
+                error_message="User has no active plan"
+            )
+
+        if not snapshot.plan_is_active(self.datetime_converter.now_utc()):
+            return ServiceAccessResult(
+                is_allowed=False,
+                error_message="User plan has expired or is inactive"
+            )
+
+        return ServiceAccessResult(
+            is_allowed=True,
+            allowed_features=(
+                sorted(entitlement.allowed_features)
+                if entitlement.allowed_features is not None
+                else None
+            )
+        )
+
+    async def load_entitlements(self, user_id: UUID) -> EntitlementSnapshot:
+        if self.entitlement_cache is not None:
+            cached_snapshot = await self.entitlement_cache.get(user_id)
+            if cached_snapshot is not None:
+                return cached_snapshot
+
+        return await self._coalesce(
+            f"entitlements:{user_id}",
+            lambda service_access_repository, user_plan_repository: self._build_snapshot(
+                user_id, service_access_repository, user_plan_repository
+            )
         )
 
-        if not service_access or not service_access.is_active():
-            return False
+    async def _build_snapshot(
+        self,
+        user_id: UUID,
+        service_access_repository: IServiceAccessRepository,
+        user_plan_repository: IUserPlanRepository,
+    ) -> EntitlementSnapshot:
+        generation = await self.entitlement_cache.generation(user_id) if self.entitlement_cache is not None else None
+        service_accesses = await service_access_repository.find_all_by_user(user_id, include_revoked=True)
+        user_plan = await user_plan_repository.find_active_by_user(user_id)
+        snapshot = EntitlementSnapshot.build(user_id, service_accesses, user_plan)
+        if self.entitlement_cache is not None and generation is not None:
+            await self.entitlement_cache.fill(snapshot, generation)
+        return snapshot
+
+    async def _read_snapshot(
+        self,
+        service_access_repository: IServiceAccessRepository,
+        user_plan_repository: IUserPlanRepository,
+        user_id: UUID,
+        service_names: list[str],
+    ) -> EntitlementSnapshot:
+        service_accesses = await service_access_repository.find_by_user_and_services(user_id, service_names)
+        user_plan = await user_plan_repository.find_active_by_user(user_id)
+        return EntitlementSnapshot.build(user_id, service_accesses, user_plan)
+
+    async def _read_entitlement(
+        self,
+        service_access_repository: IServiceAccessRepository,
+        user_id: UUID,
+        service_name: str,
+    ) -> ServiceEntitlement | None:
+        service_access = await service_access_repository.find_by_user_and_service(user_id, service_name)
+        return ServiceEntitlement.from_service_access(service_access) if service_access else None
+
+    async def _coalesce(
+        self,
+        key: str,
+        read: Callable[[IServiceAccessRepository, IUserPlanRepository], Awaitable[T]],
+    ) -> T:
+        if self.single_flight is None or self.read_scope is None:
+            return await read(self.service_access_repository, self.user_plan_repository)
+
+        async def load() -> T:
+            async with self.read_scope.open() as repositories:
+                return await read(repositories.service_access_repository, repositories.user_plan_repository)
 
-        return service_access.has_feature(feature)
+        return await self.single_flight.do(f"{self.read_scope.name}:{key}", load)
@@ -0,0 +1,43 @@
+from uuid import UUID
+
+from app.application.port.input.IManageSessionEpoch import IManageSessionEpoch
+from app.application.port.output.IRevocationFeed import IRevocationFeed
+from app.application.port.output.ISessionEpochStore import ISessionEpochStore
+from app.application.port.output.IUserRepository import IUserRepository
+from app.domain.authorization.RevocationEvent import RevocationEvent
+from app.domain.authorization.SessionEpoch import SessionEpoch
+
+
+class SessionEpochService(IManageSessionEpoch):
+    def __init__(
+        self,
+        session_epoch_store: ISessionEpochStore,
+        user_repository: IUserRepository,
+        revocation_feed: IRevocationFeed | None = None,
+    ):
+        self.session_epoch_store = session_epoch_store
+        self.user_repository = user_repository
+        self.revocation_feed = revocation_feed
+
+    async def current(self, user_id: UUID) -> SessionEpoch:
+        epoch = await self.session_epoch_store.get(user_id)
+        if epoch is not None:
+            return SessionEpoch(value=epoch)
+
+        epoch = await self.user_repository.find_session_epoch(user_id) or 0
+        await self.session_epoch_store.seed(user_id, epoch)
+        return SessionEpoch(value=epoch)
+
+    async def bump(self, user_id: UUID) -> SessionEpoch:
+        await self.current(user_id)
+
+        epoch = await self.session_epoch_store.increment(user_id)
+        if epoch is None:
+            epoch = await self.user_repository.increment_session_epoch(user_id)
+        else:
+            await self.user_repository.mirror_session_epoch(user_id, epoch)
+
+        if self.revocation_feed is not None:
+            await self.revocation_feed.publish(RevocationEvent.session_epoch_bumped(user_id, epoch))
+
+        return SessionEpoch(value=epoch)
@@ -0,0 +1,78 @@
+from uuid import UUID
+
+from app.application.dto.IntrospectionDTO import IntrospectionResult
+from app.application.dto.QuotaCheckDTO import QuotaCheckResult
+from app.application.port.input.ICheckQuota import ICheckQuota
+from app.application.port.input.IIntrospectToken import IIntrospectToken
+from app.application.port.input.IValidateServiceAccess import IValidateServiceAccess
+from app.application.port.input.IValidateToken import IValidateToken
+from app.domain.exceptions import (
+    AccessDeniedException,
+    InsufficientQuotaException,
+)
+
+
+class TokenIntrospectionService(IIntrospectToken):
+    def __init__(
+        self,
+        token_validator: IValidateToken,
+        service_access_validator: IValidateServiceAccess,
+        quota_manager: ICheckQuota,
+    ):
+        self.token_validator = token_validator
+        self.service_access_validator = service_access_validator
+        self.quota_manager = quota_manager
+
+    async def execute(
+        self,
+        token: str,
+        service_name: str,
+        quota_type: str,
+        amount: int,
+        consume: bool,
+    ) -> IntrospectionResult:
+        token_result = await self.token_validator.execute(token)
+        if not token_result.is_valid or token_result.user_id is None:
+            return IntrospectionResult(
+                is_valid=False,
+                error_message=token_result.error_message
+            )
+
+        access_result = await self.service_access_validator.execute(token_result.user_id, service_name)
+        if not access_result.is_allowed:
+            return IntrospectionResult(
+                is_valid=True,
+                user_id=token_result.user_id,
+                session_id=token_result.session_id,
+                is_allowed=False,
+                error_message=access_result.error_message
+            )
+
+        if consume:
+            quota_result = await self._consume(token_result.user_id, service_name, quota_type, amount)
+        else:
+            quota_result = await self.quota_manager.execute(token_result.user_id, service_name, quota_type, amount)
+
+        return IntrospectionResult(
+            is_valid=True,
+            user_id=token_result.user_id,
+            session_id=token_result.session_id,
+            is_allowed=True,
+            allowed_features=access_result.allowed_features,
+            quota=quota_result,
+            error_message=quota_result.error_message
+        )
+
+    async def _consume(self, user_id: UUID, service_name: str, quota_type: str, amount: int) -> QuotaCheckResult:
+        try:
+            return await self.quota_manager.consume(user_id, service_name, quota_type, amount)
+        except InsufficientQuotaException:
+            return await self.quota_manager.execute(user_id, service_name, quota_type, amount)
+        except AccessDeniedException as e:
+            return QuotaCheckResult(
+                can_proceed=False,
+                current_usage=0,
+                limit=0,
+                remaining=0,
+                error_message=e.message
+            )
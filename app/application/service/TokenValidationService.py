@@ -1,74 +1,193 @@
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
 from uuid import UUID
 
 from app.application.dto.TokenValidationDTO import TokenValidationResult
+from app.application.port.input.IManageSessionEpoch import IManageSessionEpoch
 from app.application.port.input.IValidateToken import IValidateToken
+from app.application.port.output.IReadScope import IReadScope
 from app.application.port.output.ISessionRepository import ISessionRepository
+from app.application.port.output.ISessionStateCache import ISessionStateCache
+from app.application.port.output.ITokenRejectionStore import ITokenRejectionStore
+from app.domain.authorization.SessionEpoch import SessionEpoch
+from app.domain.authorization.SessionState import SessionState
+from app.domain.authorization.TokenRejection import TokenRejection
 from app.shared.DateTime import DateTimeProtocol
+from app.shared.SingleFlight import ISingleFlight
+from app.shared.TokenClaimsCache import ITokenClaimsCache
+from app.shared.TokenRejectionCache import ITokenRejectionCache
 from app.shared.TokenGenerator import ITokenGenerator
 from app.domain.exceptions import (
     TokenExpiredException,
     TokenInvalidException,
+    TokenSignatureInvalidException,
 )
 
 
+T = TypeVar("T")
+
+
+@dataclass
+class _TokenClaims:
+    user_id: UUID
+    session_id: UUID
+    payload: dict[str, Any]
+
+
 class TokenValidationService(IValidateToken):
     def __init__(
         self,
         session_repository: ISessionRepository,
         token_generator: ITokenGenerator,
         datetime_converter: DateTimeProtocol,
+        claims_cache: ITokenClaimsCache | None = None,
+        session_state_cache: ISessionStateCache | None = None,
+        session_epoch_service: IManageSessionEpoch | None = None,
+        rejection_cache: ITokenRejectionCache | None = None,
+        rejection_store: ITokenRejectionStore | None = None,
+        single_flight: ISingleFlight | None = None,
+        read_scope: IReadScope | None = None,
     ):
         self.session_repository = session_repository
         self.token_generator = token_generator
         self.datetime_converter = datetime_converter
+        self.claims_cache = claims_cache
+        self.session_state_cache = session_state_cache
+        self.session_epoch_service = session_epoch_service
+        self.rejection_cache = rejection_cache
+        self.rejection_store = rejection_store
+        self.single_flight = single_flight
+        self.read_scope = read_scope
 
     async def execute(self, token: str) -> TokenValidationResult:
+        claims = await self._parse(token)
+        if isinstance(claims, TokenValidationResult):
+            return claims
+
+        epoch_rejection = await self._check_session_epoch(claims)
+        if epoch_rejection is not None:
+            return epoch_rejection
+
+        session = await self._load_session_state(claims.session_id)
+        return self._evaluate(claims, session)
+
+    async def execute_batch(self, tokens: list[str]) -> list[TokenValidationResult]:
+        results: list[TokenValidationResult | None] = [None] * len(tokens)
+        pending: dict[int, _TokenClaims] = {}
+
+        for index, token in enumerate(tokens):
+            claims = await self._parse(token)
+            if isinstance(claims, TokenValidationResult):
+                results[index] = claims
+            else:
+                pending[index] = claims
+
+        current_epochs: dict[UUID, SessionEpoch] = {}
+        for index, claims in list(pending.items()):
+            epoch_rejection = await self._check_session_epoch(claims, current_epochs)
+            if epoch_rejection is not None:
+                results[index] = epoch_rejection
+                del pending[index]
+
+        sessions = await self._load_session_states({claims.session_id for claims in pending.values()})
+
+        for index, claims in pending.items():
+            results[index] = self._evaluate(claims, sessions.get(claims.session_id))
+
+        return [result for result in results if result is not None]
+
+    async def _parse(self, token: str) -> _TokenClaims | TokenValidationResult:
+        rejection = await self._find_rejection(token)
+        if rejection is None:
+            claims = self._inspect(token)
+            if isinstance(claims, _TokenClaims):
+                return claims
+            rejection = claims
+            await self._remember_rejection(token, rejection)
+
+        return TokenValidationResult(
+            is_valid=False,
+            error_message=rejection.message
+        )
+
+    def _inspect(self, token: str) -> _TokenClaims | TokenRejection:
         try:
-            payload = self.token_generator.decode(token)
+            payload = self._decode(token)
         except TokenExpiredException:
-            return TokenValidationResult(
-                is_valid=False,
-                error_message="Token has expired"
-            )
+            return TokenRejection.expired()
+        except TokenSignatureInvalidException:
+            return TokenRejection.invalid_signature()
         except TokenInvalidException:
-            return TokenValidationResult(
-                is_valid=False,
-                error_message="Token is invalid"
-            )
+            return TokenRejection.malformed("Token is invalid")
 
         user_id_str = payload.get("user_id")
         session_id_str = payload.get("session_id")
 
         if not user_id_str:
-            return TokenValidationResult(
-                is_valid=False,
-                error_message="Token payload missing user_id"
-            )
+            return TokenRejection.malformed("Token payload missing user_id")
 
         if not session_id_str:
-            return TokenValidationResult(
-                is_valid=False,
-                error_message="Token payload missing session_id"
-            )
+            return TokenRejection.malformed("Token payload missing session_id")
 
         try:
             user_id = UUID(user_id_str)
             session_id = UUID(session_id_str)
         except (ValueError, TypeError):
+            return TokenRejection.malformed("Invalid user_id or session_id format in token")
+
+        return _TokenClaims(user_id=user_id, session_id=session_id, payload=payload)
+
+    async def _find_rejection(self, token: str) -> TokenRejection | None:
+        if self.rejection_cache is not None:
+            rejection = self.rejection_cache.get(token)
+            if rejection is not None:
+                return rejection
+
+        if self.rejection_store is None:
+            return None
+
+        rejection = await self.rejection_store.get(token)
+        if rejection is not None and self.rejection_cache is not None:
+            self.rejection_cache.absorb(token, rejection)
+        return rejection
+
+    async def _remember_rejection(self, token: str, rejection: TokenRejection) -> None:
+        if self.rejection_cache is not None:
+            self.rejection_cache.put(token, rejection)
+        if self.rejection_store is not None:
+            await self.rejection_store.set(token, rejection)
+
+    async def _check_session_epoch(
+        self,
+        claims: _TokenClaims,
+        current_epochs: dict[UUID, SessionEpoch] | None = None,
+    ) -> TokenValidationResult | None:
+        if self.session_epoch_service is None:
+            return None
+
+        current_epoch = current_epochs.get(claims.user_id) if current_epochs is not None else None
+        if current_epoch is None:
+            current_epoch = await self.session_epoch_service.current(claims.user_id)
+            if current_epochs is not None:
+                current_epochs[claims.user_id] = current_epoch
+
+        if not current_epoch.admits(SessionEpoch.from_claims(claims.payload)):
             return TokenValidationResult(
                 is_valid=False,
-                error_message="Invalid user_id or session_id format in token"
+                error_message="Session revoked by logout from all devices"
             )
 
-        session = await self.session_repository.find_by_id(session_id)
+        return None
 
+    def _evaluate(self, claims: _TokenClaims, session: SessionState | None) -> TokenValidationResult:
         if not session:
             return TokenValidationResult(
                 is_valid=False,
                 error_message="Session not found"
             )
 
-        if session.user_id != user_id:
+        if not session.belongs_to(claims.user_id):
             return TokenValidationResult(
                 is_valid=False,
                 error_message="Session does not belong to user"
@@ -82,9 +201,74 @@ class TokenValidationService(IValidateToken):
                 error_message="Session expired or revoked"
             )
 
+        expires_at = claims.payload.get("exp")
         return TokenValidationResult(
             is_valid=True,
-            user_id=user_id,
-            session_id=session.id,
-            refresh_token=session.refresh_token_hash
+            user_id=claims.user_id,
+            session_id=session.session_id,
+            expires_at=self.datetime_converter.from_timestamp(expires_at) if isinstance(expires_at, int) else None
         )
+
+    def _decode(self, token: str) -> dict[str, Any]:
+        if self.claims_cache is None:
+            return self.token_generator.decode(token)
+
+        payload = self.claims_cache.get(token)
+        if payload is not None:
+            return payload
+
+        payload = self.token_generator.decode(token)
+        self.claims_cache.put(token, payload)
+        return payload
+
+    async def _load_session_state(self, session_id: UUID) -> SessionState | None:
+        if self.session_state_cache is not None:
+            cached_state = await self.session_state_cache.get(session_id)
+            if cached_state is not None:
+                return cached_state
+
+        state = await self._coalesce(
+            f"session_state:{session_id}",
+            lambda session_repository: self._read_session_state(session_repository, session_id)
+        )
+        if state is None:
+            return None
+
+        if self.session_state_cache is not None:
+            await self.session_state_cache.set_if_absent(state)
+
+        return state
+
+    async def _load_session_states(self, session_ids: set[UUID]) -> dict[UUID, SessionState]:
+        if not session_ids:
+            return {}
+
+        states: dict[UUID, SessionState] = {}
+        if self.session_state_cache is not None:
+            states = await self.session_state_cache.get_many(list(session_ids))
+
+        missing_ids = [session_id for session_id in session_ids if session_id not in states]
+        if not missing_ids:
+            return states
+
+        for session in await self.session_repository.find_by_ids(missing_ids):
+            state = SessionState.from_session(session)
+            states[state.session_id] = state
+            if self.session_state_cache is not None:
+                await self.session_state_cache.set_if_absent(state)
+
+        return states
+
+    async def _read_session_state(self, session_repository: ISessionRepository, session_id: UUID) -> SessionState | None:
+        session = await session_repository.find_by_id(session_id)
+        return SessionState.from_session(session) if session else None
+
+    async def _coalesce(self, key: str, read: Callable[[ISessionRepository], Awaitable[T]]) -> T:
+        if self.single_flight is None or self.read_scope is None:
+            return await read(self.session_repository)
+
+        async def load() -> T:
+            async with self.read_scope.open() as repositories:
+                return await read(repositories.session_repository)
+
+        return await self.single_flight.do(f"{self.read_scope.name}:{key}", load)
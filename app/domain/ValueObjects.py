@@ -48,3 +48,29 @@ class UserBehaviorAction(str, Enum):
     LOGOUT = "logout"
     PASSWORD_RESET_REQUEST = "password_reset_request"
     PASSWORD_RESET_SUCCESS = "password_reset_success"
+
+
+class TokenRejectionReason(str, Enum):
+    EXPIRED = "expired"
+    INVALID_SIGNATURE = "invalid_signature"
+    MALFORMED_CLAIMS = "malformed_claims"
+
+
+class RevocationKind(str, Enum):
+    SESSION = "session"
+    SESSION_EPOCH = "session_epoch"
+
+
+class QuotaCounterOutcome(str, Enum):
+    ACCEPTED = "accepted"
+    EXCEEDED = "exceeded"
+    NOT_LOADED = "not_loaded"
+    UNAVAILABLE = "unavailable"
+
+
+class IdempotencyState(str, Enum):
+    CLAIMED = "claimed"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    MISMATCH = "mismatch"
+    UNAVAILABLE = "unavailable"
@@ -14,6 +14,7 @@ class User:
     created_at: datetime
     updated_at: datetime
     deleted_at: datetime | None = None
+    session_epoch: int = 0
 
     def is_deleted(self) -> bool:
         return self.deleted_at is not None
@@ -1,3 +1,4 @@
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
@@ -28,3 +29,7 @@ class ApiKey:
 
     def has_any_scope(self, scopes: list[str]) -> bool:
         return any(scope in self.scopes for scope in scopes)
+
+    @staticmethod
+    def hash_key(raw_key: str) -> str:
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
@@ -0,0 +1,35 @@
+import base64
+from datetime import datetime
+from typing import Any
+
+from app.domain.authorization.EntitlementSnapshot import EntitlementSnapshot
+from app.domain.authorization.ServiceRegistry import ServiceRegistry
+
+
+class EntitlementClaim:
+    CLAIM = "ent"
+
+    @staticmethod
+    def encode(snapshot: EntitlementSnapshot, registry: ServiceRegistry, current_time: datetime) -> dict[str, Any]:
+        bitmap = bytearray((len(registry.services) + 7) // 8)
+        features: dict[str, list[str]] = {}
+        plan_is_active = snapshot.plan_is_active(current_time)
+
+        if plan_is_active:
+            for service_name, entitlement in snapshot.services.items():
+                index = registry.index_of(service_name)
+                if index is None or not entitlement.is_active:
+                    continue
+                bitmap[index // 8] |= 1 << (index % 8)
+                if entitlement.allowed_features is not None:
+                    features[str(index)] = sorted(entitlement.allowed_features)
+
+        claim: dict[str, Any] = {
+            "v": registry.version,
+            "b": base64.urlsafe_b64encode(bytes(bitmap).rstrip(b"\x00")).rstrip(b"=").decode("ascii"),
+        }
+        if features:
+            claim["f"] = features
+        if plan_is_active and snapshot.plan_expires_at is not None:
+            claim["x"] = int(snapshot.plan_expires_at.timestamp())
+        return claim
@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.authentication.UserPlan import UserPlan
+from app.domain.authorization.ServiceAccess import ServiceAccess
+
+
+@dataclass(frozen=True)
+class ServiceEntitlement:
+    service_name: str
+    is_active: bool
+    allowed_features: frozenset[str] | None
+
+    @staticmethod
+    def from_service_access(service_access: ServiceAccess) -> "ServiceEntitlement":
+        return ServiceEntitlement(
+            service_name=service_access.service_name,
+            is_active=service_access.is_active(),
+            allowed_features=(
+                frozenset(service_access.allowed_features)
+                if service_access.allowed_features is not None
+                else None
+            ),
+        )
+
+    def has_feature(self, feature: str) -> bool:
+        if not self.is_active:
+            return False
+        if self.allowed_features is None:
+            return True
+        return feature in self.allowed_features
+
+
+@dataclass(frozen=True)
+class EntitlementSnapshot:
+    user_id: UUID
+    services: dict[str, ServiceEntitlement] = field(default_factory=dict)
+    has_plan: bool = False
+    plan_expires_at: datetime | None = None
+
+    @staticmethod
+    def build(user_id: UUID, service_accesses: list[ServiceAccess], user_plan: UserPlan | None) -> "EntitlementSnapshot":
+        services: dict[str, ServiceEntitlement] = {}
+        for service_access in service_accesses:
+            services.setdefault(service_access.service_name, ServiceEntitlement.from_service_access(service_access))
+
+        return EntitlementSnapshot(
+            user_id=user_id,
+            services=services,
+            has_plan=user_plan is not None,
+            plan_expires_at=user_plan.expires_at if user_plan else None,
+        )
+
+    def entitlement_for(self, service_name: str) -> ServiceEntitlement | None:
+        return self.services.get(service_name)
+
+    def plan_is_active(self, current_time: datetime) -> bool:
+        if not self.has_plan:
+            return False
+        if self.plan_expires_at is None:
+            return True
+        return current_time < self.plan_expires_at
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.ValueObjects import RevocationKind
+
+
+@dataclass(frozen=True)
+class RevocationEvent:
+    kind: RevocationKind
+    user_id: UUID
+    session_id: UUID | None = None
+    session_epoch: int | None = None
+    cursor: str | None = None
+
+    @staticmethod
+    def session_revoked(user_id: UUID, session_id: UUID) -> "RevocationEvent":
+        return RevocationEvent(kind=RevocationKind.SESSION, user_id=user_id, session_id=session_id)
+
+    @staticmethod
+    def session_epoch_bumped(user_id: UUID, session_epoch: int) -> "RevocationEvent":
+        return RevocationEvent(kind=RevocationKind.SESSION_EPOCH, user_id=user_id, session_epoch=session_epoch)
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ServiceAccessDecision:
+    service_name: str
+    is_allowed: bool
+    is_revoked: bool
+    allowed_features: tuple[str, ...] | None
+    has_plan: bool
+    plan_expires_at: datetime | None = None
+
+    def is_active(self) -> bool:
+        return self.is_allowed and not self.is_revoked
+
+    def plan_is_active(self, current_time: datetime) -> bool:
+        if not self.has_plan:
+            return False
+        if self.plan_expires_at is None:
+            return True
+        return current_time < self.plan_expires_at
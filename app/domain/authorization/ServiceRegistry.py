@@ -0,0 +1,24 @@
+import hashlib
+from dataclasses import dataclass
+
+from app.domain.service.Service import Service
+
+
+@dataclass(frozen=True)
+class ServiceRegistry:
+    services: tuple[str, ...]
+
+    @staticmethod
+    def from_services(services: list[Service]) -> "ServiceRegistry":
+        ordered = sorted(services, key=lambda service: (service.created_at, str(service.id)))
+        return ServiceRegistry(services=tuple(service.name for service in ordered))
+
+    @property
+    def version(self) -> str:
+        return hashlib.sha256("\n".join(self.services).encode("utf-8")).hexdigest()[:12]
+
+    def index_of(self, service_name: str) -> int | None:
+        try:
+            return self.services.index(service_name)
+        except ValueError:
+            return None
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SessionEpoch:
+    value: int
+
+    CLAIM = "session_epoch"
+
+    @staticmethod
+    def from_claims(claims: dict[str, Any]) -> "SessionEpoch":
+        raw = claims.get(SessionEpoch.CLAIM, 0)
+        return SessionEpoch(value=raw if isinstance(raw, int) else 0)
+
+    def admits(self, token_epoch: "SessionEpoch") -> bool:
+        return token_epoch.value >= self.value
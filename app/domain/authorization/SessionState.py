@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.authorization.Session import Session
+
+
+@dataclass(frozen=True)
+class SessionState:
+    session_id: UUID
+    user_id: UUID
+    expires_at: datetime
+    revoked_at: datetime | None
+
+    @staticmethod
+    def from_session(session: Session) -> "SessionState":
+        return SessionState(
+            session_id=session.id,
+            user_id=session.user_id,
+            expires_at=session.expires_at,
+            revoked_at=session.revoked_at,
+        )
+
+    def is_active(self, current_time: datetime) -> bool:
+        return self.revoked_at is None and self.expires_at > current_time
+
+    def belongs_to(self, user_id: UUID) -> bool:
+        return self.user_id == user_id
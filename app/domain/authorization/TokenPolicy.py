@@ -30,4 +30,7 @@ class TokenPolicy:
         return self.refresh_token_expiry
 
     def get_access_token_expiry_seconds(self) -> int:
-        return int(self.access_token_expiry.total_seconds())
\ No newline at end of file
+        return int(self.access_token_expiry.total_seconds())
+
+    def get_refresh_token_expiry_seconds(self) -> int:
+        return int(self.refresh_token_expiry.total_seconds())
\ No newline at end of file
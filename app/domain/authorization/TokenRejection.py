@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from app.domain.ValueObjects import TokenRejectionReason
+
+
+@dataclass(frozen=True)
+class TokenRejection:
+    reason: TokenRejectionReason
+    message: str
+
+    @staticmethod
+    def expired() -> "TokenRejection":
+        return TokenRejection(TokenRejectionReason.EXPIRED, "Token has expired")
+
+    @staticmethod
+    def invalid_signature() -> "TokenRejection":
+        return TokenRejection(TokenRejectionReason.INVALID_SIGNATURE, "Token is invalid")
+
+    @staticmethod
+    def malformed(message: str) -> "TokenRejection":
+        return TokenRejection(TokenRejectionReason.MALFORMED_CLAIMS, message)
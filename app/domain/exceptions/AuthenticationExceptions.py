@@ -35,6 +35,11 @@ class TokenInvalidException(DomainException):
         )
 
 
+class TokenSignatureInvalidException(TokenInvalidException):
+    def __init__(self):
+        super().__init__(reason="Token is invalid")
+
+
 class SessionNotFoundException(DomainException):
     def __init__(self, session_id: str):
         super().__init__(
@@ -0,0 +1,21 @@
+from http import HTTPStatus
+
+from app.domain.exceptions.BaseException import DomainException
+
+
+class IdempotencyKeyInProgressException(DomainException):
+    def __init__(self, idempotency_key: str):
+        super().__init__(
+            message="A request with this Idempotency-Key is still being processed",
+            status_code=HTTPStatus.CONFLICT,
+            details={"idempotency_key": idempotency_key},
+        )
+
+
+class IdempotencyKeyReusedException(DomainException):
+    def __init__(self, idempotency_key: str):
+        super().__init__(
+            message="Idempotency-Key was already used with a different request",
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            details={"idempotency_key": idempotency_key},
+        )
@@ -17,6 +17,7 @@ from app.domain.exceptions.AuthenticationExceptions import (
     SessionNotFoundException,
     TokenExpiredException,
     TokenInvalidException,
+    TokenSignatureInvalidException,
 )
 from app.domain.exceptions.AuthorizationExceptions import (
     AccessDeniedException,
@@ -27,6 +28,10 @@ from app.domain.exceptions.AuthorizationExceptions import (
 from app.domain.exceptions.RateLimitExceptions import (
     TooManyRequestsException,
 )
+from app.domain.exceptions.IdempotencyExceptions import (
+    IdempotencyKeyInProgressException,
+    IdempotencyKeyReusedException,
+)
 
 __all__ = [
     "DomainException",
@@ -45,9 +50,12 @@ __all__ = [
     "SessionNotFoundException",
     "TokenExpiredException",
     "TokenInvalidException",
+    "TokenSignatureInvalidException",
     "AccessDeniedException",
     "AuthorizationException",
     "InsufficientQuotaException",
     "PlanLimitExceededException",
     "TooManyRequestsException",
+    "IdempotencyKeyInProgressException",
+    "IdempotencyKeyReusedException",
 ]
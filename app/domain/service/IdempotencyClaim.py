@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Any
+
+from app.domain.ValueObjects import IdempotencyState
+
+
+@dataclass(frozen=True)
+class IdempotencyClaim:
+    state: IdempotencyState
+    outcome: dict[str, Any] | None = None
+
+    @staticmethod
+    def claimed() -> "IdempotencyClaim":
+        return IdempotencyClaim(state=IdempotencyState.CLAIMED)
+
+    @staticmethod
+    def in_progress() -> "IdempotencyClaim":
+        return IdempotencyClaim(state=IdempotencyState.IN_PROGRESS)
+
+    @staticmethod
+    def mismatch() -> "IdempotencyClaim":
+        return IdempotencyClaim(state=IdempotencyState.MISMATCH)
+
+    @staticmethod
+    def unavailable() -> "IdempotencyClaim":
+        return IdempotencyClaim(state=IdempotencyState.UNAVAILABLE)
+
+    @staticmethod
+    def completed(outcome: dict[str, Any]) -> "IdempotencyClaim":
+        return IdempotencyClaim(state=IdempotencyState.COMPLETED, outcome=outcome)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from uuid import UUID
 
@@ -31,3 +31,13 @@ class Quota:
 
     def needs_reset(self, current_time: datetime) -> bool:
         return current_time >= self.reset_at
+
+    def in_window(self, current_time: datetime, next_reset_at: datetime, window_limit: int | None = None) -> "Quota":
+        if not self.needs_reset(current_time):
+            return self
+        return replace(
+            self,
+            current_usage=0,
+            limit=self.limit if window_limit is None else window_limit,
+            reset_at=next_reset_at
+        )
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class QuotaCharge:
+    service_name: str
+    quota_type: str
+    amount: int
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.service_name, self.quota_type
+
+    @staticmethod
+    def combine(charges: list["QuotaCharge"]) -> list["QuotaCharge"]:
+        amounts: dict[tuple[str, str], int] = {}
+        for charge in charges:
+            amounts[charge.key] = amounts.get(charge.key, 0) + charge.amount
+        return [
+            QuotaCharge(service_name=service_name, quota_type=quota_type, amount=amount)
+            for (service_name, quota_type), amount in amounts.items()
+        ]
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from app.domain.service.Quota import Quota
+
+
+@dataclass(frozen=True)
+class QuotaConsumption:
+    quota: Quota
+    consumed: bool
+    created: bool = False
@@ -0,0 +1,59 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.service.QuotaCharge import QuotaCharge
+from app.domain.ValueObjects import QuotaCounterOutcome
+
+
+@dataclass(frozen=True)
+class QuotaCounter:
+    quota_id: UUID
+    user_id: UUID
+    service_name: str
+    quota_type: str
+    current_usage: int
+    limit: int
+    reset_at: datetime
+    pending_usage: int = 0
+
+    def remaining(self) -> int:
+        return max(0, self.limit - self.current_usage)
+
+
+@dataclass(frozen=True)
+class QuotaCounterResult:
+    outcome: QuotaCounterOutcome
+    counter: QuotaCounter | None = None
+    granted: int = 0
+
+    @staticmethod
+    def not_loaded() -> "QuotaCounterResult":
+        return QuotaCounterResult(outcome=QuotaCounterOutcome.NOT_LOADED)
+
+    @staticmethod
+    def unavailable() -> "QuotaCounterResult":
+        return QuotaCounterResult(outcome=QuotaCounterOutcome.UNAVAILABLE)
+
+    def is_resolved(self) -> bool:
+        return self.counter is not None
+
+    def is_accepted(self) -> bool:
+        return self.outcome == QuotaCounterOutcome.ACCEPTED
+
+
+@dataclass(frozen=True)
+class QuotaCounterBatchResult:
+    outcome: QuotaCounterOutcome
+    counters: list[QuotaCounter] = field(default_factory=list)
+    missing: list[QuotaCharge] = field(default_factory=list)
+
+    @staticmethod
+    def unavailable() -> "QuotaCounterBatchResult":
+        return QuotaCounterBatchResult(outcome=QuotaCounterOutcome.UNAVAILABLE)
+
+    def is_resolved(self) -> bool:
+        return self.outcome in (QuotaCounterOutcome.ACCEPTED, QuotaCounterOutcome.EXCEEDED)
+
+    def is_accepted(self) -> bool:
+        return self.outcome == QuotaCounterOutcome.ACCEPTED
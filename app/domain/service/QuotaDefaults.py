@@ -1,5 +1,8 @@
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
+
+
+WINDOW_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
 
 
 @dataclass
@@ -36,3 +39,8 @@ class QuotaDefaults:
 
     def get_reset_period(self) -> timedelta:
         return self.reset_period
+
+    def next_reset_at(self, current_time: datetime) -> datetime:
+        epoch = WINDOW_EPOCH if current_time.tzinfo is not None else WINDOW_EPOCH.replace(tzinfo=None)
+        elapsed_windows = (current_time - epoch) // self.reset_period
+        return epoch + (elapsed_windows + 1) * self.reset_period
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class QuotaLease:
+    user_id: UUID
+    service_name: str
+    quota_type: str
+    granted: int
+    limit: int
+    central_usage: int
+    reset_at: datetime
+    leased_at: datetime
+    expires_at: datetime
+    used: int = 0
+
+    def available(self) -> int:
+        return self.granted - self.used
+
+    def is_expired(self, current_time: datetime) -> bool:
+        return current_time >= self.expires_at or current_time >= self.reset_at
+
+    def take(self, amount: int, current_time: datetime) -> bool:
+        if self.is_expired(current_time) or amount > self.available():
+            return False
+        self.used += amount
+        return True
+
+    def current_usage(self) -> int:
+        return self.central_usage - self.available()
+
+    def remaining(self) -> int:
+        return max(0, self.limit - self.current_usage())
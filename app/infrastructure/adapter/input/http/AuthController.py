@@ -179,3 +179,15 @@ async def logout(
         return None
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/logout/all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_all(
+    service: RevokeSessionService = Depends(get_revoke_session_service),
+    current_user = Depends(get_current_user)
+):
+    try:
+        await service.execute_all_by_user(current_user.user_id)
+        return None
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from app.infrastructure.dependencies import get_jwt_key_ring
+from app.shared.JwtKeyRing import JwtKeyRing
+
+router = APIRouter(prefix="/.well-known", tags=["JWKS"])
+
+
+@router.get("/jwks.json")
+async def get_jwks(
+    key_ring: JwtKeyRing | None = Depends(get_jwt_key_ring)
+):
+    return JSONResponse(
+        content=key_ring.jwks() if key_ring else {"keys": []},
+        headers={"Cache-Control": "public, max-age=300"}
+    )
@@ -1,22 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+import json
+from datetime import datetime
 
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from app.application.dto.ServiceAccessDTO import ServiceAccessResult
+from app.application.dto.TokenValidationDTO import TokenValidationResult
+from app.application.service.EntitlementClaimService import EntitlementClaimService
 from app.application.service.QuotaManagementService import QuotaManagementService
+from app.application.service.RevocationFeedService import RevocationFeedService
 from app.application.service.ServiceAccessValidationService import ServiceAccessValidationService
+from app.application.service.TokenIntrospectionService import TokenIntrospectionService
 from app.application.service.TokenValidationService import TokenValidationService
+from app.domain.authorization.RevocationEvent import RevocationEvent
+from app.domain.service.QuotaCharge import QuotaCharge
 from app.infrastructure.dependencies import (
+    config,
     get_current_user,
+    get_entitlement_claim_service,
+    get_quota_check_service,
     get_quota_management_service,
+    get_revocation_feed_service,
     get_service_access_validation_service,
-    get_token_validation_service
+    get_token_introspection_service,
+    get_token_validation_service,
+    require_api_key_scope,
+    validation_cache_policy
 )
 from app.domain.exceptions import (
     AccessDeniedException,
+    IdempotencyKeyInProgressException,
+    IdempotencyKeyReusedException,
     InsufficientQuotaException,
 )
 
 router = APIRouter(prefix="/validate", tags=["Validation"])
 
+REVOCATION_CURSOR_PATTERN = r"^\d+-\d+$"
+REVOCATION_FEED_SCOPE = "revocations:read"
+
 
 class ValidateTokenRequest(BaseModel):
     token: str
@@ -29,6 +52,14 @@ class ValidateTokenResponse(BaseModel):
     error_message: str | None = None
 
 
+class ValidateTokenBatchRequest(BaseModel):
+    tokens: list[str] = Field(min_length=1, max_length=config.validation.batch_max_tokens)
+
+
+class ValidateTokenBatchResponse(BaseModel):
+    results: list[ValidateTokenResponse]
+
+
 class ValidateServiceAccessRequest(BaseModel):
     service_name: str
 
@@ -39,6 +70,14 @@ class ValidateServiceAccessResponse(BaseModel):
     error_message: str | None = None
 
 
+class ValidateServiceAccessBulkRequest(BaseModel):
+    service_names: list[str] = Field(min_length=1, max_length=config.validation.bulk_max_services)
+
+
+class ValidateServiceAccessBulkResponse(BaseModel):
+    results: dict[str, ValidateServiceAccessResponse]
+
+
 class CheckQuotaRequest(BaseModel):
     service_name: str
     quota_type: str = "api_calls_per_day"
@@ -51,21 +90,120 @@ class ConsumeQuotaRequest(BaseModel):
     amount: int = 1
 
 
+class ConsumeQuotaBatchRequest(BaseModel):
+    charges: list[ConsumeQuotaRequest] = Field(min_length=1, max_length=config.quota.batch_max_charges)
+
+
 class QuotaResponse(BaseModel):
     can_proceed: bool
     current_usage: int
     limit: int
     remaining: int
-    reset_at: str
+    reset_at: str | None = None
+    error_message: str | None = None
+
+
+class ConsumeQuotaBatchResponse(BaseModel):
+    results: list[QuotaResponse]
+
+
+class IntrospectRequest(BaseModel):
+    token: str
+    service_name: str
+    quota_type: str = "api_calls_per_day"
+    amount: int = Field(default=1, ge=0)
+    consume: bool = True
+
+
+class IntrospectResponse(BaseModel):
+    is_valid: bool
+    user_id: str | None = None
+    session_id: str | None = None
+    is_allowed: bool = False
+    allowed_features: list[str] | None = None
+    quota: QuotaResponse | None = None
     error_message: str | None = None
 
 
+class RevocationEventResponse(BaseModel):
+    kind: str
+    user_id: str
+    session_id: str | None = None
+    session_epoch: int | None = None
+    cursor: str | None = None
+
+
+class RevocationFeedResponse(BaseModel):
+    events: list[RevocationEventResponse]
+    cursor: str | None = None
+    retention_seconds: int
+
+
+class EntitlementRegistryResponse(BaseModel):
+    version: str
+    services: list[str]
+
+
 @router.post("/token", response_model=ValidateTokenResponse)
 async def validate_token(
     request: ValidateTokenRequest,
+    response: Response,
     service: TokenValidationService = Depends(get_token_validation_service)
 ):
     result = await service.execute(request.token)
+    return _without_caching(_token_response(result), response)
+
+
+@router.get("/token", response_model=ValidateTokenResponse)
+async def validate_bearer_token(
+    response: Response,
+    authorization: str | None = Header(default=None, alias="Authorization"),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    service: TokenValidationService = Depends(get_token_validation_service)
+):
+    if not authorization or not authorization.startswith("Bearer "):
+        return _bearer_denied("Bearer")
+
+    result = await service.execute(authorization.removeprefix("Bearer "))
+    return _with_cache_headers(
+        _token_response(result), response, if_none_match, result.expires_at if result.is_valid else None
+    )
+
+
+@router.get("/forward-auth")
+async def forward_auth(
+    authorization: str | None = Header(default=None, alias="Authorization"),
+    service: TokenValidationService = Depends(get_token_validation_service)
+):
+    if not authorization or not authorization.startswith("Bearer "):
+        return _bearer_denied("Bearer")
+
+    result = await service.execute(authorization.removeprefix("Bearer "))
+    if not result.is_valid:
+        return _bearer_denied('Bearer error="invalid_token"')
+
+    return Response(
+        status_code=status.HTTP_200_OK,
+        headers={
+            "X-User-Id": str(result.user_id),
+            "X-Session-Id": str(result.session_id),
+            "Cache-Control": validation_cache_policy.cache_control(
+                validation_cache_policy.max_age(result.expires_at),
+                shared=True
+            ),
+            "Vary": "Authorization",
+        }
+    )
+
+
+def _bearer_denied(challenge: str) -> Response:
+    return Response(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        headers={"WWW-Authenticate": challenge, "Cache-Control": "no-store"}
+    )
+
+
+def _token_response(result: TokenValidationResult) -> ValidateTokenResponse:
     return ValidateTokenResponse(
         is_valid=result.is_valid,
         user_id=str(result.user_id) if result.user_id else None,
@@ -74,24 +212,106 @@ async def validate_token(
     )
 
 
+def _service_access_response(result: ServiceAccessResult) -> ValidateServiceAccessResponse:
+    return ValidateServiceAccessResponse(
+        is_allowed=result.is_allowed,
+        allowed_features=result.allowed_features,
+        error_message=result.error_message
+    )
+
+
+def _without_caching(body: BaseModel, response: Response) -> BaseModel:
+    response.headers["Cache-Control"] = "no-store"
+    return body
+
+
+def _with_cache_headers(
+    body: BaseModel,
+    response: Response,
+    if_none_match: str | None,
+    expires_at: datetime | None
+) -> BaseModel | Response:
+    etag = validation_cache_policy.etag(body.model_dump_json().encode("utf-8"))
+    headers = {
+        "ETag": etag,
+        "Cache-Control": validation_cache_policy.cache_control(validation_cache_policy.max_age(expires_at)),
+        "Vary": "Authorization",
+    }
+
+    if validation_cache_policy.matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return body
+
+
+@router.post("/token/batch", response_model=ValidateTokenBatchResponse)
+async def validate_token_batch(
+    request: ValidateTokenBatchRequest,
+    service: TokenValidationService = Depends(get_token_validation_service)
+):
+    results = await service.execute_batch(request.tokens)
+    return ValidateTokenBatchResponse(results=[_token_response(result) for result in results])
+
+
 @router.post("/service-access", response_model=ValidateServiceAccessResponse)
 async def validate_service_access(
     request: ValidateServiceAccessRequest,
+    response: Response,
     service: ServiceAccessValidationService = Depends(get_service_access_validation_service),
     current_user = Depends(get_current_user)
 ):
     result = await service.execute(current_user.user_id, request.service_name)
-    return ValidateServiceAccessResponse(
-        is_allowed=result.is_allowed,
-        allowed_features=result.allowed_features,
-        error_message=result.error_message
+    return _without_caching(_service_access_response(result), response)
+
+
+@router.get("/service-access", response_model=ValidateServiceAccessResponse)
+async def get_service_access(
+    response: Response,
+    service_name: str = Query(...),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    service: ServiceAccessValidationService = Depends(get_service_access_validation_service),
+    current_user = Depends(get_current_user)
+):
+    result = await service.execute(current_user.user_id, service_name)
+    return _with_cache_headers(_service_access_response(result), response, if_none_match, current_user.expires_at)
+
+
+@router.post("/service-access/bulk", response_model=ValidateServiceAccessBulkResponse)
+async def validate_service_access_bulk(
+    request: ValidateServiceAccessBulkRequest,
+    response: Response,
+    service: ServiceAccessValidationService = Depends(get_service_access_validation_service),
+    current_user = Depends(get_current_user)
+):
+    results = await service.execute_bulk(current_user.user_id, request.service_names)
+    return _without_caching(_service_access_bulk_response(results), response)
+
+
+@router.get("/service-access/bulk", response_model=ValidateServiceAccessBulkResponse)
+async def get_service_access_bulk(
+    response: Response,
+    service_names: list[str] = Query(..., min_length=1, max_length=config.validation.bulk_max_services),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    service: ServiceAccessValidationService = Depends(get_service_access_validation_service),
+    current_user = Depends(get_current_user)
+):
+    results = await service.execute_bulk(current_user.user_id, service_names)
+    return _with_cache_headers(
+        _service_access_bulk_response(results), response, if_none_match, current_user.expires_at
+    )
+
+
+def _service_access_bulk_response(results: dict[str, ServiceAccessResult]) -> ValidateServiceAccessBulkResponse:
+    return ValidateServiceAccessBulkResponse(
+        results={service_name: _service_access_response(result) for service_name, result in results.items()}
     )
 
 
 @router.post("/quota/check", response_model=QuotaResponse)
 async def check_quota(
     request: CheckQuotaRequest,
-    service: QuotaManagementService = Depends(get_quota_management_service),
+    service: QuotaManagementService = Depends(get_quota_check_service),
     current_user = Depends(get_current_user)
 ):
     result = await service.execute(
@@ -113,34 +333,170 @@ async def check_quota(
 @router.post("/quota/consume", response_model=QuotaResponse)
 async def consume_quota(
     request: ConsumeQuotaRequest,
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key", min_length=1, max_length=255),
     service: QuotaManagementService = Depends(get_quota_management_service),
     current_user = Depends(get_current_user)
 ):
     try:
-        await service.consume(
+        result = await service.consume(
             current_user.user_id,
             request.service_name,
             request.quota_type,
-            request.amount
-        )
-
-        check_result = await service.execute(
-            current_user.user_id,
-            request.service_name,
-            request.quota_type,
-            0
+            request.amount,
+            idempotency_key=idempotency_key
         )
 
         return QuotaResponse(
-            can_proceed=True,
-            current_usage=check_result.current_usage,
-            limit=check_result.limit,
-            remaining=check_result.remaining,
-            reset_at=check_result.reset_at,
+            can_proceed=result.can_proceed,
+            current_usage=result.current_usage,
+            limit=result.limit,
+            remaining=result.remaining,
+            reset_at=result.reset_at,
             error_message=None
         )
+    except (
+        InsufficientQuotaException,
+        AccessDeniedException,
+        IdempotencyKeyInProgressException,
+        IdempotencyKeyReusedException,
+    ) as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.message
+        )
+
+
+@router.post("/quota/consume/batch", response_model=ConsumeQuotaBatchResponse)
+async def consume_quota_batch(
+    request: ConsumeQuotaBatchRequest,
+    service: QuotaManagementService = Depends(get_quota_management_service),
+    current_user = Depends(get_current_user)
+):
+    try:
+        results = await service.consume_many(
+            current_user.user_id,
+            [
+                QuotaCharge(service_name=charge.service_name, quota_type=charge.quota_type, amount=charge.amount)
+                for charge in request.charges
+            ]
+        )
     except (InsufficientQuotaException, AccessDeniedException) as e:
         raise HTTPException(
             status_code=e.status_code,
             detail=e.message
         )
+
+    return ConsumeQuotaBatchResponse(
+        results=[
+            QuotaResponse(
+                can_proceed=result.can_proceed,
+                current_usage=result.current_usage,
+                limit=result.limit,
+                remaining=result.remaining,
+                reset_at=result.reset_at,
+                error_message=None
+            )
+            for result in results
+        ]
+    )
+
+
+@router.post("/introspect", response_model=IntrospectResponse)
+async def introspect(
+    request: IntrospectRequest,
+    service: TokenIntrospectionService = Depends(get_token_introspection_service)
+):
+    result = await service.execute(
+        request.token,
+        request.service_name,
+        request.quota_type,
+        request.amount,
+        request.consume
+    )
+    return IntrospectResponse(
+        is_valid=result.is_valid,
+        user_id=str(result.user_id) if result.user_id else None,
+        session_id=str(result.session_id) if result.session_id else None,
+        is_allowed=result.is_allowed,
+        allowed_features=result.allowed_features,
+        quota=QuotaResponse(
+            can_proceed=result.quota.can_proceed,
+            current_usage=result.quota.current_usage,
+            limit=result.quota.limit,
+            remaining=result.quota.remaining,
+            reset_at=result.quota.reset_at,
+            error_message=result.quota.error_message
+        ) if result.quota else None,
+        error_message=result.error_message
+    )
+
+
+@router.get(
+    "/revocations",
+    response_model=RevocationFeedResponse,
+    dependencies=[Depends(require_api_key_scope(REVOCATION_FEED_SCOPE))]
+)
+async def read_revocations(
+    cursor: str | None = Query(default=None, pattern=REVOCATION_CURSOR_PATTERN),
+    limit: int = Query(default=500, ge=1, le=1000),
+    service: RevocationFeedService = Depends(get_revocation_feed_service)
+):
+    page = await service.execute(cursor, limit)
+    return RevocationFeedResponse(
+        events=[_to_revocation_event_response(event) for event in page.events],
+        cursor=page.cursor,
+        retention_seconds=page.retention_seconds
+    )
+
+
+@router.get("/revocations/stream", dependencies=[Depends(require_api_key_scope(REVOCATION_FEED_SCOPE))])
+async def stream_revocations(
+    request: Request,
+    cursor: str | None = Query(default=None, pattern=REVOCATION_CURSOR_PATTERN),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID", pattern=REVOCATION_CURSOR_PATTERN),
+    service: RevocationFeedService = Depends(get_revocation_feed_service)
+):
+    async def frames():
+        yield "retry: 3000\n\n"
+        async for page in service.stream(last_event_id or cursor, config.validation.revocation_stream_heartbeat_seconds):
+            if await request.is_disconnected():
+                break
+
+            if page.snapshot_complete:
+                data = json.dumps({"cursor": page.cursor, "retention_seconds": page.retention_seconds})
+                yield f"event: snapshot_complete\ndata: {data}\n\n"
+            elif not page.events:
+                yield ": keepalive\n\n"
+
+            for event in page.events:
+                data = _to_revocation_event_response(event).model_dump_json()
+                yield f"id: {event.cursor}\nevent: {event.kind.value}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/entitlements/registry", response_model=EntitlementRegistryResponse)
+async def read_entitlement_registry(
+    response: Response,
+    service: EntitlementClaimService = Depends(get_entitlement_claim_service)
+):
+    registry = await service.registry()
+    response.headers["Cache-Control"] = validation_cache_policy.cache_control(
+        config.cache.service_registry_ttl_seconds,
+        shared=True
+    )
+    return EntitlementRegistryResponse(version=registry.version, services=list(registry.services))
+
+
+def _to_revocation_event_response(event: RevocationEvent) -> RevocationEventResponse:
+    return RevocationEventResponse(
+        kind=event.kind.value,
+        user_id=str(event.user_id),
+        session_id=str(event.session_id) if event.session_id else None,
+        session_epoch=event.session_epoch,
+        cursor=event.cursor
+    )
@@ -0,0 +1,120 @@
+import json
+import time
+import uuid
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+import structlog
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.application.dto.TokenValidationDTO import TokenValidationResult
+from app.application.port.input.IValidateToken import IValidateToken
+
+
+class TokenValidationFastPath:
+    MAX_BODY_BYTES = 16 * 1024
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path: str,
+        session_factory: Callable[[], AbstractAsyncContextManager[Any]],
+        service_factory: Callable[[Any], IValidateToken],
+    ):
+        self.app = app
+        self.path = path
+        self.session_factory = session_factory
+        self.service_factory = service_factory
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._matches(scope):
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = str(uuid.uuid4())
+        start_time = time.perf_counter()
+        logger = structlog.get_logger().bind(correlation_id=correlation_id, path=self.path, fast_path=True)
+
+        headers = [(b"x-correlation-id", correlation_id.encode("ascii"))]
+        try:
+            status_code, payload = await self._handle(receive)
+        except Exception as exc:
+            logger.exception("request_failed", exception_type=type(exc).__name__)
+            status_code, payload = 500, {"error": "Internal server error"}
+
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        if status_code == 200:
+            headers.append((b"cache-control", b"no-store"))
+
+        await self._send(send, status_code, body, headers)
+
+        logger.info(
+            "request_completed",
+            method="POST",
+            status_code=status_code,
+            duration_ms=int((time.perf_counter() - start_time) * 1000)
+        )
+
+    def _matches(self, scope: Scope) -> bool:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] != self.path:
+            return False
+        return not any(name == b"origin" for name, _ in scope["headers"])
+
+    async def _handle(self, receive: Receive) -> tuple[int, dict[str, Any]]:
+        body = await self._read_body(receive)
+        if body is None:
+            return 413, {"error": "Request body too large"}
+
+        token = self._parse_token(body)
+        if token is None:
+            return 422, {"detail": [{"loc": ["body", "token"], "msg": "Field required", "type": "missing"}]}
+
+        async with self.session_factory() as session:
+            result = await self.service_factory(session).execute(token)
+
+        return 200, self._serialize(result)
+
+    async def _read_body(self, receive: Receive) -> bytes | None:
+        chunks: list[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.MAX_BODY_BYTES:
+                return None
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _parse_token(body: bytes) -> str | None:
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return None
+        token = data.get("token") if isinstance(data, dict) else None
+        return token if isinstance(token, str) else None
+
+    @staticmethod
+    def _serialize(result: TokenValidationResult) -> dict[str, Any]:
+        return {
+            "is_valid": result.is_valid,
+            "user_id": str(result.user_id) if result.user_id else None,
+            "session_id": str(result.session_id) if result.session_id else None,
+            "error_message": result.error_message,
+        }
+
+    @staticmethod
+    async def _send(send: Send, status_code: int, body: bytes, headers: list[tuple[bytes, bytes]]) -> None:
+        if body:
+            headers = [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                *headers,
+            ]
+        start: Message = {"type": "http.response.start", "status": status_code, "headers": headers}
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,49 @@
+import asyncio
+import contextlib
+
+from app.application.port.output.IQuotaCounterStore import IQuotaCounterStore
+from app.shared.DateTime import DateTimeProtocol
+from app.shared.Logger import ILogger
+from app.shared.QuotaLeasePool import IQuotaLeasePool
+
+
+class QuotaLeaseWorker:
+    def __init__(
+        self,
+        lease_pool: IQuotaLeasePool,
+        counter_store: IQuotaCounterStore,
+        datetime_converter: DateTimeProtocol,
+        logger: ILogger,
+        interval_seconds: float,
+    ):
+        self.lease_pool = lease_pool
+        self.counter_store = counter_store
+        self.datetime_converter = datetime_converter
+        self.logger = logger.bind(component="quota_lease")
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        leases = self.lease_pool.release_all(self.datetime_converter.now_utc())
+        await self.counter_store.release(leases)
+
+    async def release_expired(self) -> int:
+        leases = self.lease_pool.release_expired(self.datetime_converter.now_utc())
+        await self.counter_store.release(leases)
+        return len(leases)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            released = await self.release_expired()
+            if released:
+                self.logger.debug("quota_leases_released", leases=released)
@@ -0,0 +1,57 @@
+import asyncio
+import contextlib
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+from app.application.port.input.IResetDueQuotas import IResetDueQuotas
+from app.shared.Logger import ILogger
+
+
+class QuotaResetWorker:
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[Any]],
+        service_factory: Callable[[Any], IResetDueQuotas],
+        logger: ILogger,
+        interval_seconds: float,
+        batch_size: int,
+    ):
+        self.session_factory = session_factory
+        self.service_factory = service_factory
+        self.logger = logger.bind(component="quota_reset")
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def reset_due(self) -> int:
+        reset = 0
+        while True:
+            try:
+                async with self.session_factory() as session:
+                    batch = await self.service_factory(session).execute(self.batch_size)
+            except Exception as e:
+                self.logger.error("quota_reset_failed", error=str(e), reset=reset)
+                return reset
+
+            reset += batch
+            if batch < self.batch_size:
+                return reset
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            reset = await self.reset_due()
+            if reset:
+                self.logger.info("quota_windows_reset", quotas=reset)
@@ -0,0 +1,66 @@
+import asyncio
+import contextlib
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+from app.application.port.input.IWriteBackQuotaUsage import IWriteBackQuotaUsage
+from app.application.port.output.IQuotaCounterStore import IQuotaCounterStore
+from app.shared.Logger import ILogger
+
+
+class QuotaWriteBackWorker:
+    def __init__(
+        self,
+        counter_store: IQuotaCounterStore,
+        session_factory: Callable[[], AbstractAsyncContextManager[Any]],
+        service_factory: Callable[[Any], IWriteBackQuotaUsage],
+        logger: ILogger,
+        interval_seconds: float,
+        batch_size: int,
+    ):
+        self.counter_store = counter_store
+        self.session_factory = session_factory
+        self.service_factory = service_factory
+        self.logger = logger.bind(component="quota_write_back")
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        flushed = 0
+        while True:
+            counters = await self.counter_store.drain(self.batch_size)
+            if not counters:
+                return flushed
+
+            try:
+                async with self.session_factory() as session:
+                    await self.service_factory(session).execute(counters)
+            except Exception as e:
+                await self.counter_store.requeue(counters)
+                self.logger.error("quota_write_back_failed", error=str(e), counters=len(counters))
+                return flushed
+
+            flushed += len(counters)
+            if len(counters) < self.batch_size:
+                return flushed
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            flushed = await self.flush()
+            if flushed:
+                self.logger.debug("quota_write_back_flushed", counters=flushed)
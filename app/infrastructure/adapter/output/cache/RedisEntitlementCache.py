@@ -0,0 +1,165 @@
+import json
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.application.port.output.IEntitlementCache import IEntitlementCache
+from app.domain.authorization.EntitlementSnapshot import EntitlementSnapshot, ServiceEntitlement
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.shared.DateTime import DateTimeProtocol
+from app.shared.Logger import ILogger
+from app.shared.TtlCache import ITtlCache
+
+
+FILL_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+INVALIDATE_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+
+class RedisEntitlementCache(IEntitlementCache):
+    KEY_PREFIX = "entitlements"
+    GENERATION_KEY_PREFIX = "entitlements:generation"
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        datetime_converter: DateTimeProtocol,
+        logger: ILogger,
+        ttl_seconds: int,
+        local_cache: ITtlCache[EntitlementSnapshot] | None = None,
+        local_ttl_seconds: int = 5,
+    ):
+        self._redis = redis_client
+        self._datetime = datetime_converter
+        self._logger = logger.bind(component="entitlement_cache")
+        self._ttl_seconds = ttl_seconds
+        self._local_cache = local_cache
+        self._local_ttl_seconds = local_ttl_seconds
+        self._fill = redis_client.register_script(FILL_SCRIPT)
+        self._invalidate = redis_client.register_script(INVALIDATE_SCRIPT)
+
+    def _key(self, user_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}"
+
+    def _generation_key(self, user_id: UUID) -> str:
+        return f"{self.GENERATION_KEY_PREFIX}:{user_id}"
+
+    async def get(self, user_id: UUID) -> EntitlementSnapshot | None:
+        if self._local_cache is not None:
+            snapshot = self._local_cache.get(str(user_id))
+            if snapshot is not None:
+                return snapshot
+
+        try:
+            raw = await self._redis.get(self._key(user_id))
+        except RedisError as e:
+            self._logger.warning("entitlement_cache_read_failed", error=str(e))
+            return None
+
+        if raw is None:
+            return None
+
+        snapshot = self._decode(user_id, raw)
+        if snapshot is not None:
+            self._remember_locally(snapshot, self._ttl_for(snapshot))
+        return snapshot
+
+    async def generation(self, user_id: UUID) -> int | None:
+        try:
+            raw = await self._redis.get(self._generation_key(user_id))
+        except RedisError as e:
+            self._logger.warning("entitlement_generation_read_failed", error=str(e))
+            return None
+
+        try:
+            return int(raw) if raw is not None else 0
+        except ValueError:
+            return None
+
+    async def fill(self, snapshot: EntitlementSnapshot, generation: int) -> None:
+        ttl = self._ttl_for(snapshot)
+        if ttl <= 0:
+            return
+
+        try:
+            filled = await self._fill(
+                keys=[self._key(snapshot.user_id), self._generation_key(snapshot.user_id)],
+                args=[str(generation), self._encode(snapshot), ttl],
+            )
+        except RedisError as e:
+            self._logger.warning("entitlement_cache_write_failed", error=str(e))
+            return
+
+        if int(filled) == 1:
+            self._remember_locally(snapshot, ttl)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        if self._local_cache is not None:
+            self._local_cache.delete(str(user_id))
+        try:
+            await self._invalidate(
+                keys=[self._key(user_id), self._generation_key(user_id)],
+                args=[self._ttl_seconds],
+            )
+        except RedisError as e:
+            self._logger.warning("entitlement_cache_delete_failed", error=str(e))
+
+    def _ttl_for(self, snapshot: EntitlementSnapshot) -> int:
+        if snapshot.plan_expires_at is None:
+            return self._ttl_seconds
+        remaining = self._datetime.to_timestamp(snapshot.plan_expires_at) - self._datetime.to_timestamp(
+            self._datetime.now_utc()
+        )
+        return min(self._ttl_seconds, remaining)
+
+    def _remember_locally(self, snapshot: EntitlementSnapshot, ttl: int) -> None:
+        if self._local_cache is None:
+            return
+        expires_at = self._datetime.now_utc().timestamp() + min(ttl, self._local_ttl_seconds)
+        self._local_cache.set(str(snapshot.user_id), snapshot, expires_at)
+
+    def _encode(self, snapshot: EntitlementSnapshot) -> str:
+        return json.dumps(
+            {
+                "s": {
+                    name: {
+                        "a": entitlement.is_active,
+                        "f": sorted(entitlement.allowed_features) if entitlement.allowed_features is not None else None,
+                    }
+                    for name, entitlement in snapshot.services.items()
+                },
+                "p": snapshot.has_plan,
+                "x": self._datetime.to_timestamp(snapshot.plan_expires_at) if snapshot.plan_expires_at else None,
+            },
+            separators=(",", ":"),
+        )
+
+    def _decode(self, user_id: UUID, raw: str | bytes) -> EntitlementSnapshot | None:
+        try:
+            data = json.loads(raw)
+            return EntitlementSnapshot(
+                user_id=user_id,
+                services={
+                    name: ServiceEntitlement(
+                        service_name=name,
+                        is_active=entry["a"],
+                        allowed_features=frozenset(entry["f"]) if entry["f"] is not None else None,
+                    )
+                    for name, entry in data["s"].items()
+                },
+                has_plan=data["p"],
+                plan_expires_at=self._datetime.from_timestamp(data["x"]) if data["x"] is not None else None,
+            )
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
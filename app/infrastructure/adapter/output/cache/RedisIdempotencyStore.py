@@ -0,0 +1,60 @@
+import json
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from app.application.port.output.IIdempotencyStore import IIdempotencyStore
+from app.domain.service.IdempotencyClaim import IdempotencyClaim
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.shared.Logger import ILogger
+
+
+class RedisIdempotencyStore(IIdempotencyStore):
+    KEY_PREFIX = "idempotency"
+
+    def __init__(self, redis_client: RedisClient, logger: ILogger, ttl_seconds: int, pending_ttl_seconds: int):
+        self._redis = redis_client
+        self._logger = logger.bind(component="idempotency_store")
+        self._ttl_seconds = ttl_seconds
+        self._pending_ttl_seconds = pending_ttl_seconds
+
+    def _key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}:{key}"
+
+    async def claim(self, key: str, fingerprint: str) -> IdempotencyClaim:
+        try:
+            claimed = await self._redis.set_if_absent(
+                self._key(key), {"f": fingerprint}, ex=self._pending_ttl_seconds
+            )
+            if claimed:
+                return IdempotencyClaim.claimed()
+            raw = await self._redis.get(self._key(key))
+        except RedisError as e:
+            self._logger.warning("idempotency_claim_failed", error=str(e))
+            return IdempotencyClaim.unavailable()
+
+        if raw is None:
+            return IdempotencyClaim.in_progress()
+
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            return IdempotencyClaim.in_progress()
+
+        if record.get("f") != fingerprint:
+            return IdempotencyClaim.mismatch()
+        if "o" not in record:
+            return IdempotencyClaim.in_progress()
+        return IdempotencyClaim.completed(record["o"])
+
+    async def complete(self, key: str, fingerprint: str, outcome: dict[str, Any]) -> None:
+        try:
+            await self._redis.set(self._key(key), {"f": fingerprint, "o": outcome}, ex=self._ttl_seconds)
+        except RedisError as e:
+            self._logger.warning("idempotency_complete_failed", error=str(e))
+
+    async def release(self, key: str) -> None:
+        try:
+            await self._redis.delete(self._key(key))
+        except RedisError as e:
+            self._logger.warning("idempotency_release_failed", error=str(e))
@@ -0,0 +1,393 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.application.port.output.IQuotaCounterStore import IQuotaCounterStore
+from app.domain.service.Quota import Quota
+from app.domain.service.QuotaCharge import QuotaCharge
+from app.domain.service.QuotaCounter import QuotaCounter, QuotaCounterBatchResult, QuotaCounterResult
+from app.domain.service.QuotaLease import QuotaLease
+from app.domain.ValueObjects import QuotaCounterOutcome
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.shared.DateTime import DateTimeProtocol
+from app.shared.Logger import ILogger
+
+
+APPLY_SCRIPT = """
+local key = KEYS[1]
+local amount = tonumber(ARGV[1])
+local consume = ARGV[2] == '1'
+local now = tonumber(ARGV[3])
+local period = tonumber(ARGV[4])
+
+local fields = redis.call('HMGET', key, 'u', 'l', 'r', 'i')
+if not fields[1] or now >= tonumber(fields[3]) then
+    if #ARGV < 11 then
+        return {-1}
+    end
+    redis.call('HSET', key,
+        'i', ARGV[5], 'o', ARGV[6], 's', ARGV[7], 't', ARGV[8],
+        'u', ARGV[9], 'l', ARGV[10], 'r', ARGV[11], 'c', 0)
+    fields = {ARGV[9], ARGV[10], ARGV[11], ARGV[5]}
+end
+
+local usage = tonumber(fields[1])
+local limit = tonumber(fields[2])
+local reset_at = tonumber(fields[3])
+
+local accepted = 0
+if usage + amount <= limit then
+    accepted = 1
+    if consume and amount > 0 then
+        usage = redis.call('HINCRBY', key, 'u', amount)
+        redis.call('HINCRBY', key, 'c', amount)
+        redis.call('SADD', KEYS[2], key)
+    end
+end
+
+redis.call('EXPIRE', key, math.max(reset_at - now, 0) + period)
+return {accepted, usage, limit, reset_at, fields[4]}
+"""
+
+RESERVE_SCRIPT = """
+local key = KEYS[1]
+local block = tonumber(ARGV[1])
+local minimum = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local period = tonumber(ARGV[4])
+local tolerance = tonumber(ARGV[5])
+
+local fields = redis.call('HMGET', key, 'u', 'l', 'r', 'i')
+if not fields[1] or now >= tonumber(fields[3]) then
+    if #ARGV < 12 then
+        return {-1}
+    end
+    redis.call('HSET', key,
+        'i', ARGV[6], 'o', ARGV[7], 's', ARGV[8], 't', ARGV[9],
+        'u', ARGV[10], 'l', ARGV[11], 'r', ARGV[12], 'c', 0)
+    fields = {ARGV[10], ARGV[11], ARGV[12], ARGV[6]}
+end
+
+local usage = tonumber(fields[1])
+local limit = tonumber(fields[2])
+local reset_at = tonumber(fields[3])
+
+local granted = math.min(block, limit + tolerance - usage)
+if granted < minimum then
+    granted = 0
+elseif granted > 0 then
+    usage = redis.call('HINCRBY', key, 'u', granted)
+    redis.call('HINCRBY', key, 'c', granted)
+    redis.call('SADD', KEYS[2], key)
+end
+
+redis.call('EXPIRE', key, math.max(reset_at - now, 0) + period)
+return {granted, usage, limit, reset_at, fields[4]}
+"""
+
+APPLY_MANY_SCRIPT = """
+local now = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local count = #KEYS - 1
+local stride = 8
+
+local missing = {}
+for index = 1, count do
+    local base = 2 + (index - 1) * stride
+    local reset_at = redis.call('HGET', KEYS[index], 'r')
+    if not reset_at or now >= tonumber(reset_at) then
+        if ARGV[base + 2] == '' then
+            table.insert(missing, index)
+        else
+            redis.call('HSET', KEYS[index],
+                'i', ARGV[base + 2], 'o', ARGV[base + 3], 's', ARGV[base + 4], 't', ARGV[base + 5],
+                'u', ARGV[base + 6], 'l', ARGV[base + 7], 'r', ARGV[base + 8], 'c', 0)
+        end
+    end
+end
+if #missing > 0 then
+    return {-1, missing}
+end
+
+local states = {}
+local accepted = 1
+for index = 1, count do
+    local amount = tonumber(ARGV[2 + (index - 1) * stride + 1])
+    local fields = redis.call('HMGET', KEYS[index], 'u', 'l', 'r', 'i')
+    local usage = tonumber(fields[1])
+    local limit = tonumber(fields[2])
+    local reset_at = tonumber(fields[3])
+    if usage + amount > limit then
+        accepted = 0
+    end
+    states[index] = {usage, limit, reset_at, fields[4], amount}
+end
+
+local counters = {}
+for index = 1, count do
+    local key = KEYS[index]
+    local usage, limit, reset_at, quota_id, amount = unpack(states[index])
+    if accepted == 1 and amount > 0 then
+        usage = redis.call('HINCRBY', key, 'u', amount)
+        redis.call('HINCRBY', key, 'c', amount)
+        redis.call('SADD', KEYS[#KEYS], key)
+    end
+    redis.call('EXPIRE', key, math.max(reset_at - now, 0) + period)
+    table.insert(counters, {usage, limit, reset_at, quota_id})
+end
+return {accepted, counters}
+"""
+
+RELEASE_SCRIPT = """
+local dirty = KEYS[#KEYS]
+for index = 1, #KEYS - 1 do
+    local key = KEYS[index]
+    local fields = redis.call('HMGET', key, 'u', 'r')
+    if fields[1] and tonumber(fields[2]) == tonumber(ARGV[index * 2]) then
+        local unused = math.min(tonumber(ARGV[index * 2 - 1]), tonumber(fields[1]))
+        if unused > 0 then
+            redis.call('HINCRBY', key, 'u', -unused)
+            redis.call('HINCRBY', key, 'c', -unused)
+            redis.call('SADD', dirty, key)
+        end
+    end
+end
+return #KEYS - 1
+"""
+
+DRAIN_SCRIPT = """
+local keys = redis.call('SPOP', KEYS[1], ARGV[1])
+local counters = {}
+for _, key in ipairs(keys) do
+    local fields = redis.call('HMGET', key, 'i', 'o', 's', 't', 'u', 'l', 'r', 'c')
+    if fields[1] and tonumber(fields[8]) ~= 0 then
+        redis.call('HSET', key, 'c', 0)
+        table.insert(counters, fields)
+    end
+end
+return counters
+"""
+
+REQUEUE_SCRIPT = """
+local dirty = KEYS[#KEYS]
+for index = 1, #KEYS - 1 do
+    local key = KEYS[index]
+    if tonumber(redis.call('HGET', key, 'r')) == tonumber(ARGV[index * 2]) then
+        redis.call('HINCRBY', key, 'c', ARGV[index * 2 - 1])
+        redis.call('SADD', dirty, key)
+    end
+end
+return #KEYS - 1
+"""
+
+
+class RedisQuotaCounterStore(IQuotaCounterStore):
+    KEY_PREFIX = "quota"
+    DIRTY_KEY = "quota:dirty"
+
+    def __init__(self, redis_client: RedisClient, datetime_converter: DateTimeProtocol, logger: ILogger):
+        self._redis = redis_client
+        self._datetime = datetime_converter
+        self._logger = logger.bind(component="quota_counter_store")
+        self._apply = redis_client.register_script(APPLY_SCRIPT)
+        self._reserve = redis_client.register_script(RESERVE_SCRIPT)
+        self._release = redis_client.register_script(RELEASE_SCRIPT)
+        self._apply_many = redis_client.register_script(APPLY_MANY_SCRIPT)
+        self._drain = redis_client.register_script(DRAIN_SCRIPT)
+        self._requeue = redis_client.register_script(REQUEUE_SCRIPT)
+
+    def _key(self, user_id: UUID, service_name: str, quota_type: str) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}:{service_name}:{quota_type}"
+
+    async def apply(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        amount: int,
+        consume: bool,
+        current_time: datetime,
+        reset_period: timedelta,
+        seed: Quota | None = None,
+    ) -> QuotaCounterResult:
+        args: list[str | int] = [
+            amount,
+            "1" if consume else "0",
+            self._datetime.to_timestamp(current_time),
+            int(reset_period.total_seconds()),
+        ]
+        if seed is not None:
+            args.extend(self._seed_args(seed))
+
+        try:
+            raw = await self._apply(keys=[self._key(user_id, service_name, quota_type), self.DIRTY_KEY], args=args)
+        except RedisError as e:
+            self._logger.warning("quota_counter_apply_failed", error=str(e))
+            return QuotaCounterResult.unavailable()
+
+        if int(raw[0]) == -1:
+            return QuotaCounterResult.not_loaded()
+
+        accepted, usage, limit, reset_at, quota_id = raw
+        return QuotaCounterResult(
+            outcome=QuotaCounterOutcome.ACCEPTED if int(accepted) == 1 else QuotaCounterOutcome.EXCEEDED,
+            counter=self._counter(user_id, service_name, quota_type, quota_id, usage, limit, reset_at),
+        )
+
+    async def apply_many(
+        self,
+        user_id: UUID,
+        charges: list[QuotaCharge],
+        current_time: datetime,
+        reset_period: timedelta,
+        seeds: dict[tuple[str, str], Quota] | None = None,
+    ) -> QuotaCounterBatchResult:
+        args: list[str | int] = [self._datetime.to_timestamp(current_time), int(reset_period.total_seconds())]
+        for charge in charges:
+            seed = seeds.get(charge.key) if seeds is not None else None
+            args.append(charge.amount)
+            args.extend(self._seed_args(seed) if seed is not None else [""] * 7)
+        keys = [self._key(user_id, charge.service_name, charge.quota_type) for charge in charges]
+
+        try:
+            raw = await self._apply_many(keys=[*keys, self.DIRTY_KEY], args=args)
+        except RedisError as e:
+            self._logger.warning("quota_counter_apply_many_failed", error=str(e))
+            return QuotaCounterBatchResult.unavailable()
+
+        if int(raw[0]) == -1:
+            return QuotaCounterBatchResult(
+                outcome=QuotaCounterOutcome.NOT_LOADED,
+                missing=[charges[int(index) - 1] for index in raw[1]],
+            )
+
+        accepted, rows = raw
+        return QuotaCounterBatchResult(
+            outcome=QuotaCounterOutcome.ACCEPTED if int(accepted) == 1 else QuotaCounterOutcome.EXCEEDED,
+            counters=[
+                self._counter(user_id, charge.service_name, charge.quota_type, quota_id, usage, limit, reset_at)
+                for charge, (usage, limit, reset_at, quota_id) in zip(charges, rows, strict=True)
+            ],
+        )
+
+    async def reserve(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        block: int,
+        minimum: int,
+        overshoot_tolerance: int,
+        current_time: datetime,
+        reset_period: timedelta,
+        seed: Quota | None = None,
+    ) -> QuotaCounterResult:
+        args: list[str | int] = [
+            block,
+            minimum,
+            self._datetime.to_timestamp(current_time),
+            int(reset_period.total_seconds()),
+            overshoot_tolerance,
+        ]
+        if seed is not None:
+            args.extend(self._seed_args(seed))
+
+        try:
+            raw = await self._reserve(keys=[self._key(user_id, service_name, quota_type), self.DIRTY_KEY], args=args)
+        except RedisError as e:
+            self._logger.warning("quota_counter_reserve_failed", error=str(e))
+            return QuotaCounterResult.unavailable()
+
+        if int(raw[0]) == -1:
+            return QuotaCounterResult.not_loaded()
+
+        granted, usage, limit, reset_at, quota_id = raw
+        return QuotaCounterResult(
+            outcome=QuotaCounterOutcome.ACCEPTED if int(granted) > 0 else QuotaCounterOutcome.EXCEEDED,
+            counter=self._counter(user_id, service_name, quota_type, quota_id, usage, limit, reset_at),
+            granted=int(granted),
+        )
+
+    async def release(self, leases: list[QuotaLease]) -> None:
+        if not leases:
+            return
+
+        args: list[int] = []
+        for lease in leases:
+            args.extend([lease.available(), self._datetime.to_timestamp(lease.reset_at)])
+        keys = [self._key(lease.user_id, lease.service_name, lease.quota_type) for lease in leases]
+        try:
+            await self._release(keys=[*keys, self.DIRTY_KEY], args=args)
+        except RedisError as e:
+            self._logger.warning("quota_counter_release_failed", error=str(e), leases=len(leases))
+
+    async def drain(self, limit: int) -> list[QuotaCounter]:
+        try:
+            rows = await self._drain(keys=[self.DIRTY_KEY], args=[limit])
+        except RedisError as e:
+            self._logger.warning("quota_counter_drain_failed", error=str(e))
+            return []
+
+        counters: list[QuotaCounter] = []
+        for quota_id, user_id, service_name, quota_type, usage, limit_value, reset_at, pending in rows:
+            counters.append(
+                QuotaCounter(
+                    quota_id=UUID(quota_id),
+                    user_id=UUID(user_id),
+                    service_name=service_name,
+                    quota_type=quota_type,
+                    current_usage=int(usage),
+                    limit=int(limit_value),
+                    reset_at=self._datetime.from_timestamp(int(reset_at)),
+                    pending_usage=int(pending),
+                )
+            )
+        return counters
+
+    async def requeue(self, counters: list[QuotaCounter]) -> None:
+        if not counters:
+            return
+
+        args: list[int] = []
+        for counter in counters:
+            args.extend([counter.pending_usage, self._datetime.to_timestamp(counter.reset_at)])
+        keys = [self._counter_key(counter) for counter in counters]
+        try:
+            await self._requeue(keys=[*keys, self.DIRTY_KEY], args=args)
+        except RedisError as e:
+            self._logger.warning("quota_counter_requeue_failed", error=str(e))
+
+    def _counter_key(self, counter: QuotaCounter) -> str:
+        return self._key(counter.user_id, counter.service_name, counter.quota_type)
+
+    def _seed_args(self, seed: Quota) -> list[str | int]:
+        return [
+            str(seed.id),
+            str(seed.user_id),
+            seed.service_name,
+            seed.quota_type,
+            seed.current_usage,
+            seed.limit,
+            self._datetime.to_timestamp(seed.reset_at),
+        ]
+
+    def _counter(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        quota_id: str,
+        usage: int,
+        limit: int,
+        reset_at: int,
+    ) -> QuotaCounter:
+        return QuotaCounter(
+            quota_id=UUID(quota_id),
+            user_id=user_id,
+            service_name=service_name,
+            quota_type=quota_type,
+            current_usage=int(usage),
+            limit=int(limit),
+            reset_at=self._datetime.from_timestamp(int(reset_at)),
+        )
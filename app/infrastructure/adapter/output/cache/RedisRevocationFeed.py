@@ -0,0 +1,97 @@
+import asyncio
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.application.port.output.IRevocationFeed import IRevocationFeed
+from app.domain.authorization.RevocationEvent import RevocationEvent
+from app.domain.ValueObjects import RevocationKind
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.shared.DateTime import DateTimeProtocol
+from app.shared.Logger import ILogger
+
+
+class RedisRevocationFeed(IRevocationFeed):
+    STREAM_KEY = "revocations"
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        retention_seconds: int,
+        datetime_converter: DateTimeProtocol,
+        logger: ILogger,
+        stream_client: RedisClient | None = None,
+    ):
+        self._redis = redis_client
+        self._stream_redis = stream_client or redis_client
+        self._retention_seconds = retention_seconds
+        self._datetime = datetime_converter
+        self._logger = logger.bind(component="revocation_feed")
+
+    async def publish(self, event: RevocationEvent) -> None:
+        try:
+            await self._redis.xadd(self.STREAM_KEY, self._encode(event), minid=self._oldest_retained_id())
+        except RedisError as e:
+            self._logger.warning("revocation_publish_failed", kind=event.kind.value, error=str(e))
+
+    async def read_after(self, cursor: str | None, limit: int) -> list[RevocationEvent]:
+        start = f"({cursor}" if cursor else self._oldest_retained_id()
+        try:
+            entries = await self._redis.xrange(self.STREAM_KEY, start=start, count=limit)
+        except RedisError as e:
+            self._logger.warning("revocation_read_failed", error=str(e))
+            return []
+
+        return self._decode_entries(entries)
+
+    async def wait_after(self, cursor: str | None, limit: int, timeout_seconds: int) -> list[RevocationEvent]:
+        start = cursor or self._oldest_retained_id()
+        try:
+            response = await self._stream_redis.xread({self.STREAM_KEY: start}, count=limit, block_ms=timeout_seconds * 1000)
+        except RedisError as e:
+            self._logger.warning("revocation_wait_failed", error=str(e))
+            await asyncio.sleep(timeout_seconds)
+            return []
+
+        events: list[RevocationEvent] = []
+        for _stream, entries in response or []:
+            events.extend(self._decode_entries(entries))
+        return events
+
+    def _decode_entries(self, entries: list) -> list[RevocationEvent]:
+        events: list[RevocationEvent] = []
+        for entry_id, fields in entries:
+            event = self._decode(self._text(entry_id), fields)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _oldest_retained_id(self) -> str:
+        now_ms = int(self._datetime.now_utc().timestamp() * 1000)
+        return f"{now_ms - self._retention_seconds * 1000}-0"
+
+    @staticmethod
+    def _encode(event: RevocationEvent) -> dict[str, str]:
+        fields = {"kind": event.kind.value, "user_id": str(event.user_id)}
+        if event.session_id is not None:
+            fields["session_id"] = str(event.session_id)
+        if event.session_epoch is not None:
+            fields["session_epoch"] = str(event.session_epoch)
+        return fields
+
+    def _decode(self, entry_id: str, fields: dict) -> RevocationEvent | None:
+        data = {self._text(key): self._text(value) for key, value in fields.items()}
+        try:
+            return RevocationEvent(
+                kind=RevocationKind(data["kind"]),
+                user_id=UUID(data["user_id"]),
+                session_id=UUID(data["session_id"]) if "session_id" in data else None,
+                session_epoch=int(data["session_epoch"]) if "session_epoch" in data else None,
+                cursor=entry_id,
+            )
+        except (ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _text(value: str | bytes) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
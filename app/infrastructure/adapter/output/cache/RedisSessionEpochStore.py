@@ -0,0 +1,50 @@
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.application.port.output.ISessionEpochStore import ISessionEpochStore
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.shared.Logger import ILogger
+
+
+class RedisSessionEpochStore(ISessionEpochStore):
+    KEY_PREFIX = "session_epoch"
+
+    def __init__(self, redis_client: RedisClient, ttl_seconds: int, logger: ILogger):
+        self._redis = redis_client
+        self._ttl_seconds = ttl_seconds
+        self._logger = logger.bind(component="session_epoch_store")
+
+    def _key(self, user_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}"
+
+    async def get(self, user_id: UUID) -> int | None:
+        try:
+            raw = await self._redis.get(self._key(user_id))
+        except RedisError as e:
+            self._logger.warning("session_epoch_read_failed", error=str(e))
+            return None
+
+        if raw is None:
+            return None
+
+        try:
+            return int(raw)
+        except ValueError:
+            return None
+
+    async def seed(self, user_id: UUID, epoch: int) -> None:
+        try:
+            await self._redis.set_if_absent(self._key(user_id), str(epoch), ex=self._ttl_seconds)
+        except RedisError as e:
+            self._logger.warning("session_epoch_seed_failed", error=str(e))
+
+    async def increment(self, user_id: UUID) -> int | None:
+        key = self._key(user_id)
+        try:
+            epoch = await self._redis.incr(key)
+            await self._redis.expire(key, self._ttl_seconds)
+            return epoch
+        except RedisError as e:
+            self._logger.warning("session_epoch_increment_failed", error=str(e))
+            return None
@@ -0,0 +1,106 @@
+import json
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.application.port.output.ISessionStateCache import ISessionStateCache
+from app.domain.authorization.SessionState import SessionState
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.shared.DateTime import DateTimeProtocol
+from app.shared.Logger import ILogger
+
+
+class RedisSessionStateCache(ISessionStateCache):
+    KEY_PREFIX = "session_state"
+
+    def __init__(self, redis_client: RedisClient, datetime_converter: DateTimeProtocol, logger: ILogger):
+        self._redis = redis_client
+        self._datetime = datetime_converter
+        self._logger = logger.bind(component="session_state_cache")
+
+    def _key(self, session_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}:{session_id}"
+
+    async def get(self, session_id: UUID) -> SessionState | None:
+        try:
+            raw = await self._redis.get(self._key(session_id))
+        except RedisError as e:
+            self._logger.warning("session_state_cache_read_failed", error=str(e))
+            return None
+
+        if raw is None:
+            return None
+
+        return self._decode(session_id, raw)
+
+    async def get_many(self, session_ids: list[UUID]) -> dict[UUID, SessionState]:
+        try:
+            raw_values = await self._redis.mget([self._key(session_id) for session_id in session_ids])
+        except RedisError as e:
+            self._logger.warning("session_state_cache_read_failed", error=str(e))
+            return {}
+
+        states: dict[UUID, SessionState] = {}
+        for session_id, raw in zip(session_ids, raw_values, strict=True):
+            state = self._decode(session_id, raw) if raw is not None else None
+            if state is not None:
+                states[session_id] = state
+        return states
+
+    async def set(self, state: SessionState) -> None:
+        if await self._write(state, only_if_absent=False) or state.revoked_at is None:
+            return
+
+        if not await self._delete(state.session_id):
+            self._logger.error("session_state_revocation_not_cached", session_id=str(state.session_id))
+
+    async def set_if_absent(self, state: SessionState) -> None:
+        await self._write(state, only_if_absent=True)
+
+    async def _write(self, state: SessionState, only_if_absent: bool) -> bool:
+        ttl = self._datetime.to_timestamp(state.expires_at) - self._datetime.to_timestamp(self._datetime.now_utc())
+        if ttl <= 0:
+            return only_if_absent or await self._delete(state.session_id)
+
+        try:
+            if only_if_absent:
+                await self._redis.set_if_absent(self._key(state.session_id), self._encode(state), ex=ttl)
+            else:
+                await self._redis.set(self._key(state.session_id), self._encode(state), ex=ttl)
+        except RedisError as e:
+            self._logger.warning("session_state_cache_write_failed", error=str(e))
+            return False
+        return True
+
+    async def delete(self, session_id: UUID) -> None:
+        await self._delete(session_id)
+
+    async def _delete(self, session_id: UUID) -> bool:
+        try:
+            await self._redis.delete(self._key(session_id))
+        except RedisError as e:
+            self._logger.warning("session_state_cache_delete_failed", error=str(e))
+            return False
+        return True
+
+    def _encode(self, state: SessionState) -> str:
+        return json.dumps(
+            {
+                "u": str(state.user_id),
+                "e": self._datetime.to_timestamp(state.expires_at),
+                "r": self._datetime.to_timestamp(state.revoked_at) if state.revoked_at else None,
+            },
+            separators=(",", ":"),
+        )
+
+    def _decode(self, session_id: UUID, raw: str | bytes) -> SessionState | None:
+        try:
+            data = json.loads(raw)
+            return SessionState(
+                session_id=session_id,
+                user_id=UUID(data["u"]),
+                expires_at=self._datetime.from_timestamp(data["e"]),
+                revoked_at=self._datetime.from_timestamp(data["r"]) if data["r"] is not None else None,
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
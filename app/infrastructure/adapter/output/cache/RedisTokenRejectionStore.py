@@ -0,0 +1,45 @@
+import json
+
+from redis.exceptions import RedisError
+
+from app.application.port.output.ITokenRejectionStore import ITokenRejectionStore
+from app.domain.authorization.TokenRejection import TokenRejection
+from app.domain.ValueObjects import TokenRejectionReason
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.shared.Logger import ILogger
+from app.shared.TokenClaimsCache import TokenDigest
+
+
+class RedisTokenRejectionStore(ITokenRejectionStore):
+    KEY_PREFIX = "token_rejection"
+
+    def __init__(self, redis_client: RedisClient, ttl_seconds: int, logger: ILogger):
+        self._redis = redis_client
+        self._ttl_seconds = ttl_seconds
+        self._logger = logger.bind(component="token_rejection_store")
+
+    def _key(self, token: str) -> str:
+        return f"{self.KEY_PREFIX}:{TokenDigest.compute(token)}"
+
+    async def get(self, token: str) -> TokenRejection | None:
+        try:
+            raw = await self._redis.get(self._key(token))
+        except RedisError as e:
+            self._logger.warning("token_rejection_read_failed", error=str(e))
+            return None
+
+        if raw is None:
+            return None
+
+        try:
+            data = json.loads(raw)
+            return TokenRejection(reason=TokenRejectionReason(data["r"]), message=data["m"])
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    async def set(self, token: str, rejection: TokenRejection) -> None:
+        raw = json.dumps({"r": rejection.reason.value, "m": rejection.message}, separators=(",", ":"))
+        try:
+            await self._redis.set(self._key(token), raw, ex=self._ttl_seconds)
+        except RedisError as e:
+            self._logger.warning("token_rejection_write_failed", error=str(e))
@@ -0,0 +1,26 @@
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any
+
+from app.application.port.output.IReadScope import IReadScope, ReadRepositories
+
+
+class DatabaseReadScope(IReadScope):
+    def __init__(
+        self,
+        name: str,
+        session_factory: Callable[[], AbstractAsyncContextManager[Any]],
+        repositories_factory: Callable[[Any], ReadRepositories],
+    ):
+        self._name = name
+        self._session_factory = session_factory
+        self._repositories_factory = repositories_factory
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @asynccontextmanager
+    async def open(self) -> AsyncGenerator[ReadRepositories, None]:
+        async with self._session_factory() as session:
+            yield self._repositories_factory(session)
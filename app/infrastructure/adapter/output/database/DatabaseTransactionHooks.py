@@ -0,0 +1,16 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.application.port.output.ITransactionHooks import ITransactionHooks
+from app.infrastructure.config.database.DatabaseSession import after_commit, after_rollback
+
+
+class DatabaseTransactionHooks(ITransactionHooks):
+    def __init__(self, session: Any):
+        self._session = session
+
+    def after_commit(self, action: Callable[[], Awaitable[None]]) -> None:
+        after_commit(self._session, action)
+
+    def after_rollback(self, action: Callable[[], Awaitable[None]]) -> None:
+        after_rollback(self._session, action)
@@ -15,6 +15,7 @@ class UserMapper:
             created_at=model.created_at,
             updated_at=model.updated_at,
             deleted_at=model.deleted_at,
+            session_epoch=model.session_epoch,
         )
 
     @staticmethod
@@ -29,4 +30,5 @@ class UserMapper:
             created_at=domain.created_at,
             updated_at=domain.updated_at,
             deleted_at=domain.deleted_at,
+            session_epoch=domain.session_epoch,
         )
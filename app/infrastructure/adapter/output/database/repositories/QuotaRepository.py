@@ -1,13 +1,22 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import case, column, exists, func, literal, literal_column, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.port.output.IQuotaRepository import IQuotaRepository
+from app.domain.ValueObjects import UserPlanStatus
 from app.domain.service.Quota import Quota
+from app.domain.service.QuotaCharge import QuotaCharge
+from app.domain.service.QuotaConsumption import QuotaConsumption
+from app.domain.service.QuotaCounter import QuotaCounter
+from app.domain.service.QuotaDefaults import QuotaDefaults
 from app.infrastructure.adapter.output.database.mappers.QuotaMapper import QuotaMapper
+from app.infrastructure.config.database.persistence.PlanModel import PlanModel
 from app.infrastructure.config.database.persistence.QuotaModel import QuotaModel
+from app.infrastructure.config.database.persistence.UserModel import UserModel
+from app.infrastructure.config.database.persistence.UserPlanModel import UserPlanModel
 from app.shared.DateTime import DateTimeProtocol
 
 
@@ -28,43 +37,194 @@ class QuotaRepository(IQuotaRepository):
         model = result.scalars().first()
         return QuotaMapper.to_domain(model) if model else None
 
-    async def update_usage(self, quota_id: UUID, amount: int) -> bool:
-        current_time = self._datetime_converter.now_utc()
+    async def consume(
+        self,
+        user_id: UUID,
+        service_name: str,
+        quota_type: str,
+        amount: int,
+        current_time: datetime,
+        quota_defaults: QuotaDefaults,
+    ) -> QuotaConsumption:
+        next_reset_at = quota_defaults.next_reset_at(current_time)
+        default_limit = self._default_limit(user_id, quota_type, current_time, quota_defaults)
+        is_due = QuotaModel.reset_at <= current_time
 
+        upsert = insert(QuotaModel).values(
+            user_id=user_id,
+            service_name=service_name,
+            quota_type=quota_type,
+            current_usage=case((default_limit >= amount, amount), else_=0),
+            limit=default_limit,
+            reset_at=next_reset_at,
+            updated_at=current_time
+        )
+        excluded = upsert.excluded
         stmt = (
-            update(QuotaModel)
-            .where(QuotaModel.id == quota_id)
-            .where(QuotaModel.current_usage + amount <= QuotaModel.limit)
-            .values(
-                current_usage=QuotaModel.current_usage + amount,
-                updated_at=current_time
+            upsert
+            .on_conflict_do_update(
+                index_elements=[QuotaModel.user_id, QuotaModel.service_name, QuotaModel.quota_type],
+                set_={
+                    "current_usage": case((is_due, amount), else_=QuotaModel.current_usage + amount),
+                    "limit": case((is_due, excluded.limit), else_=QuotaModel.limit),
+                    "reset_at": case((is_due, next_reset_at), else_=QuotaModel.reset_at),
+                    "updated_at": current_time,
+                },
+                where=(
+                    case((is_due, 0), else_=QuotaModel.current_usage) + amount
+                    <= case((is_due, excluded.limit), else_=QuotaModel.limit)
+                )
             )
-            .returning(QuotaModel)
+            .returning(*QuotaModel.__table__.c, literal_column("xmax = 0").label("inserted"))
         )
 
         result = await self._session.execute(stmt)
-        updated_model = result.scalars().first()
+        row = result.first()
+        await self._session.flush()
+
+        if row is None:
+            quota = await self.find_by_user_and_service(user_id, service_name, quota_type)
+            return QuotaConsumption(quota=quota, consumed=False)
+
+        quota = QuotaMapper.to_domain(row)
+        if row.inserted:
+            return QuotaConsumption(quota=quota, consumed=amount <= quota.limit, created=True)
+        return QuotaConsumption(quota=quota, consumed=True)
+
+    async def consume_many(
+        self,
+        user_id: UUID,
+        charges: list[QuotaCharge],
+        current_time: datetime,
+        quota_defaults: QuotaDefaults,
+    ) -> list[QuotaConsumption]:
+        next_reset_at = quota_defaults.next_reset_at(current_time)
+        quotas = QuotaModel.__table__
+
+        insert_stmt = (
+            insert(QuotaModel)
+            .values([
+                {
+                    "user_id": user_id,
+                    "service_name": charge.service_name,
+                    "quota_type": charge.quota_type,
+                    "current_usage": 0,
+                    "limit": self._default_limit(user_id, charge.quota_type, current_time, quota_defaults),
+                    "reset_at": next_reset_at,
+                    "updated_at": current_time,
+                }
+                for charge in charges
+            ])
+            .on_conflict_do_nothing(index_elements=[QuotaModel.user_id, QuotaModel.service_name, QuotaModel.quota_type])
+            .returning(QuotaModel.service_name, QuotaModel.quota_type)
+        )
+        inserted = await self._session.execute(insert_stmt)
+        created = {(row.service_name, row.quota_type) for row in inserted}
+
+        lock_stmt = (
+            select(
+                *quotas.c,
+                self._default_limit(user_id, quotas.c.quota_type, current_time, quota_defaults).label("window_limit")
+            )
+            .where(quotas.c.user_id == user_id)
+            .where(tuple_(quotas.c.service_name, quotas.c.quota_type).in_([charge.key for charge in charges]))
+            .order_by(quotas.c.id)
+            .with_for_update(of=quotas)
+        )
+        locked = await self._session.execute(lock_stmt)
+        current = {
+            (row.service_name, row.quota_type): QuotaMapper.to_domain(row).in_window(
+                current_time, next_reset_at, row.window_limit
+            )
+            for row in locked
+        }
+
+        if any(not current[charge.key].can_consume(charge.amount) for charge in charges):
+            return [
+                QuotaConsumption(quota=current[charge.key], consumed=False, created=charge.key in created)
+                for charge in charges
+            ]
+
+        charged = values(
+            column("id", quotas.c.id.type),
+            column("current_usage", quotas.c.current_usage.type),
+            column("limit", quotas.c.limit.type),
+            column("reset_at", quotas.c.reset_at.type),
+            name="charged",
+        ).data([
+            (
+                current[charge.key].id,
+                current[charge.key].current_usage + charge.amount,
+                current[charge.key].limit,
+                current[charge.key].reset_at,
+            )
+            for charge in charges
+        ])
+        update_stmt = (
+            update(quotas)
+            .where(quotas.c.id == charged.c.id)
+            .values(
+                current_usage=charged.c.current_usage,
+                limit=charged.c.limit,
+                reset_at=charged.c.reset_at,
+                updated_at=current_time
+            )
+            .returning(*quotas.c)
+        )
+        updated = await self._session.execute(update_stmt)
         await self._session.flush()
 
-        return updated_model is not None
+        consumed = {row.id: QuotaMapper.to_domain(row) for row in updated}
+        return [
+            QuotaConsumption(quota=consumed[current[charge.key].id], consumed=True, created=charge.key in created)
+            for charge in charges
+        ]
 
-    async def reset_if_needed(self, quota_id: UUID, current_time: datetime) -> Quota:
+    def _default_limit(self, user_id, quota_type, current_time: datetime, quota_defaults: QuotaDefaults):
+        is_active_plan = (
+            (UserPlanModel.user_id == user_id)
+            & (UserPlanModel.status == UserPlanStatus.ACTIVE)
+            & (UserPlanModel.expires_at.is_(None) | (UserPlanModel.expires_at > current_time))
+        )
+        plan_limit = (
+            select(PlanModel.quota_limits[quota_type].as_integer())
+            .join(UserPlanModel, UserPlanModel.plan_id == PlanModel.id)
+            .where(is_active_plan)
+            .order_by(UserPlanModel.started_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        return func.coalesce(
+            plan_limit,
+            case(
+                (exists().where(is_active_plan), quota_defaults.fallback_limit),
+                else_=quota_defaults.get_anonymous_limit()
+            )
+        )
+
+    async def reset_due(self, current_time: datetime, quota_defaults: QuotaDefaults, limit: int) -> int:
+        due_ids = (
+            select(QuotaModel.id)
+            .where(QuotaModel.reset_at <= current_time)
+            .order_by(QuotaModel.reset_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
         stmt = (
             update(QuotaModel)
-            .where(QuotaModel.id == quota_id)
+            .where(QuotaModel.id.in_(due_ids.scalar_subquery()))
             .values(
                 current_usage=0,
-                reset_at=current_time,
+                limit=self._default_limit(QuotaModel.user_id, QuotaModel.quota_type, current_time, quota_defaults),
+                reset_at=quota_defaults.next_reset_at(current_time),
                 updated_at=current_time
             )
-            .returning(QuotaModel)
         )
 
         result = await self._session.execute(stmt)
-        updated_model = result.scalars().one()
         await self._session.flush()
 
-        return QuotaMapper.to_domain(updated_model)
+        return result.rowcount
 
     async def save(self, quota: Quota) -> Quota:
         quota_model = QuotaMapper.to_persistence(quota)
@@ -72,3 +232,83 @@ class QuotaRepository(IQuotaRepository):
         await self._session.flush()
         await self._session.refresh(quota_model)
         return QuotaMapper.to_domain(quota_model)
+
+    async def write_back(self, counters: list[QuotaCounter], current_time: datetime) -> list[QuotaConsumption]:
+        if not counters:
+            return []
+
+        quotas = QuotaModel.__table__
+        drained = values(
+            column("id", quotas.c.id.type),
+            column("user_id", quotas.c.user_id.type),
+            column("service_name", quotas.c.service_name.type),
+            column("quota_type", quotas.c.quota_type.type),
+            column("pending", quotas.c.current_usage.type),
+            column("limit", quotas.c.limit.type),
+            column("reset_at", quotas.c.reset_at.type),
+            name="drained",
+        ).data([
+            (
+                counter.quota_id,
+                counter.user_id,
+                counter.service_name,
+                counter.quota_type,
+                counter.pending_usage,
+                counter.limit,
+                counter.reset_at,
+            )
+            for counter in counters
+        ])
+        natural_key = (
+            (quotas.c.user_id == drained.c.user_id)
+            & (quotas.c.service_name == drained.c.service_name)
+            & (quotas.c.quota_type == drained.c.quota_type)
+        )
+
+        insert_stmt = (
+            insert(quotas)
+            .from_select(
+                ["id", "user_id", "service_name", "quota_type", "current_usage", "limit", "reset_at", "updated_at"],
+                select(
+                    drained.c.id,
+                    drained.c.user_id,
+                    drained.c.service_name,
+                    drained.c.quota_type,
+                    literal(0),
+                    drained.c.limit,
+                    drained.c.reset_at,
+                    literal(current_time, quotas.c.updated_at.type),
+                ).join(UserModel, UserModel.id == drained.c.user_id)
+            )
+            .on_conflict_do_nothing(index_elements=[quotas.c.user_id, quotas.c.service_name, quotas.c.quota_type])
+            .returning(quotas.c.user_id, quotas.c.service_name, quotas.c.quota_type)
+        )
+        inserted = await self._session.execute(insert_stmt)
+        created = {(row.user_id, row.service_name, row.quota_type) for row in inserted}
+
+        stmt = (
+            update(quotas)
+            .where(natural_key)
+            .values(
+                current_usage=case(
+                    (quotas.c.reset_at == drained.c.reset_at, func.greatest(quotas.c.current_usage + drained.c.pending, 0)),
+                    (quotas.c.reset_at < drained.c.reset_at, func.greatest(drained.c.pending, 0)),
+                    else_=quotas.c.current_usage
+                ),
+                limit=case((quotas.c.reset_at < drained.c.reset_at, drained.c.limit), else_=quotas.c.limit),
+                reset_at=func.greatest(quotas.c.reset_at, drained.c.reset_at),
+                updated_at=current_time
+            )
+            .returning(*quotas.c)
+        )
+        updated = await self._session.execute(stmt)
+        await self._session.flush()
+
+        return [
+            QuotaConsumption(
+                quota=QuotaMapper.to_domain(row),
+                consumed=True,
+                created=(row.user_id, row.service_name, row.quota_type) in created,
+            )
+            for row in updated
+        ]
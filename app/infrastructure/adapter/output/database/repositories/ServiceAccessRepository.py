@@ -1,19 +1,30 @@
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.port.output.IEntitlementCache import IEntitlementCache
 from app.application.port.output.IServiceAccessRepository import IServiceAccessRepository
+from app.domain.ValueObjects import UserPlanStatus
 from app.domain.authorization.ServiceAccess import ServiceAccess
+from app.domain.authorization.ServiceAccessDecision import ServiceAccessDecision
 from app.infrastructure.adapter.output.database.mappers.ServiceAccessMapper import ServiceAccessMapper
+from app.infrastructure.config.database.DatabaseSession import after_commit
 from app.infrastructure.config.database.persistence.ServiceAccessModel import ServiceAccessModel
+from app.infrastructure.config.database.persistence.UserPlanModel import UserPlanModel
 from app.shared.DateTime import DateTimeProtocol
 
 
 class ServiceAccessRepository(IServiceAccessRepository):
-    def __init__(self, session: AsyncSession, datetime_converter: DateTimeProtocol):
+    def __init__(
+        self,
+        session: AsyncSession,
+        datetime_converter: DateTimeProtocol,
+        entitlement_cache: IEntitlementCache | None = None,
+    ):
         self._session = session
         self._datetime_converter = datetime_converter
+        self._entitlement_cache = entitlement_cache
 
     async def find_by_user_and_service(
         self, user_id: UUID, service_name: str
@@ -26,20 +37,69 @@ class ServiceAccessRepository(IServiceAccessRepository):
         model = result.scalars().first()
         return ServiceAccessMapper.to_domain(model) if model else None
 
-    async def find_all_by_user(self, user_id: UUID) -> list[ServiceAccess]:
+    async def find_by_user_and_services(self, user_id: UUID, service_names: list[str]) -> list[ServiceAccess]:
+        if not service_names:
+            return []
         stmt = select(ServiceAccessModel).where(
             ServiceAccessModel.user_id == user_id,
-            ServiceAccessModel.revoked_at.is_(None)
+            ServiceAccessModel.service_name.in_(service_names)
         )
         result = await self._session.execute(stmt)
         models = result.scalars().all()
         return [ServiceAccessMapper.to_domain(model) for model in models]
 
+    async def find_decision(self, user_id: UUID, service_name: str) -> ServiceAccessDecision | None:
+        current_time = self._datetime_converter.now_utc()
+        is_active_plan = (
+            (UserPlanModel.user_id == ServiceAccessModel.user_id)
+            & (UserPlanModel.status == UserPlanStatus.ACTIVE)
+            & (UserPlanModel.expires_at.is_(None) | (UserPlanModel.expires_at > current_time))
+        )
+        plan_expires_at = (
+            select(UserPlanModel.expires_at)
+            .where(is_active_plan)
+            .order_by(UserPlanModel.started_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = select(
+            ServiceAccessModel.is_allowed,
+            ServiceAccessModel.revoked_at,
+            ServiceAccessModel.allowed_features,
+            exists().where(is_active_plan).label("has_plan"),
+            plan_expires_at.label("plan_expires_at"),
+        ).where(
+            ServiceAccessModel.user_id == user_id,
+            ServiceAccessModel.service_name == service_name
+        ).limit(1)
+        result = await self._session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None
+
+        return ServiceAccessDecision(
+            service_name=service_name,
+            is_allowed=row.is_allowed,
+            is_revoked=row.revoked_at is not None,
+            allowed_features=tuple(row.allowed_features) if row.allowed_features is not None else None,
+            has_plan=row.has_plan,
+            plan_expires_at=row.plan_expires_at,
+        )
+
+    async def find_all_by_user(self, user_id: UUID, include_revoked: bool = False) -> list[ServiceAccess]:
+        stmt = select(ServiceAccessModel).where(ServiceAccessModel.user_id == user_id)
+        if not include_revoked:
+            stmt = stmt.where(ServiceAccessModel.revoked_at.is_(None))
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return [ServiceAccessMapper.to_domain(model) for model in models]
+
     async def save(self, service_access: ServiceAccess) -> ServiceAccess:
         access_model = ServiceAccessMapper.to_persistence(service_access)
         self._session.add(access_model)
         await self._session.flush()
         await self._session.refresh(access_model)
+        self._invalidate_entitlements_after_commit([access_model.user_id])
         return ServiceAccessMapper.to_domain(access_model)
 
     async def revoke(self, access_id: UUID) -> None:
@@ -52,6 +112,16 @@ class ServiceAccessRepository(IServiceAccessRepository):
                 is_allowed=False,
                 updated_at=current_time
             )
+            .returning(ServiceAccessModel.user_id)
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
         await self._session.flush()
+        self._invalidate_entitlements_after_commit(list(result.scalars().all()))
+
+    def _invalidate_entitlements_after_commit(self, user_ids: list[UUID]) -> None:
+        if self._entitlement_cache is not None and user_ids:
+            after_commit(self._session, lambda: self._invalidate_entitlements(user_ids))
+
+    async def _invalidate_entitlements(self, user_ids: list[UUID]) -> None:
+        for user_id in user_ids:
+            await self._entitlement_cache.invalidate(user_id)
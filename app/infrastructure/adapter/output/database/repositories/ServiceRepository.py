@@ -31,6 +31,12 @@ class ServiceRepository(IServiceRepository):
         models = result.scalars().all()
         return [ServiceMapper.to_domain(model) for model in models]
 
+    async def find_all(self) -> list[Service]:
+        stmt = select(ServiceModel).order_by(ServiceModel.created_at, ServiceModel.id)
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return [ServiceMapper.to_domain(model) for model in models]
+
     async def find_by_ids(self, service_ids: list[UUID]) -> list[Service]:
         if not service_ids:
             return []
@@ -1,21 +1,36 @@
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import any_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.port.output.IRevocationFeed import IRevocationFeed
 from app.application.port.output.ISessionRepository import ISessionRepository
+from app.application.port.output.ISessionStateCache import ISessionStateCache
+from app.domain.authorization.RevocationEvent import RevocationEvent
 from app.domain.authorization.Session import Session
+from app.domain.authorization.SessionState import SessionState
 from app.infrastructure.adapter.output.database.mappers.SessionMapper import SessionMapper
+from app.infrastructure.config.database.DatabaseSession import after_commit
 from app.infrastructure.config.database.persistence.SessionModel import SessionModel
 from app.shared.DateTime import DateTimeProtocol
 
 
 class SessionRepository(ISessionRepository):
 
-    def __init__(self, session: AsyncSession, datetime_converter: DateTimeProtocol):
+    def __init__(
+        self,
+        session: AsyncSession,
+        datetime_converter: DateTimeProtocol,
+        session_state_cache: ISessionStateCache | None = None,
+        revocation_feed: IRevocationFeed | None = None,
+    ):
         self._session = session
         self._mapper = SessionMapper()
         self._datetime_converter = datetime_converter
+        self._session_state_cache = session_state_cache
+        self._revocation_feed = revocation_feed
 
     async def find_by_id(self, session_id: UUID) -> Session | None:
         stmt = select(SessionModel).where(SessionModel.id == session_id)
@@ -23,6 +38,16 @@ class SessionRepository(ISessionRepository):
         model = result.scalars().first()
         return self._mapper.to_domain(model) if model else None
 
+    async def find_by_ids(self, session_ids: list[UUID]) -> list[Session]:
+        if not session_ids:
+            return []
+        stmt = select(SessionModel).where(
+            SessionModel.id == any_(bindparam("session_ids", session_ids, type_=ARRAY(PG_UUID(as_uuid=True))))
+        )
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return [self._mapper.to_domain(model) for model in models]
+
     async def find_active_by_user(self, user_id: UUID) -> list[Session]:
         current_time = self._datetime_converter.now_utc()
         stmt = select(SessionModel).where(
@@ -39,22 +64,49 @@ class SessionRepository(ISessionRepository):
         self._session.add(session_model)
         await self._session.flush()
         await self._session.refresh(session_model)
-        return self._mapper.to_domain(session_model)
+        saved_session = self._mapper.to_domain(session_model)
+
+        if self._session_state_cache is not None:
+            after_commit(self._session, lambda: self._session_state_cache.set(SessionState.from_session(saved_session)))
+
+        return saved_session
 
     async def revoke(self, session_id: UUID) -> None:
         stmt = (
             update(SessionModel)
             .where(SessionModel.id == session_id)
             .values(revoked_at=self._datetime_converter.now_utc())
+            .returning(SessionModel.id, SessionModel.user_id, SessionModel.expires_at, SessionModel.revoked_at)
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
         await self._session.flush()
+        self._publish_revoked_states_after_commit(result.all())
 
     async def revoke_all_by_user(self, user_id: UUID) -> None:
         stmt = (
             update(SessionModel)
-            .where(SessionModel.user_id == user_id)
+            .where(SessionModel.user_id == user_id, SessionModel.revoked_at.is_(None))
             .values(revoked_at=self._datetime_converter.now_utc())
+            .returning(SessionModel.id, SessionModel.user_id, SessionModel.expires_at, SessionModel.revoked_at)
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
         await self._session.flush()
+        self._publish_revoked_states_after_commit(result.all())
+
+    def _publish_revoked_states_after_commit(self, rows) -> None:
+        if rows:
+            after_commit(self._session, lambda: self._publish_revoked_states(rows))
+
+    async def _publish_revoked_states(self, rows) -> None:
+        for row in rows:
+            if self._session_state_cache is not None:
+                await self._session_state_cache.set(
+                    SessionState(
+                        session_id=row.id,
+                        user_id=row.user_id,
+                        expires_at=row.expires_at,
+                        revoked_at=row.revoked_at,
+                    )
+                )
+            if self._revocation_feed is not None:
+                await self._revocation_feed.publish(RevocationEvent.session_revoked(row.user_id, row.id))
@@ -2,18 +2,26 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from app.application.port.output.IEntitlementCache import IEntitlementCache
 from app.application.port.output.IUserPlanRepository import IUserPlanRepository
 from app.domain.authentication.UserPlan import UserPlan
 from app.infrastructure.adapter.output.database.mappers.UserPlanMapper import UserPlanMapper
+from app.infrastructure.config.database.DatabaseSession import after_commit
 from app.infrastructure.config.database.persistence.UserPlanModel import UserPlanModel
 from app.domain.ValueObjects import UserPlanStatus
 from app.shared.DateTime import DateTimeProtocol
 
 
 class UserPlanRepository(IUserPlanRepository):
-    def __init__(self, session: AsyncSession, datetime_converter: DateTimeProtocol):
+    def __init__(
+        self,
+        session: AsyncSession,
+        datetime_converter: DateTimeProtocol,
+        entitlement_cache: IEntitlementCache | None = None,
+    ):
         self._session = session
         self._datetime_converter = datetime_converter
+        self._entitlement_cache = entitlement_cache
 
     async def find_by_id(self, user_plan_id: UUID) -> UserPlan | None:
         stmt = select(UserPlanModel).where(UserPlanModel.id == user_plan_id)
@@ -38,6 +46,7 @@ class UserPlanRepository(IUserPlanRepository):
         self._session.add(user_plan_model)
         await self._session.flush()
         await self._session.refresh(user_plan_model)
+        self._invalidate_entitlements_after_commit(user_plan_model.user_id)
         return UserPlanMapper.to_domain(user_plan_model)
 
     async def update(self, user_plan: UserPlan) -> UserPlan:
@@ -45,4 +54,9 @@ class UserPlanRepository(IUserPlanRepository):
         merged_model = await self._session.merge(user_plan_model)
         await self._session.flush()
         await self._session.refresh(merged_model)
+        self._invalidate_entitlements_after_commit(merged_model.user_id)
         return UserPlanMapper.to_domain(merged_model)
+
+    def _invalidate_entitlements_after_commit(self, user_id: UUID) -> None:
+        if self._entitlement_cache is not None:
+            after_commit(self._session, lambda: self._entitlement_cache.invalidate(user_id))
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.port.output.IUserRepository import IUserRepository
@@ -57,3 +57,28 @@ class UserRepository(IUserRepository):
         )
         await self._session.execute(stmt)
         await self._session.flush()
+
+    async def find_session_epoch(self, user_id: UUID) -> int | None:
+        stmt = select(UserModel.session_epoch).where(UserModel.id == user_id)
+        result = await self._session.execute(stmt)
+        return result.scalars().first()
+
+    async def increment_session_epoch(self, user_id: UUID) -> int:
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(session_epoch=UserModel.session_epoch + 1)
+            .returning(UserModel.session_epoch)
+        )
+        result = await self._session.execute(stmt)
+        await self._session.flush()
+        return result.scalars().first() or 0
+
+    async def mirror_session_epoch(self, user_id: UUID, epoch: int) -> None:
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(session_epoch=func.greatest(UserModel.session_epoch, epoch))
+        )
+        await self._session.execute(stmt)
+        await self._session.flush()
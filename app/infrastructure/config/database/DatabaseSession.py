@@ -1,8 +1,96 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction, UOWTransaction
 from app.infrastructure.config.EnvConfig import DatabaseConfig
 
+
+AFTER_COMMIT_KEY = "after_commit"
+AFTER_ROLLBACK_KEY = "after_rollback"
+
+
+def after_commit(session: Any, action: Callable[[], Awaitable[None]]) -> None:
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(action)
+
+
+def after_rollback(session: Any, action: Callable[[], Awaitable[None]]) -> None:
+    session.info.setdefault(AFTER_ROLLBACK_KEY, []).append(action)
+
+
+async def run_after_commit(session: Any) -> None:
+    session.info.pop(AFTER_ROLLBACK_KEY, None)
+    for action in session.info.pop(AFTER_COMMIT_KEY, []):
+        await action()
+
+
+async def run_after_rollback(session: Any) -> None:
+    session.info.pop(AFTER_COMMIT_KEY, None)
+    for action in session.info.pop(AFTER_ROLLBACK_KEY, []):
+        await action()
+
+
+class LazyAsyncSession:
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], read_only: bool = False):
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+        self._has_writes = False
+        self._read_only = read_only
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._session is not None
+
+    @property
+    def has_writes(self) -> bool:
+        return self._has_writes
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._materialize(), name)
+
+    async def finalize(self) -> None:
+        if self._session is None:
+            return
+        if self._has_writes:
+            await self._session.commit()
+        else:
+            await self._session.rollback()
+        await run_after_commit(self._session)
+
+    async def discard(self) -> None:
+        if self._session is not None:
+            try:
+                await self._session.rollback()
+            finally:
+                await run_after_rollback(self._session)
+
+    async def release(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+    def _materialize(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+            event.listen(self._session.sync_session, "do_orm_execute", self._on_execute)
+            event.listen(self._session.sync_session, "after_flush", self._on_flush)
+            if self._read_only:
+                event.listen(self._session.sync_session, "after_begin", self._on_begin)
+        return self._session
+
+    def _on_begin(self, session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+    def _on_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        if not orm_execute_state.is_select:
+            self._has_writes = True
+
+    def _on_flush(self, session: Session, flush_context: UOWTransaction) -> None:
+        self._has_writes = True
+
+
 class DatabaseSessionFactory:
     def __init__(self, config: DatabaseConfig):
         self._engine = create_async_engine(
@@ -28,11 +116,27 @@ class DatabaseSessionFactory:
             try:
                 yield session
                 await session.commit()
+                await run_after_commit(session)
             except Exception:
-                await session.rollback()
+                try:
+                    await session.rollback()
+                finally:
+                    await run_after_rollback(session)
                 raise
             finally:
                 await session.close()
 
+    @asynccontextmanager
+    async def get_lazy_session(self, read_only: bool = False) -> AsyncGenerator[LazyAsyncSession, None]:
+        session = LazyAsyncSession(self._session_factory, read_only=read_only)
+        try:
+            yield session
+            await session.finalize()
+        except Exception:
+            await session.discard()
+            raise
+        finally:
+            await session.release()
+
     async def close(self):
         await self._engine.dispose()
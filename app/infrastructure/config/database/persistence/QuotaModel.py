@@ -20,4 +20,5 @@ class QuotaModel(BaseModel):
 
     __table_args__ = (
         Index("idx_quota_user_service", "user_id", "service_name", "quota_type", unique=True),
+        Index("idx_quota_reset_at", "reset_at"),
     )
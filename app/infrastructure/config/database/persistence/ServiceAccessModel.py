@@ -19,5 +19,10 @@ class ServiceAccessModel(BaseModel):
     user = relationship("UserModel", back_populates="service_accesses")
 
     __table_args__ = (
-        Index("idx_service_access_lookup", "user_id", "service_name", postgresql_where=(is_allowed == True)),
+        Index(
+            "idx_service_access_decision",
+            "user_id",
+            "service_name",
+            postgresql_include=["is_allowed", "revoked_at", "allowed_features"],
+        ),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, Index, String, text
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.config.database.persistence.BaseModel import BaseModel
@@ -14,6 +14,7 @@ class UserModel(BaseModel):
     is_verified = Column(Boolean, server_default=text("false"), nullable=False)
     updated_at = Column(DateTime(timezone=True), nullable=False)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
+    session_epoch = Column(Integer, server_default=text("0"), nullable=False)
 
     auth_providers = relationship("AuthProviderModel", back_populates="user", cascade="all, delete-orphan")
     sessions = relationship("SessionModel", back_populates="user", cascade="all, delete-orphan")
@@ -24,4 +24,5 @@ class UserPlanModel(BaseModel):
 
     __table_args__ = (
         Index("idx_userplan_user_active", "user_id", "status"),
+        Index("idx_userplan_active_expiry", "user_id", "expires_at", postgresql_where=text("status = 'ACTIVE'")),
     )
@@ -1,5 +1,6 @@
 import json
 import redis.asyncio as aioredis
+from redis.commands.core import AsyncScript
 from app.infrastructure.config.EnvConfig import RedisConfig
 
 
@@ -15,11 +16,21 @@ class RedisClient:
     async def get(self, key: str) -> str | None:
         return await self._client.get(key)
 
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        if not keys:
+            return []
+        return await self._client.mget(keys)
+
     async def set(self, key: str, value: str | dict, ex: int | None = None) -> None:
         if isinstance(value, dict):
             value = json.dumps(value)
         await self._client.set(key, value, ex=ex)
 
+    async def set_if_absent(self, key: str, value: str | dict, ex: int | None = None) -> bool:
+        if isinstance(value, dict):
+            value = json.dumps(value)
+        return bool(await self._client.set(key, value, ex=ex, nx=True))
+
     async def delete(self, key: str) -> None:
         await self._client.delete(key)
 
@@ -32,9 +43,35 @@ class RedisClient:
             await self._client.expire(key, ex)
         return value
 
+    async def expire(self, key: str, seconds: int) -> None:
+        await self._client.expire(key, seconds)
+
     async def ttl(self, key: str) -> int:
         return await self._client.ttl(key)
 
+    def register_script(self, source: str) -> AsyncScript:
+        return self._client.register_script(source)
+
+    async def xadd(self, key: str, fields: dict[str, str], minid: str | None = None) -> str:
+        return await self._client.xadd(key, fields, minid=minid, approximate=True)
+
+    async def xrange(
+        self,
+        key: str,
+        start: str = "-",
+        end: str = "+",
+        count: int | None = None
+    ) -> list[tuple[str, dict[str, str]]]:
+        return await self._client.xrange(key, min=start, max=end, count=count)
+
+    async def xread(
+        self,
+        streams: dict[str, str],
+        count: int | None = None,
+        block_ms: int | None = None
+    ) -> list[tuple[str, list[tuple[str, dict[str, str]]]]]:
+        return await self._client.xread(streams, count=count, block=block_ms)
+
     async def close(self):
         await self._client.aclose()
         await self._pool.aclose()
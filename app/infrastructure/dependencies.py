@@ -1,19 +1,41 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from dataclasses import replace
+from typing import cast
 
 from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dto.AuthenticationDTO import AuthenticatedUser
+from app.application.port.output.IReadScope import ReadRepositories
+from app.application.service.ApiKeyAuthenticationService import ApiKeyAuthenticationService
 from app.application.service.AuthenticationService import AuthenticationService
+from app.application.service.EntitlementClaimService import EntitlementClaimService
 from app.application.service.LinkAuthProviderService import LinkAuthProviderService
 from app.application.service.QuotaManagementService import QuotaManagementService
+from app.application.service.QuotaResetService import QuotaResetService
+from app.application.service.QuotaWriteBackService import QuotaWriteBackService
 from app.application.service.RefreshTokenService import RefreshTokenService
 from app.application.service.ResendOtpService import ResendOtpService
+from app.application.service.RevocationFeedService import RevocationFeedService
 from app.application.service.RevokeSessionService import RevokeSessionService
+from app.application.service.SessionEpochService import SessionEpochService
 from app.application.service.ServiceAccessValidationService import ServiceAccessValidationService
+from app.application.service.TokenIntrospectionService import TokenIntrospectionService
 from app.application.service.TokenValidationService import TokenValidationService
 from app.application.service.UserRegistrationService import UserRegistrationService
-# from app.infrastructure.adapter.output.database.repositories.ApiKeyRepository import ApiKeyRepository
+from app.infrastructure.adapter.input.worker.QuotaLeaseWorker import QuotaLeaseWorker
+from app.infrastructure.adapter.input.worker.QuotaResetWorker import QuotaResetWorker
+from app.infrastructure.adapter.input.worker.QuotaWriteBackWorker import QuotaWriteBackWorker
+from app.infrastructure.adapter.output.cache.RedisEntitlementCache import RedisEntitlementCache
+from app.infrastructure.adapter.output.cache.RedisIdempotencyStore import RedisIdempotencyStore
+from app.infrastructure.adapter.output.cache.RedisQuotaCounterStore import RedisQuotaCounterStore
+from app.infrastructure.adapter.output.cache.RedisRevocationFeed import RedisRevocationFeed
+from app.infrastructure.adapter.output.cache.RedisSessionEpochStore import RedisSessionEpochStore
+from app.infrastructure.adapter.output.cache.RedisSessionStateCache import RedisSessionStateCache
+from app.infrastructure.adapter.output.cache.RedisTokenRejectionStore import RedisTokenRejectionStore
+from app.infrastructure.adapter.output.database.DatabaseReadScope import DatabaseReadScope
+from app.infrastructure.adapter.output.database.DatabaseTransactionHooks import DatabaseTransactionHooks
+from app.infrastructure.adapter.output.database.repositories.ApiKeyRepository import ApiKeyRepository
 from app.infrastructure.adapter.output.database.repositories.AuthProviderRepository import AuthProviderRepository
 from app.infrastructure.adapter.output.database.repositories.OtpCodeRepository import OtpCodeRepository
 from app.infrastructure.adapter.output.database.repositories.PlanRepository import PlanRepository
@@ -30,11 +52,20 @@ from app.infrastructure.config.database.redis.RedisClient import RedisClient
 from app.infrastructure.config.EnvConfig import EnvConfig
 from app.shared.Cryptography import Salter
 from app.shared.DateTime import DateTimeConverter
+from app.shared.HttpCachePolicy import HttpCachePolicy
+from app.shared.JwtKeyRing import JwtKeyRing
 from app.shared.OtpRateLimiter import OtpRateLimiter
+from app.shared.QuotaLeasePool import QuotaLeasePool
+from app.shared.SingleFlight import SingleFlight
+from app.shared.TokenClaimsCache import TokenClaimsCache
 from app.shared.TokenGenerator import JwtTokenGenerator
+from app.shared.TokenRejectionCache import TokenRejectionCache
+from app.shared.TtlCache import TtlCache
 from app.shared.UuidGenerator import UuidGenerator
 from app.shared.Logger import StructLogger, ILogger, configure_structlog
+from app.domain.authorization.ApiKey import ApiKey
 from app.domain.authorization.TokenPolicy import TokenPolicy
+from app.domain.exceptions import AccessDeniedException, InvalidCredentialsException
 from app.domain.service.QuotaDefaults import QuotaDefaults
 
 config = EnvConfig.load()
@@ -47,37 +78,227 @@ quota_defaults = QuotaDefaults.default()
 configure_structlog(environment=config.environment, debug=config.debug)
 
 db_factory = DatabaseSessionFactory(config.database)
+db_replica_factory = DatabaseSessionFactory(config.database_replica) if config.database_replica is not None else None
 redis_client = RedisClient(config.redis)
+stream_redis_client = RedisClient(replace(config.redis, max_connections=config.redis.stream_max_connections))
 
 datetime_converter = DateTimeConverter()
 uuid_generator = UuidGenerator()
 salter = Salter(config.auth.password_salt)
+jwt_key_ring = JwtKeyRing.from_directory(
+    config.auth.jwt_keys_dir,
+    active_kid=config.auth.jwt_active_kid
+) if config.auth.jwt_keys_dir else None
 token_generator = JwtTokenGenerator(
     secret_key=config.auth.jwt_secret,
     datetime_converter=datetime_converter,
-    algorithm=config.auth.jwt_algorithm
+    algorithm=config.auth.jwt_algorithm,
+    key_ring=jwt_key_ring,
+    accept_legacy_tokens=config.auth.jwt_legacy_tokens_enabled
+)
+token_claims_cache = TokenClaimsCache(
+    TtlCache(
+        max_entries=config.cache.token_claims_max_entries,
+        datetime_converter=datetime_converter
+    )
+) if config.cache.token_claims_enabled else None
+token_rejection_cache = TokenRejectionCache(
+    TtlCache(
+        max_entries=config.cache.token_rejection_max_entries,
+        datetime_converter=datetime_converter
+    ),
+    datetime_converter=datetime_converter,
+    ttl_seconds=config.cache.token_rejection_ttl_seconds
+) if config.cache.token_rejection_enabled else None
+
+single_flight = SingleFlight()
+service_registry_cache = TtlCache(max_entries=1, datetime_converter=datetime_converter)
+validation_cache_policy = HttpCachePolicy(
+    tolerance_seconds=config.validation.cache_tolerance_seconds,
+    datetime_converter=datetime_converter
 )
 
 root_logger = StructLogger(logger_name="k-auth_service")
+session_state_cache = RedisSessionStateCache(redis_client, datetime_converter, root_logger)
+session_epoch_store = RedisSessionEpochStore(
+    redis_client,
+    ttl_seconds=token_policy.get_refresh_token_expiry_seconds(),
+    logger=root_logger
+)
+revocation_feed = RedisRevocationFeed(
+    redis_client,
+    retention_seconds=token_policy.get_access_token_expiry_seconds(),
+    datetime_converter=datetime_converter,
+    logger=root_logger,
+    stream_client=stream_redis_client
+)
+token_rejection_store = RedisTokenRejectionStore(
+    redis_client,
+    ttl_seconds=config.cache.token_rejection_ttl_seconds,
+    logger=root_logger
+) if config.cache.token_rejection_enabled and config.cache.token_rejection_shared else None
+entitlement_cache = RedisEntitlementCache(
+    redis_client,
+    datetime_converter=datetime_converter,
+    logger=root_logger,
+    ttl_seconds=config.cache.entitlement_ttl_seconds,
+    local_cache=TtlCache(
+        max_entries=config.cache.entitlement_local_max_entries,
+        datetime_converter=datetime_converter
+    ) if config.cache.entitlement_local_ttl_seconds > 0 else None,
+    local_ttl_seconds=config.cache.entitlement_local_ttl_seconds
+) if config.cache.entitlement_enabled else None
+quota_counter_store = RedisQuotaCounterStore(
+    redis_client,
+    datetime_converter=datetime_converter,
+    logger=root_logger
+) if config.quota.counter_store_enabled else None
+
+
+def build_read_repositories(db_session: AsyncSession) -> ReadRepositories:
+    return ReadRepositories(
+        session_repository=SessionRepository(db_session, datetime_converter, session_state_cache, revocation_feed),
+        service_access_repository=ServiceAccessRepository(db_session, datetime_converter, entitlement_cache),
+        user_plan_repository=UserPlanRepository(db_session, datetime_converter, entitlement_cache),
+        plan_repository=PlanRepository(db_session)
+    )
+
+
+primary_read_scope = DatabaseReadScope(
+    name="primary",
+    session_factory=lambda: db_factory.get_lazy_session(read_only=True),
+    repositories_factory=build_read_repositories
+)
+replica_read_scope = DatabaseReadScope(
+    name="replica",
+    session_factory=lambda: db_replica_factory.get_lazy_session(read_only=True),
+    repositories_factory=build_read_repositories
+) if db_replica_factory is not None else primary_read_scope
+
+def build_quota_write_back_service(db_session: AsyncSession) -> QuotaWriteBackService:
+    return QuotaWriteBackService(
+        quota_repository=QuotaRepository(db_session, datetime_converter),
+        transaction_logger=TransactionLoggerRepository(db_session),
+        datetime_converter=datetime_converter,
+        uuid_generator=uuid_generator,
+        logger=root_logger
+    )
+
+
+quota_write_back_worker = QuotaWriteBackWorker(
+    counter_store=quota_counter_store,
+    session_factory=db_factory.get_session,
+    service_factory=build_quota_write_back_service,
+    logger=root_logger,
+    interval_seconds=config.quota.write_back_interval_seconds,
+    batch_size=config.quota.write_back_batch_size
+) if quota_counter_store is not None else None
+
+quota_idempotency_store = RedisIdempotencyStore(
+    redis_client,
+    logger=root_logger,
+    ttl_seconds=config.quota.idempotency_ttl_seconds,
+    pending_ttl_seconds=config.quota.idempotency_pending_ttl_seconds
+) if config.quota.idempotency_enabled else None
+
+quota_lease_pool = QuotaLeasePool(
+    lease_ttl_seconds=config.quota.lease_ttl_seconds,
+    min_block=config.quota.lease_min_block,
+    max_block=config.quota.lease_max_block,
+    overshoot_tolerance=config.quota.lease_overshoot_tolerance
+) if quota_counter_store is not None and config.quota.lease_enabled else None
+
+quota_lease_worker = QuotaLeaseWorker(
+    lease_pool=quota_lease_pool,
+    counter_store=quota_counter_store,
+    datetime_converter=datetime_converter,
+    logger=root_logger,
+    interval_seconds=config.quota.lease_ttl_seconds / 2
+) if quota_lease_pool is not None else None
+
+
+def build_quota_reset_service(db_session: AsyncSession) -> QuotaResetService:
+    return QuotaResetService(
+        quota_repository=QuotaRepository(db_session, datetime_converter),
+        datetime_converter=datetime_converter,
+        quota_defaults=quota_defaults
+    )
+
+
+quota_reset_worker = QuotaResetWorker(
+    session_factory=db_factory.get_session,
+    service_factory=build_quota_reset_service,
+    logger=root_logger,
+    interval_seconds=config.quota.reset_interval_seconds,
+    batch_size=config.quota.reset_batch_size
+)
+
+
 async def get_logger() -> ILogger:
     return root_logger
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with db_factory.get_session() as session:
-        yield session
+    async with db_factory.get_lazy_session() as session:
+        yield cast("AsyncSession", session)
+
+
+async def get_read_only_db_session() -> AsyncGenerator[AsyncSession, None]:
+    factory = db_replica_factory or db_factory
+    async with factory.get_lazy_session(read_only=True) as session:
+        yield cast("AsyncSession", session)
 
 
 async def get_redis() -> RedisClient:
     return redis_client
 
 
-async def get_token_validation_service(
-    db_session: AsyncSession = Depends(get_db_session),
+async def get_jwt_key_ring() -> JwtKeyRing | None:
+    return jwt_key_ring
+
+
+def build_session_epoch_service(db_session: AsyncSession) -> SessionEpochService:
+    return SessionEpochService(
+        session_epoch_store=session_epoch_store,
+        user_repository=UserRepository(db_session, datetime_converter),
+        revocation_feed=revocation_feed
+    )
+
+
+def build_token_validation_service(
+    db_session: AsyncSession,
+    session_epoch_service: SessionEpochService | None = None,
 ) -> TokenValidationService:
     return TokenValidationService(
-        session_repository=SessionRepository(db_session, datetime_converter),
+        session_repository=SessionRepository(db_session, datetime_converter, session_state_cache, revocation_feed),
         token_generator=token_generator,
-        datetime_converter=datetime_converter
+        datetime_converter=datetime_converter,
+        claims_cache=token_claims_cache,
+        session_state_cache=session_state_cache,
+        session_epoch_service=session_epoch_service or build_session_epoch_service(db_session),
+        rejection_cache=token_rejection_cache,
+        rejection_store=token_rejection_store,
+        single_flight=single_flight,
+        read_scope=primary_read_scope
+    )
+
+
+async def get_session_epoch_service(
+    db_session: AsyncSession = Depends(get_db_session),
+) -> SessionEpochService:
+    return build_session_epoch_service(db_session)
+
+
+async def get_token_validation_service(
+    db_session: AsyncSession = Depends(get_db_session),
+    session_epoch_service: SessionEpochService = Depends(get_session_epoch_service),
+) -> TokenValidationService:
+    return build_token_validation_service(db_session, session_epoch_service)
+
+
+async def get_revocation_feed_service() -> RevocationFeedService:
+    return RevocationFeedService(
+        revocation_feed=revocation_feed,
+        retention_seconds=token_policy.get_access_token_expiry_seconds()
     )
 
 
@@ -85,9 +306,25 @@ async def get_service_access_validation_service(
     db_session: AsyncSession = Depends(get_db_session),
 ) -> ServiceAccessValidationService:
     return ServiceAccessValidationService(
-        service_access_repository=ServiceAccessRepository(db_session, datetime_converter),
-        user_plan_repository=UserPlanRepository(db_session, datetime_converter),
-        datetime_converter=datetime_converter
+        service_access_repository=ServiceAccessRepository(db_session, datetime_converter, entitlement_cache),
+        user_plan_repository=UserPlanRepository(db_session, datetime_converter, entitlement_cache),
+        datetime_converter=datetime_converter,
+        single_flight=single_flight,
+        entitlement_cache=entitlement_cache,
+        read_scope=primary_read_scope
+    )
+
+
+async def get_entitlement_claim_service(
+    db_session: AsyncSession = Depends(get_db_session),
+    service_access_validator: ServiceAccessValidationService = Depends(get_service_access_validation_service),
+) -> EntitlementClaimService:
+    return EntitlementClaimService(
+        service_repository=ServiceRepository(db_session),
+        service_access_validator=service_access_validator,
+        datetime_converter=datetime_converter,
+        registry_cache=service_registry_cache,
+        registry_ttl_seconds=config.cache.service_registry_ttl_seconds
     )
 
 
@@ -97,19 +334,58 @@ async def get_quota_management_service(
 ) -> QuotaManagementService:
     return QuotaManagementService(
         quota_repository=QuotaRepository(db_session, datetime_converter),
-        user_plan_repository=UserPlanRepository(db_session, datetime_converter),
+        user_plan_repository=UserPlanRepository(db_session, datetime_converter, entitlement_cache),
         plan_repository=PlanRepository(db_session),
         transaction_logger=TransactionLoggerRepository(db_session),
         datetime_converter=datetime_converter,
         uuid_generator=uuid_generator,
         service_access_validator=service_access_validator,
-        quota_defaults=quota_defaults
+        quota_defaults=quota_defaults,
+        single_flight=single_flight,
+        quota_counter_store=quota_counter_store,
+        quota_lease_pool=quota_lease_pool,
+        idempotency_store=quota_idempotency_store,
+        read_scope=primary_read_scope,
+        transaction_hooks=DatabaseTransactionHooks(db_session)
+    )
+
+
+async def get_quota_check_service(
+    read_session: AsyncSession = Depends(get_read_only_db_session),
+    service_access_validator: ServiceAccessValidationService = Depends(get_service_access_validation_service),
+) -> QuotaManagementService:
+    return QuotaManagementService(
+        quota_repository=QuotaRepository(read_session, datetime_converter),
+        user_plan_repository=UserPlanRepository(read_session, datetime_converter, entitlement_cache),
+        plan_repository=PlanRepository(read_session),
+        transaction_logger=TransactionLoggerRepository(read_session),
+        datetime_converter=datetime_converter,
+        uuid_generator=uuid_generator,
+        service_access_validator=service_access_validator,
+        quota_defaults=quota_defaults,
+        single_flight=single_flight,
+        quota_counter_store=quota_counter_store,
+        read_scope=replica_read_scope
+    )
+
+
+async def get_token_introspection_service(
+    token_validator: TokenValidationService = Depends(get_token_validation_service),
+    service_access_validator: ServiceAccessValidationService = Depends(get_service_access_validation_service),
+    quota_manager: QuotaManagementService = Depends(get_quota_management_service),
+) -> TokenIntrospectionService:
+    return TokenIntrospectionService(
+        token_validator=token_validator,
+        service_access_validator=service_access_validator,
+        quota_manager=quota_manager
     )
 
 
 async def get_authentication_service(
     db_session: AsyncSession = Depends(get_db_session),
     logger: ILogger = Depends(get_logger),
+    session_epoch_service: SessionEpochService = Depends(get_session_epoch_service),
+    entitlement_claim_service: EntitlementClaimService = Depends(get_entitlement_claim_service),
 ) -> AuthenticationService:
     rate_limiter = OtpRateLimiter(
         redis_client=redis_client,
@@ -119,7 +395,7 @@ async def get_authentication_service(
     return AuthenticationService(
         user_repository=UserRepository(db_session, datetime_converter),
         auth_provider_repository=AuthProviderRepository(db_session),
-        session_repository=SessionRepository(db_session, datetime_converter),
+        session_repository=SessionRepository(db_session, datetime_converter, session_state_cache, revocation_feed),
         otp_repository=OtpCodeRepository(db_session),
         transaction_logger=TransactionLoggerRepository(db_session),
         salter=salter,
@@ -128,7 +404,9 @@ async def get_authentication_service(
         datetime_converter=datetime_converter,
         logger=logger,
         rate_limiter=rate_limiter,
-        token_policy=token_policy
+        token_policy=token_policy,
+        session_epoch_service=session_epoch_service,
+        entitlement_claims=entitlement_claim_service if config.auth.entitlement_claims_enabled else None
     )
 
 
@@ -140,9 +418,9 @@ async def get_user_registration_service(
         auth_provider_repository=AuthProviderRepository(db_session),
         otp_repository=OtpCodeRepository(db_session),
         plan_repository=PlanRepository(db_session),
-        user_plan_repository=UserPlanRepository(db_session, datetime_converter),
+        user_plan_repository=UserPlanRepository(db_session, datetime_converter, entitlement_cache),
         service_repository=ServiceRepository(db_session),
-        service_access_repository=ServiceAccessRepository(db_session, datetime_converter),
+        service_access_repository=ServiceAccessRepository(db_session, datetime_converter, entitlement_cache),
         plan_service_repository=PlanServiceRepository(db_session),
         transaction_logger=TransactionLoggerRepository(db_session),
         salter=salter,
@@ -155,26 +433,30 @@ async def get_user_registration_service(
 
 async def get_refresh_token_service(
     db_session: AsyncSession = Depends(get_db_session),
+    entitlement_claim_service: EntitlementClaimService = Depends(get_entitlement_claim_service),
 ) -> RefreshTokenService:
     return RefreshTokenService(
-        session_repository=SessionRepository(db_session, datetime_converter),
+        session_repository=SessionRepository(db_session, datetime_converter, session_state_cache, revocation_feed),
         transaction_logger=TransactionLoggerRepository(db_session),
         salter=salter,
         token_generator=token_generator,
         uuid_generator=uuid_generator,
         datetime_converter=datetime_converter,
-        token_policy=token_policy
+        token_policy=token_policy,
+        entitlement_claims=entitlement_claim_service if config.auth.entitlement_claims_enabled else None
     )
 
 
 async def get_revoke_session_service(
     db_session: AsyncSession = Depends(get_db_session),
+    session_epoch_service: SessionEpochService = Depends(get_session_epoch_service),
 ) -> RevokeSessionService:
     return RevokeSessionService(
-        session_repository=SessionRepository(db_session, datetime_converter),
+        session_repository=SessionRepository(db_session, datetime_converter, session_state_cache, revocation_feed),
         transaction_logger=TransactionLoggerRepository(db_session),
         datetime_converter=datetime_converter,
-        uuid_generator=uuid_generator
+        uuid_generator=uuid_generator,
+        session_epoch_service=session_epoch_service
     )
 
 
@@ -238,6 +520,30 @@ async def get_current_user(
 
     return AuthenticatedUser(
         user_id=result.user_id,
-        session_id=result.session_id
+        session_id=result.session_id,
+        expires_at=result.expires_at
     )
 
+
+def require_api_key_scope(scope: str) -> Callable[..., Awaitable[ApiKey]]:
+    async def guard(api_key: str | None = Header(default=None, alias="X-API-Key")) -> ApiKey:
+        if not api_key:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Missing X-API-Key header"
+            )
+
+        async with db_factory.get_lazy_session(read_only=True) as db_session:
+            service = ApiKeyAuthenticationService(
+                api_key_repository=ApiKeyRepository(cast("AsyncSession", db_session)),
+                datetime_converter=datetime_converter
+            )
+            try:
+                return await service.execute(api_key, scope)
+            except (InvalidCredentialsException, AccessDeniedException) as e:
+                raise HTTPException(
+                    status_code=e.status_code,
+                    detail=e.message
+                )
+
+    return guard
@@ -1,10 +1,12 @@
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.infrastructure.adapter.input.http.AuthController import router as auth_router
+from app.infrastructure.adapter.input.http.JwksController import router as jwks_router
 from app.infrastructure.adapter.input.http.OtpController import router as otp_router
 from app.infrastructure.adapter.input.http.UserController import router as user_router
 from app.infrastructure.adapter.input.http.ValidationController import router as validation_router
@@ -14,8 +16,19 @@ from app.infrastructure.adapter.input.middleware.ExceptionHandler import (
     generic_exception_handler
 )
 from app.infrastructure.adapter.input.middleware.LoggingMiddleware import LoggingMiddleware
+from app.infrastructure.adapter.input.middleware.TokenValidationFastPath import TokenValidationFastPath
 from app.infrastructure.config.EnvConfig import EnvConfig
-from app.infrastructure.dependencies import db_factory, redis_client
+from app.infrastructure.dependencies import (
+    build_token_validation_service,
+    db_factory,
+    db_replica_factory,
+    quota_lease_worker,
+    quota_reset_worker,
+    quota_write_back_worker,
+    redis_client,
+    single_flight,
+    stream_redis_client,
+)
 from app.domain.exceptions import DomainException
 from app.domain.ServerConfig import ServerConfig
 from app.shared.Exceptions import DatabaseException
@@ -25,9 +38,22 @@ env = ServerConfig(environtment=config.environment).is_production()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if quota_write_back_worker is not None:
+        quota_write_back_worker.start()
+    if quota_lease_worker is not None:
+        quota_lease_worker.start()
+    quota_reset_worker.start()
     yield
+    await quota_reset_worker.stop()
+    if quota_lease_worker is not None:
+        await quota_lease_worker.stop()
+    if quota_write_back_worker is not None:
+        await quota_write_back_worker.stop()
     await db_factory.close()
+    if db_replica_factory is not None:
+        await db_replica_factory.close()
     await redis_client.close()
+    await stream_redis_client.close()
 
 
 app = FastAPI(
@@ -51,6 +77,14 @@ app.add_middleware(
 
 app.add_middleware(LoggingMiddleware)
 
+if config.validation.fast_path_enabled:
+    app.add_middleware(
+        TokenValidationFastPath,
+        path="/api/v1/validate/token",
+        session_factory=db_factory.get_lazy_session,
+        service_factory=build_token_validation_service,
+    )
+
 app.add_exception_handler(DomainException, domain_exception_handler)
 app.add_exception_handler(DatabaseException, database_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
@@ -59,6 +93,7 @@ app.include_router(auth_router, prefix="/api/v1")
 app.include_router(validation_router, prefix="/api/v1")
 app.include_router(user_router, prefix="/api/v1")
 app.include_router(otp_router, prefix="/api/v1")
+app.include_router(jwks_router)
 
 
 @app.get("/health")
@@ -69,7 +104,8 @@ async def health_check():
     return {
         "status": "healthy",
         "environment": env,
-        "debug": config.debug
+        "debug": config.debug,
+        "single_flight": asdict(single_flight.stats())
     }
 
 
@@ -0,0 +1,64 @@
+import hashlib
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Protocol
+
+from app.shared.DateTime import DateTimeProtocol
+
+
+class HttpCachePolicyProtocol(Protocol):
+    def max_age(self, expires_at: datetime | None) -> int:
+        ...
+
+    def cache_control(self, max_age: int, shared: bool = False) -> str:
+        ...
+
+    def etag(self, body: bytes) -> str:
+        ...
+
+    def matches(self, if_none_match: str | None, etag: str) -> bool:
+        ...
+
+
+class IHttpCachePolicy(ABC):
+    @abstractmethod
+    def max_age(self, expires_at: datetime | None) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def cache_control(self, max_age: int, shared: bool = False) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def etag(self, body: bytes) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def matches(self, if_none_match: str | None, etag: str) -> bool:
+        raise NotImplementedError
+
+
+class HttpCachePolicy(IHttpCachePolicy):
+    def __init__(self, tolerance_seconds: int, datetime_converter: DateTimeProtocol):
+        self._tolerance_seconds = tolerance_seconds
+        self._datetime = datetime_converter
+
+    def max_age(self, expires_at: datetime | None) -> int:
+        if expires_at is None:
+            return 0
+        remaining = self._datetime.to_timestamp(expires_at) - self._datetime.to_timestamp(self._datetime.now_utc())
+        return max(0, min(remaining, self._tolerance_seconds))
+
+    def cache_control(self, max_age: int, shared: bool = False) -> str:
+        if max_age <= 0:
+            return "no-cache"
+        return f"max-age={max_age}, s-maxage={max_age}" if shared else f"private, max-age={max_age}"
+
+    def etag(self, body: bytes) -> str:
+        return f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+    def matches(self, if_none_match: str | None, etag: str) -> bool:
+        if not if_none_match:
+            return False
+        candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm, RSAAlgorithm
+
+
+EC_ALGORITHMS = {"secp256r1": "ES256", "secp384r1": "ES384", "secp521r1": "ES512"}
+
+
+@dataclass(frozen=True)
+class JwtSigningKey:
+    kid: str
+    algorithm: str
+    public_key: Any
+    private_key: Any | None = None
+
+    def can_sign(self) -> bool:
+        return self.private_key is not None
+
+    def to_jwk(self) -> dict[str, Any]:
+        if self.algorithm.startswith("RS"):
+            jwk = RSAAlgorithm.to_jwk(self.public_key, as_dict=True)
+        elif self.algorithm.startswith("ES"):
+            jwk = ECAlgorithm.to_jwk(self.public_key, as_dict=True)
+        else:
+            jwk = OKPAlgorithm.to_jwk(self.public_key, as_dict=True)
+        jwk.update({"kid": self.kid, "alg": self.algorithm, "use": "sig"})
+        return jwk
+
+
+class JwtKeyRing:
+    PRIVATE_SUFFIX = ".pem"
+    PUBLIC_SUFFIX = ".pub.pem"
+
+    def __init__(self, keys: list[JwtSigningKey], active_kid: str):
+        self._keys = {key.kid: key for key in keys}
+        active_key = self._keys.get(active_kid)
+        if active_key is None or not active_key.can_sign():
+            raise ValueError(f"Active JWT key '{active_kid}' has no private key in the key ring")
+        self._active_kid = active_kid
+
+    @staticmethod
+    def algorithm_for(public_key: Any) -> str:
+        if isinstance(public_key, rsa.RSAPublicKey):
+            return "RS256"
+        if isinstance(public_key, ec.EllipticCurvePublicKey):
+            algorithm = EC_ALGORITHMS.get(public_key.curve.name)
+            if algorithm is None:
+                raise ValueError(f"Unsupported JWT key curve: {public_key.curve.name}")
+            return algorithm
+        if isinstance(public_key, ed25519.Ed25519PublicKey):
+            return "EdDSA"
+        raise ValueError(f"Unsupported JWT key type: {type(public_key).__name__}")
+
+    @staticmethod
+    def from_directory(directory: str, active_kid: str) -> "JwtKeyRing":
+        keys: list[JwtSigningKey] = []
+        for path in sorted(Path(directory).glob("*.pem")):
+            if path.name.endswith(JwtKeyRing.PUBLIC_SUFFIX):
+                kid = path.name.removesuffix(JwtKeyRing.PUBLIC_SUFFIX)
+                if (path.parent / f"{kid}{JwtKeyRing.PRIVATE_SUFFIX}").exists():
+                    continue
+                public_key = load_pem_public_key(path.read_bytes())
+                private_key = None
+            else:
+                kid = path.name.removesuffix(JwtKeyRing.PRIVATE_SUFFIX)
+                private_key = load_pem_private_key(path.read_bytes(), password=None)
+                public_key = private_key.public_key()
+
+            keys.append(
+                JwtSigningKey(
+                    kid=kid,
+                    algorithm=JwtKeyRing.algorithm_for(public_key),
+                    public_key=public_key,
+                    private_key=private_key,
+                )
+            )
+        return JwtKeyRing(keys, active_kid)
+
+    def signing_key(self) -> JwtSigningKey:
+        return self._keys[self._active_kid]
+
+    def verification_key(self, kid: str) -> JwtSigningKey | None:
+        return self._keys.get(kid)
+
+    def jwks(self) -> dict[str, Any]:
+        return {"keys": [key.to_jwk() for key in self._keys.values()]}
@@ -0,0 +1,180 @@
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from app.domain.service.QuotaCounter import QuotaCounter
+from app.domain.service.QuotaLease import QuotaLease
+
+
+@dataclass
+class QuotaLeaseStats:
+    local_hits: int = 0
+    reservations: int = 0
+    retired: int = 0
+    size: int = 0
+
+    def local_ratio(self) -> float:
+        total = self.local_hits + self.reservations
+        if total == 0:
+            return 0.0
+        return self.local_hits / total
+
+
+@dataclass
+class _Demand:
+    units_per_second: float
+    observed_at: datetime
+
+
+class IQuotaLeasePool(ABC):
+    @abstractmethod
+    def take(self, user_id: UUID, service_name: str, quota_type: str, amount: int, current_time: datetime) -> QuotaLease | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def block_size(self, user_id: UUID, service_name: str, quota_type: str, amount: int, current_time: datetime) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def overshoot_tolerance(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def install(self, counter: QuotaCounter, granted: int, current_time: datetime) -> QuotaLease:
+        raise NotImplementedError
+
+    @abstractmethod
+    def retire(self, user_id: UUID, service_name: str, quota_type: str, current_time: datetime) -> QuotaLease | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def release_expired(self, current_time: datetime) -> list[QuotaLease]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def release_all(self, current_time: datetime) -> list[QuotaLease]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> QuotaLeaseStats:
+        raise NotImplementedError
+
+
+class QuotaLeasePool(IQuotaLeasePool):
+    SMOOTHING = 0.5
+    DEMAND_MEMORY_LEASES = 12
+
+    def __init__(self, lease_ttl_seconds: float, min_block: int, max_block: int, overshoot_tolerance: int = 0):
+        if lease_ttl_seconds <= 0:
+            raise ValueError("lease_ttl_seconds must be positive")
+        if min_block <= 0 or max_block < min_block:
+            raise ValueError("Lease block sizes must satisfy 0 < min_block <= max_block")
+        if overshoot_tolerance < 0:
+            raise ValueError("overshoot_tolerance must not be negative")
+        self._lease_ttl = timedelta(seconds=lease_ttl_seconds)
+        self._min_block = min_block
+        self._max_block = max_block
+        self._overshoot_tolerance = overshoot_tolerance
+        self._leases: dict[str, QuotaLease] = {}
+        self._demand: dict[str, _Demand] = {}
+        self._retired: list[QuotaLease] = []
+        self._stats = QuotaLeaseStats()
+
+    def _key(self, user_id: UUID, service_name: str, quota_type: str) -> str:
+        return f"{user_id}:{service_name}:{quota_type}"
+
+    def take(self, user_id: UUID, service_name: str, quota_type: str, amount: int, current_time: datetime) -> QuotaLease | None:
+        lease = self._leases.get(self._key(user_id, service_name, quota_type))
+        if lease is None or not lease.take(amount, current_time):
+            return None
+        self._stats.local_hits += 1
+        return lease
+
+    def block_size(self, user_id: UUID, service_name: str, quota_type: str, amount: int, current_time: datetime) -> int:
+        demand = self._demand.get(self._key(user_id, service_name, quota_type))
+        block = self._min_block
+        if demand is not None:
+            block = math.ceil(demand.units_per_second * self._lease_ttl.total_seconds())
+        return max(amount, min(self._max_block, max(self._min_block, block)))
+
+    def overshoot_tolerance(self) -> int:
+        return self._overshoot_tolerance
+
+    def install(self, counter: QuotaCounter, granted: int, current_time: datetime) -> QuotaLease:
+        key = self._key(counter.user_id, counter.service_name, counter.quota_type)
+        previous = self._leases.get(key)
+        if previous is not None:
+            self._retire(key, previous, current_time)
+
+        lease = QuotaLease(
+            user_id=counter.user_id,
+            service_name=counter.service_name,
+            quota_type=counter.quota_type,
+            granted=granted,
+            limit=counter.limit,
+            central_usage=counter.current_usage,
+            reset_at=counter.reset_at,
+            leased_at=current_time,
+            expires_at=current_time + self._lease_ttl,
+        )
+        self._leases[key] = lease
+        self._stats.reservations += 1
+        return lease
+
+    def retire(self, user_id: UUID, service_name: str, quota_type: str, current_time: datetime) -> QuotaLease | None:
+        key = self._key(user_id, service_name, quota_type)
+        lease = self._leases.get(key)
+        if lease is None:
+            return None
+        self._unlease(key, lease, current_time)
+        return lease if lease.available() > 0 else None
+
+    def release_expired(self, current_time: datetime) -> list[QuotaLease]:
+        for key, lease in list(self._leases.items()):
+            if lease.is_expired(current_time):
+                self._retire(key, lease, current_time)
+
+        forget_before = current_time - self._lease_ttl * self.DEMAND_MEMORY_LEASES
+        for key, demand in list(self._demand.items()):
+            if key not in self._leases and demand.observed_at < forget_before:
+                del self._demand[key]
+
+        return self._drain_retired()
+
+    def release_all(self, current_time: datetime) -> list[QuotaLease]:
+        for key, lease in list(self._leases.items()):
+            self._retire(key, lease, current_time)
+        return self._drain_retired()
+
+    def stats(self) -> QuotaLeaseStats:
+        return QuotaLeaseStats(
+            local_hits=self._stats.local_hits,
+            reservations=self._stats.reservations,
+            retired=self._stats.retired,
+            size=len(self._leases),
+        )
+
+    def _retire(self, key: str, lease: QuotaLease, current_time: datetime) -> None:
+        self._unlease(key, lease, current_time)
+        if lease.available() > 0:
+            self._retired.append(lease)
+
+    def _unlease(self, key: str, lease: QuotaLease, current_time: datetime) -> None:
+        if self._leases.get(key) is lease:
+            del self._leases[key]
+        self._observe(key, lease, current_time)
+        self._stats.retired += 1
+
+    def _observe(self, key: str, lease: QuotaLease, current_time: datetime) -> None:
+        elapsed = (min(current_time, lease.expires_at) - lease.leased_at).total_seconds()
+        sample = lease.used / max(elapsed, 1.0)
+        demand = self._demand.get(key)
+        if demand is not None:
+            sample = self.SMOOTHING * sample + (1 - self.SMOOTHING) * demand.units_per_second
+        self._demand[key] = _Demand(units_per_second=sample, observed_at=current_time)
+
+    def _drain_retired(self) -> list[QuotaLease]:
+        retired, self._retired = self._retired, []
+        return retired
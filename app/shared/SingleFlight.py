@@ -0,0 +1,73 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeVar
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+    def coalescing_ratio(self) -> float:
+        if self.calls == 0:
+            return 0.0
+        return self.coalesced / self.calls
+
+
+class SingleFlightProtocol(Protocol):
+    async def do(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        ...
+
+    def stats(self) -> SingleFlightStats:
+        ...
+
+
+class ISingleFlight(ABC):
+    @abstractmethod
+    async def do(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> SingleFlightStats:
+        raise NotImplementedError
+
+
+class SingleFlight(ISingleFlight):
+    def __init__(self):
+        self._flights: dict[str, asyncio.Future[Any]] = {}
+        self._stats = SingleFlightStats()
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        self._stats.calls += 1
+        flight = self._flights.get(key)
+
+        if flight is None:
+            self._stats.executions += 1
+            flight = asyncio.ensure_future(loader())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda finished: self._land(key, finished))
+        else:
+            self._stats.coalesced += 1
+
+        return await asyncio.shield(flight)
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            calls=self._stats.calls,
+            executions=self._stats.executions,
+            coalesced=self._stats.coalesced,
+            in_flight=len(self._flights),
+        )
+
+    def _land(self, key: str, flight: asyncio.Future[Any]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            flight.exception()
@@ -0,0 +1,63 @@
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Any, Protocol
+
+from app.shared.TtlCache import CacheStats, ITtlCache
+
+
+class TokenDigest:
+    @staticmethod
+    def compute(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenClaimsCacheProtocol(Protocol):
+    def get(self, token: str) -> dict[str, Any] | None:
+        ...
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        ...
+
+    def invalidate(self, token: str) -> None:
+        ...
+
+    def stats(self) -> CacheStats:
+        ...
+
+
+class ITokenClaimsCache(ABC):
+    @abstractmethod
+    def get(self, token: str) -> dict[str, Any] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, token: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        raise NotImplementedError
+
+
+class TokenClaimsCache(ITokenClaimsCache):
+    def __init__(self, cache: ITtlCache[dict[str, Any]]):
+        self._cache = cache
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        return self._cache.get(TokenDigest.compute(token))
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        expires_at = claims.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+        self._cache.set(TokenDigest.compute(token), claims, float(expires_at))
+
+    def invalidate(self, token: str) -> None:
+        self._cache.delete(TokenDigest.compute(token))
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
@@ -5,9 +5,11 @@ from typing import Any, Protocol
 import jwt
 
 from app.shared.DateTime import DateTimeProtocol
+from app.shared.JwtKeyRing import JwtKeyRing
 from app.domain.exceptions import (
     TokenExpiredException,
     TokenInvalidException,
+    TokenSignatureInvalidException,
 )
 
 
@@ -37,10 +39,19 @@ class ITokenGenerator(ABC):
 
 
 class JwtTokenGenerator(ITokenGenerator):
-    def __init__(self, secret_key: str, datetime_converter: DateTimeProtocol, algorithm: str = "HS256"):
+    def __init__(
+        self,
+        secret_key: str,
+        datetime_converter: DateTimeProtocol,
+        algorithm: str = "HS256",
+        key_ring: JwtKeyRing | None = None,
+        accept_legacy_tokens: bool = True,
+    ):
         self._secret_key = secret_key
         self._algorithm = algorithm
         self._datetime = datetime_converter
+        self._key_ring = key_ring
+        self._accept_legacy_tokens = accept_legacy_tokens
 
     def generate(self, payload: dict[str, Any], expires_delta: timedelta | None = None) -> str:
         to_encode = payload.copy()
@@ -53,23 +64,48 @@ class JwtTokenGenerator(ITokenGenerator):
 
         to_encode.update({"exp": expire, "iat": now})
 
-        encoded_jwt = jwt.encode(to_encode, self._secret_key, algorithm=self._algorithm)
-        return encoded_jwt
+        if self._key_ring is None:
+            return jwt.encode(to_encode, self._secret_key, algorithm=self._algorithm)
+
+        signing_key = self._key_ring.signing_key()
+        return jwt.encode(
+            to_encode,
+            signing_key.private_key,
+            algorithm=signing_key.algorithm,
+            headers={"kid": signing_key.kid}
+        )
 
     def decode(self, token: str) -> dict[str, Any]:
         try:
-            payload = jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
-            return payload
+            return self._decode(token)
         except jwt.ExpiredSignatureError:
             raise TokenExpiredException()
+        except jwt.InvalidSignatureError:
+            raise TokenSignatureInvalidException()
         except jwt.InvalidTokenError:
             raise TokenInvalidException()
 
     def verify(self, token: str) -> bool:
         try:
-            jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
+            self._decode(token)
             return True
         except jwt.ExpiredSignatureError:
             raise TokenExpiredException()
         except jwt.InvalidTokenError:
             return False
+
+    def _decode(self, token: str) -> dict[str, Any]:
+        if self._key_ring is None:
+            return jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            if not self._accept_legacy_tokens:
+                raise jwt.InvalidSignatureError("Token has no signing key id")
+            return jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
+
+        verification_key = self._key_ring.verification_key(kid)
+        if verification_key is None:
+            raise jwt.InvalidSignatureError(f"Unknown signing key: {kid}")
+
+        return jwt.decode(token, verification_key.public_key, algorithms=[verification_key.algorithm])
@@ -0,0 +1,84 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from app.domain.authorization.TokenRejection import TokenRejection
+from app.shared.DateTime import DateTimeProtocol
+from app.shared.TokenClaimsCache import TokenDigest
+from app.shared.TtlCache import ITtlCache
+
+
+@dataclass
+class TokenRejectionStats:
+    rejected: dict[str, int] = field(default_factory=dict)
+    absorbed: dict[str, int] = field(default_factory=dict)
+    size: int = 0
+
+
+class TokenRejectionCacheProtocol(Protocol):
+    def get(self, token: str) -> TokenRejection | None:
+        ...
+
+    def put(self, token: str, rejection: TokenRejection) -> None:
+        ...
+
+    def absorb(self, token: str, rejection: TokenRejection) -> None:
+        ...
+
+    def stats(self) -> TokenRejectionStats:
+        ...
+
+
+class ITokenRejectionCache(ABC):
+    @abstractmethod
+    def get(self, token: str) -> TokenRejection | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, token: str, rejection: TokenRejection) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def absorb(self, token: str, rejection: TokenRejection) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> TokenRejectionStats:
+        raise NotImplementedError
+
+
+class TokenRejectionCache(ITokenRejectionCache):
+    def __init__(self, cache: ITtlCache[TokenRejection], datetime_converter: DateTimeProtocol, ttl_seconds: int):
+        self._cache = cache
+        self._datetime = datetime_converter
+        self._ttl_seconds = ttl_seconds
+        self._stats = TokenRejectionStats()
+
+    def get(self, token: str) -> TokenRejection | None:
+        rejection = self._cache.get(TokenDigest.compute(token))
+        if rejection is not None:
+            self._count(self._stats.absorbed, rejection)
+        return rejection
+
+    def put(self, token: str, rejection: TokenRejection) -> None:
+        self._store(token, rejection)
+        self._count(self._stats.rejected, rejection)
+
+    def absorb(self, token: str, rejection: TokenRejection) -> None:
+        self._store(token, rejection)
+        self._count(self._stats.absorbed, rejection)
+
+    def stats(self) -> TokenRejectionStats:
+        return TokenRejectionStats(
+            rejected=dict(self._stats.rejected),
+            absorbed=dict(self._stats.absorbed),
+            size=self._cache.stats().size,
+        )
+
+    def _store(self, token: str, rejection: TokenRejection) -> None:
+        expires_at = self._datetime.now_utc().timestamp() + self._ttl_seconds
+        self._cache.set(TokenDigest.compute(token), rejection, expires_at)
+
+    @staticmethod
+    def _count(counters: dict[str, int], rejection: TokenRejection) -> None:
+        counters[rejection.reason.value] = counters.get(rejection.reason.value, 0) + 1
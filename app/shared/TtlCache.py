@@ -0,0 +1,117 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Protocol
+
+from app.shared.DateTime import DateTimeProtocol
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+
+class TtlCacheProtocol[V](Protocol):
+    def get(self, key: str) -> V | None:
+        ...
+
+    def set(self, key: str, value: V, expires_at: float) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+    def stats(self) -> CacheStats:
+        ...
+
+
+class ITtlCache[V](ABC):
+    @abstractmethod
+    def get(self, key: str) -> V | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: V, expires_at: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        raise NotImplementedError
+
+
+class TtlCache[V](ITtlCache[V]):
+    def __init__(self, max_entries: int, datetime_converter: DateTimeProtocol):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._datetime = datetime_converter
+        self._entries: OrderedDict[str, tuple[V, float]] = OrderedDict()
+        self._stats = CacheStats()
+
+    def _now(self) -> float:
+        return self._datetime.now_utc().timestamp()
+
+    def get(self, key: str) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at <= self._now():
+            del self._entries[key]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def set(self, key: str, value: V, expires_at: float) -> None:
+        if expires_at <= self._now():
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            expirations=self._stats.expirations,
+            size=len(self._entries),
+        )
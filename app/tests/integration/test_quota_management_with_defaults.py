@@ -98,7 +98,8 @@ class TestQuotaManagementServiceWithDefaults:
         result = await service.execute(user_id, "test_service", "api_calls", 1)
 
         assert result.limit == 1000
-        mock_repositories['quota_repository'].save.assert_called_once()
+        mock_repositories['quota_repository'].save.assert_not_called()
+        mock_repositories['transaction_logger'].log_database_transaction.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_default_quota_for_user_with_no_plan_limit_uses_fallback(self, mock_repositories, quota_defaults):
@@ -225,9 +226,9 @@ class TestQuotaManagementServiceWithDefaults:
 
         mock_repositories['user_plan_repository'].find_active_by_user.return_value = None
         mock_repositories['datetime_converter'].now_utc.return_value = current_time
+        mock_repositories['datetime_converter'].to_iso_string.side_effect = lambda value: value.isoformat()
 
-        expected_reset_time = current_time + timedelta(days=7)
-        mock_repositories['datetime_converter'].add_timedelta.return_value = expected_reset_time
+        expected_reset_time = custom_quota_defaults.next_reset_at(current_time)
         mock_repositories['uuid_generator'].generate.return_value = uuid4()
         mock_repositories['quota_repository'].find_by_user_and_service.return_value = None
 
@@ -246,9 +247,7 @@ class TestQuotaManagementServiceWithDefaults:
 
         service = QuotaManagementService(**mock_repositories, quota_defaults=custom_quota_defaults)
 
-        await service.execute(user_id, "test_service", "api_calls", 1)
+        result = await service.execute(user_id, "test_service", "api_calls", 1)
 
-        mock_repositories['datetime_converter'].add_timedelta.assert_called_with(
-            current_time,
-            timedelta(days=7)
-        )
+        assert result.reset_at == expected_reset_time.isoformat()
+        assert current_time < expected_reset_time <= current_time + timedelta(days=7)
@@ -0,0 +1,72 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.dto.ServiceAccessDTO import ServiceAccessResult
+from app.domain.service.Quota import Quota
+from app.domain.service.QuotaCounter import QuotaCounter
+from app.domain.service.QuotaDefaults import QuotaDefaults
+
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def now():
+    return NOW
+
+
+@pytest.fixture
+def quota_factory():
+    def build(user_id, current_usage=0, limit=10, service_name="ocr", quota_type="api_calls_per_day"):
+        return Quota(
+            id=uuid4(),
+            user_id=user_id,
+            service_name=service_name,
+            quota_type=quota_type,
+            current_usage=current_usage,
+            limit=limit,
+            reset_at=NOW + timedelta(days=1),
+            created_at=NOW,
+            updated_at=NOW,
+        )
+    return build
+
+
+@pytest.fixture
+def counter_factory():
+    def build(user_id, current_usage, limit=10, service_name="ocr", quota_type="api_calls_per_day"):
+        return QuotaCounter(
+            quota_id=uuid4(),
+            user_id=user_id,
+            service_name=service_name,
+            quota_type=quota_type,
+            current_usage=current_usage,
+            limit=limit,
+            reset_at=NOW + timedelta(days=1),
+        )
+    return build
+
+
+@pytest.fixture
+def dependencies():
+    datetime_converter = MagicMock()
+    datetime_converter.now_utc.return_value = NOW
+    datetime_converter.to_iso_string.side_effect = lambda value: value.isoformat()
+    service_access_validator = AsyncMock()
+    service_access_validator.execute.return_value = ServiceAccessResult(is_allowed=True)
+    service_access_validator.execute_bulk.side_effect = lambda user_id, service_names: {
+        service_name: ServiceAccessResult(is_allowed=True) for service_name in service_names
+    }
+    return {
+        'quota_repository': AsyncMock(),
+        'user_plan_repository': AsyncMock(),
+        'plan_repository': AsyncMock(),
+        'transaction_logger': AsyncMock(),
+        'datetime_converter': datetime_converter,
+        'uuid_generator': MagicMock(),
+        'service_access_validator': service_access_validator,
+        'quota_defaults': QuotaDefaults.default(),
+    }
@@ -0,0 +1,72 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.service.ApiKeyAuthenticationService import ApiKeyAuthenticationService
+from app.domain.authorization.ApiKey import ApiKey
+from app.domain.exceptions import AccessDeniedException, InvalidCredentialsException
+
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _api_key(scopes, expires_at=None, is_active=True):
+    return ApiKey(
+        id=uuid4(),
+        user_id=uuid4(),
+        key_hash=ApiKey.hash_key("secret-key"),
+        name="edge",
+        scopes=scopes,
+        expires_at=expires_at,
+        last_used_at=None,
+        is_active=is_active,
+        created_at=NOW,
+    )
+
+
+@pytest.fixture
+def dependencies():
+    return {
+        'api_key_repository': AsyncMock(),
+        'datetime_converter': MagicMock(now_utc=MagicMock(return_value=NOW)),
+    }
+
+
+class TestApiKeyAuthenticationService:
+
+    @pytest.mark.asyncio
+    async def test_key_with_scope_is_accepted(self, dependencies):
+        api_key = _api_key(["revocations:read"])
+        dependencies['api_key_repository'].find_by_key_hash.return_value = api_key
+        service = ApiKeyAuthenticationService(**dependencies)
+
+        assert await service.execute("secret-key", "revocations:read") is api_key
+        dependencies['api_key_repository'].find_by_key_hash.assert_awaited_once_with(ApiKey.hash_key("secret-key"))
+
+    @pytest.mark.asyncio
+    async def test_unknown_key_is_rejected(self, dependencies):
+        dependencies['api_key_repository'].find_by_key_hash.return_value = None
+        service = ApiKeyAuthenticationService(**dependencies)
+
+        with pytest.raises(InvalidCredentialsException):
+            await service.execute("secret-key", "revocations:read")
+
+    @pytest.mark.asyncio
+    async def test_expired_key_is_rejected(self, dependencies):
+        dependencies['api_key_repository'].find_by_key_hash.return_value = _api_key(
+            ["revocations:read"], expires_at=NOW - timedelta(seconds=1)
+        )
+        service = ApiKeyAuthenticationService(**dependencies)
+
+        with pytest.raises(InvalidCredentialsException):
+            await service.execute("secret-key", "revocations:read")
+
+    @pytest.mark.asyncio
+    async def test_key_without_scope_is_forbidden(self, dependencies):
+        dependencies['api_key_repository'].find_by_key_hash.return_value = _api_key(["quota:read"])
+        service = ApiKeyAuthenticationService(**dependencies)
+
+        with pytest.raises(AccessDeniedException):
+            await service.execute("secret-key", "revocations:read")
@@ -0,0 +1,168 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.service.EntitlementClaimService import EntitlementClaimService
+from app.domain.authorization.EntitlementClaim import EntitlementClaim
+from app.domain.authorization.EntitlementSnapshot import EntitlementSnapshot
+from app.domain.authorization.ServiceAccess import ServiceAccess
+from app.domain.authorization.ServiceRegistry import ServiceRegistry
+from app.domain.service.Service import Service
+from app.shared.TtlCache import TtlCache
+from kauth_client.Entitlements import EntitlementRegistry, Entitlements
+
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _service(name, created_offset):
+    created_at = NOW + timedelta(minutes=created_offset)
+    return Service(
+        id=uuid4(),
+        name=name,
+        display_name=name,
+        description="",
+        is_active=True,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+def _service_access(user_id, service_name, allowed_features=None, revoked=False):
+    return ServiceAccess(
+        id=uuid4(),
+        user_id=user_id,
+        service_name=service_name,
+        is_allowed=not revoked,
+        allowed_features=allowed_features,
+        granted_at=NOW,
+        revoked_at=NOW if revoked else None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def _user_plan(expires_at):
+    user_plan = MagicMock()
+    user_plan.expires_at = expires_at
+    return user_plan
+
+
+def _registry():
+    return ServiceRegistry.from_services([_service("tts", 2), _service("ocr", 0), _service("stt", 1)])
+
+
+def _client_registry(registry):
+    return EntitlementRegistry(version=registry.version, services=registry.services)
+
+
+class TestServiceRegistry:
+    def test_services_are_ordered_by_creation(self):
+        assert _registry().services == ("ocr", "stt", "tts")
+
+    def test_version_changes_when_services_change(self):
+        registry = _registry()
+        extended = ServiceRegistry(services=(*registry.services, "vision"))
+
+        assert registry.version == _registry().version
+        assert registry.version != extended.version
+
+
+class TestEntitlementClaim:
+    def test_round_trips_services_and_features(self):
+        user_id = uuid4()
+        registry = _registry()
+        expires_at = NOW + timedelta(days=30)
+        snapshot = EntitlementSnapshot.build(
+            user_id,
+            [
+                _service_access(user_id, "ocr", ["scan"]),
+                _service_access(user_id, "tts"),
+                _service_access(user_id, "stt", revoked=True),
+            ],
+            _user_plan(expires_at),
+        )
+
+        claim = EntitlementClaim.encode(snapshot, registry, NOW)
+        entitlements = Entitlements.decode({EntitlementClaim.CLAIM: claim}, _client_registry(registry))
+
+        def clock():
+            return NOW.timestamp()
+
+        assert entitlements.allows("ocr", clock) is True
+        assert entitlements.has_feature("ocr", "scan", clock) is True
+        assert entitlements.has_feature("ocr", "translate", clock) is False
+        assert entitlements.has_feature("tts", "anything", clock) is True
+        assert entitlements.allows("stt", clock) is False
+        assert entitlements.allows("ocr", lambda: expires_at.timestamp()) is False
+
+    def test_inactive_plan_grants_nothing(self):
+        user_id = uuid4()
+        registry = _registry()
+        snapshot = EntitlementSnapshot.build(user_id, [_service_access(user_id, "ocr")], None)
+
+        claim = EntitlementClaim.encode(snapshot, registry, NOW)
+        entitlements = Entitlements.decode({EntitlementClaim.CLAIM: claim}, _client_registry(registry))
+
+        assert claim["b"] == ""
+        assert entitlements.services == {}
+
+    def test_registry_version_mismatch_is_not_decoded(self):
+        user_id = uuid4()
+        registry = _registry()
+        snapshot = EntitlementSnapshot.build(user_id, [_service_access(user_id, "ocr")], _user_plan(None))
+        claim = EntitlementClaim.encode(snapshot, registry, NOW)
+
+        stale_registry = EntitlementRegistry(version="outdated", services=registry.services)
+
+        assert Entitlements.decode({EntitlementClaim.CLAIM: claim}, stale_registry) is None
+
+
+class TestEntitlementClaimService:
+
+    @staticmethod
+    def _service(services, snapshot):
+        datetime_converter = MagicMock(now_utc=MagicMock(return_value=NOW))
+        service_repository = AsyncMock()
+        service_repository.find_all.side_effect = lambda: list(services)
+        service_access_validator = AsyncMock()
+        service_access_validator.load_entitlements.return_value = snapshot
+        return EntitlementClaimService(
+            service_repository=service_repository,
+            service_access_validator=service_access_validator,
+            datetime_converter=datetime_converter,
+            registry_cache=TtlCache(max_entries=1, datetime_converter=datetime_converter),
+        )
+
+    @pytest.mark.asyncio
+    async def test_known_services_are_served_from_the_cached_registry(self):
+        user_id = uuid4()
+        snapshot = EntitlementSnapshot.build(user_id, [_service_access(user_id, "ocr")], _user_plan(None))
+        service = self._service([_service("ocr", 0), _service("tts", 1)], snapshot)
+
+        first = await service.claims_for(user_id)
+        second = await service.claims_for(user_id)
+
+        assert first == second
+        service.service_repository.find_all.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_service_refreshes_the_cached_registry(self):
+        user_id = uuid4()
+        services = [_service("ocr", 0), _service("tts", 1)]
+        snapshot = EntitlementSnapshot.build(user_id, [_service_access(user_id, "vision")], _user_plan(None))
+        service = self._service(services, snapshot)
+        await service.registry()
+
+        services.append(_service("vision", 2))
+        claim = (await service.claims_for(user_id))[EntitlementClaim.CLAIM]
+        registry = await service.registry()
+
+        assert registry.services == ("ocr", "tts", "vision")
+        assert claim["v"] == registry.version
+        assert Entitlements.decode({EntitlementClaim.CLAIM: claim}, _client_registry(registry)).allows(
+            "vision", NOW.timestamp
+        ) is True
+        assert service.service_repository.find_all.await_count == 2
@@ -0,0 +1,216 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from app.application.service.ServiceAccessValidationService import ServiceAccessValidationService
+from app.domain.authorization.EntitlementSnapshot import EntitlementSnapshot
+from app.domain.authorization.ServiceAccess import ServiceAccess
+from app.infrastructure.adapter.output.cache.RedisEntitlementCache import RedisEntitlementCache
+from app.infrastructure.adapter.output.database.repositories.ServiceAccessRepository import ServiceAccessRepository
+from app.infrastructure.config.database.DatabaseSession import run_after_commit, run_after_rollback
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.infrastructure.config.EnvConfig import RedisConfig
+from app.shared.DateTime import DateTimeConverter
+
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _service_access(user_id, service_name, allowed_features=None, revoked=False):
+    return ServiceAccess(
+        id=uuid4(),
+        user_id=user_id,
+        service_name=service_name,
+        is_allowed=not revoked,
+        allowed_features=allowed_features,
+        granted_at=NOW,
+        revoked_at=NOW if revoked else None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def _user_plan(expires_at):
+    user_plan = MagicMock()
+    user_plan.expires_at = expires_at
+    return user_plan
+
+
+@pytest.fixture
+def dependencies():
+    datetime_converter = MagicMock()
+    datetime_converter.now_utc.return_value = NOW
+    entitlement_cache = AsyncMock()
+    entitlement_cache.get.return_value = None
+    entitlement_cache.generation.return_value = 0
+    return {
+        'service_access_repository': AsyncMock(),
+        'user_plan_repository': AsyncMock(),
+        'datetime_converter': datetime_converter,
+        'entitlement_cache': entitlement_cache,
+    }
+
+
+class TestEntitlementSnapshot:
+    def test_build_keeps_revoked_services_as_inactive(self):
+        user_id = uuid4()
+        snapshot = EntitlementSnapshot.build(
+            user_id,
+            [_service_access(user_id, "ocr", ["scan"]), _service_access(user_id, "tts", revoked=True)],
+            _user_plan(NOW + timedelta(days=1)),
+        )
+
+        assert snapshot.entitlement_for("ocr").has_feature("scan") is True
+        assert snapshot.entitlement_for("ocr").has_feature("translate") is False
+        assert snapshot.entitlement_for("tts").is_active is False
+        assert snapshot.entitlement_for("stt") is None
+
+    def test_plan_expiry_is_evaluated_against_current_time(self):
+        snapshot = EntitlementSnapshot.build(uuid4(), [], _user_plan(NOW + timedelta(hours=1)))
+
+        assert snapshot.plan_is_active(NOW) is True
+        assert snapshot.plan_is_active(NOW + timedelta(hours=1)) is False
+
+    def test_snapshot_without_plan_is_inactive(self):
+        snapshot = EntitlementSnapshot.build(uuid4(), [], None)
+
+        assert snapshot.plan_is_active(NOW) is False
+
+
+class TestServiceAccessValidationWithSnapshot:
+
+    @pytest.mark.asyncio
+    async def test_builds_and_caches_snapshot_on_miss(self, dependencies):
+        user_id = uuid4()
+        dependencies['service_access_repository'].find_all_by_user.return_value = [
+            _service_access(user_id, "ocr", ["translate", "scan"])
+        ]
+        dependencies['user_plan_repository'].find_active_by_user.return_value = _user_plan(None)
+        service = ServiceAccessValidationService(**dependencies)
+
+        result = await service.execute(user_id, "ocr")
+
+        assert result.is_allowed is True
+        assert result.allowed_features == ["scan", "translate"]
+        dependencies['service_access_repository'].find_all_by_user.assert_awaited_once_with(
+            user_id, include_revoked=True
+        )
+        dependencies['entitlement_cache'].fill.assert_awaited_once()
+        assert dependencies['entitlement_cache'].fill.await_args.args[1] == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_generation_skips_the_fill(self, dependencies):
+        user_id = uuid4()
+        dependencies['service_access_repository'].find_all_by_user.return_value = [_service_access(user_id, "ocr")]
+        dependencies['user_plan_repository'].find_active_by_user.return_value = _user_plan(None)
+        dependencies['entitlement_cache'].generation.return_value = None
+        service = ServiceAccessValidationService(**dependencies)
+
+        result = await service.execute(user_id, "ocr")
+
+        assert result.is_allowed is True
+        dependencies['entitlement_cache'].fill.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cached_snapshot_skips_repositories(self, dependencies):
+        user_id = uuid4()
+        dependencies['entitlement_cache'].get.return_value = EntitlementSnapshot.build(
+            user_id, [_service_access(user_id, "ocr", revoked=True)], _user_plan(None)
+        )
+        service = ServiceAccessValidationService(**dependencies)
+
+        result = await service.execute(user_id, "ocr")
+        has_feature = await service.check_feature_access(user_id, "ocr", "scan")
+
+        assert result.is_allowed is False
+        assert result.error_message == "Service access has been revoked or disabled"
+        assert has_feature is False
+        dependencies['service_access_repository'].find_all_by_user.assert_not_called()
+        dependencies['user_plan_repository'].find_active_by_user.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_plan_is_denied(self, dependencies):
+        user_id = uuid4()
+        dependencies['entitlement_cache'].get.return_value = EntitlementSnapshot.build(
+            user_id, [_service_access(user_id, "ocr")], None
+        )
+        service = ServiceAccessValidationService(**dependencies)
+
+        result = await service.execute(user_id, "ocr")
+
+        assert result.is_allowed is False
+        assert result.error_message == "User has no active plan"
+
+
+class TestEntitlementInvalidation:
+
+    @staticmethod
+    def _revoke_session(user_id):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [user_id]
+        session = MagicMock()
+        session.info = {}
+        session.execute = AsyncMock(return_value=result)
+        session.flush = AsyncMock()
+        return session
+
+    @pytest.mark.asyncio
+    async def test_revoke_invalidates_only_after_commit(self, dependencies):
+        user_id = uuid4()
+        session = self._revoke_session(user_id)
+        entitlement_cache = dependencies['entitlement_cache']
+        repository = ServiceAccessRepository(session, dependencies['datetime_converter'], entitlement_cache)
+
+        await repository.revoke(uuid4())
+
+        entitlement_cache.invalidate.assert_not_called()
+        await run_after_commit(session)
+        entitlement_cache.invalidate.assert_awaited_once_with(user_id)
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_revoke_keeps_the_cache(self, dependencies):
+        session = self._revoke_session(uuid4())
+        entitlement_cache = dependencies['entitlement_cache']
+        repository = ServiceAccessRepository(session, dependencies['datetime_converter'], entitlement_cache)
+
+        await repository.revoke(uuid4())
+        await run_after_rollback(session)
+        await run_after_commit(session)
+
+        entitlement_cache.invalidate.assert_not_called()
+
+
+class TestRedisEntitlementCacheFill:
+
+    @pytest.fixture
+    def cache(self):
+        redis_client = RedisClient(
+            RedisConfig(url="redis://localhost:6379/0", pool_size=1, max_connections=1, decode_responses=True)
+        )
+        redis_client._client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        return RedisEntitlementCache(redis_client, DateTimeConverter(), MagicMock(), ttl_seconds=300)
+
+    @pytest.mark.asyncio
+    async def test_fill_lands_when_nothing_was_invalidated(self, cache):
+        user_id = uuid4()
+        snapshot = EntitlementSnapshot.build(user_id, [_service_access(user_id, "ocr")], None)
+
+        await cache.fill(snapshot, await cache.generation(user_id))
+
+        assert (await cache.get(user_id)).entitlement_for("ocr").is_active is True
+
+    @pytest.mark.asyncio
+    async def test_fill_read_before_invalidation_is_dropped(self, cache):
+        user_id = uuid4()
+        generation = await cache.generation(user_id)
+        stale = EntitlementSnapshot.build(user_id, [_service_access(user_id, "ocr")], None)
+
+        await cache.invalidate(user_id)
+        await cache.fill(stale, generation)
+
+        assert await cache.get(user_id) is None
+        await cache.fill(stale, await cache.generation(user_id))
+        assert await cache.get(user_id) is not None
@@ -85,6 +85,7 @@ class TestEnvConfigValidation:
         assert "redis://" in config.redis.url
         assert config.redis.pool_size == 10
         assert config.redis.max_connections == 50
+        assert config.redis.stream_max_connections == 20
 
     def test_auth_config_defaults(self, monkeypatch):
         monkeypatch.setenv("JWT_SECRET", "test-secret")
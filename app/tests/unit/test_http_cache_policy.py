@@ -0,0 +1,50 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.shared.DateTime import DateTimeConverter
+from app.shared.HttpCachePolicy import HttpCachePolicy
+
+
+class FixedDateTime(DateTimeConverter):
+    def __init__(self, now: datetime):
+        self._now = now
+
+    def now_utc(self) -> datetime:
+        return self._now
+
+
+@pytest.fixture
+def now():
+    return datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def policy(now):
+    return HttpCachePolicy(tolerance_seconds=60, datetime_converter=FixedDateTime(now))
+
+
+class TestHttpCachePolicy:
+    def test_max_age_is_capped_by_tolerance(self, policy, now):
+        assert policy.max_age(now + timedelta(hours=1)) == 60
+
+    def test_max_age_follows_remaining_token_lifetime(self, policy, now):
+        assert policy.max_age(now + timedelta(seconds=20)) == 20
+
+    def test_expired_or_unknown_lifetime_is_not_cached(self, policy, now):
+        assert policy.max_age(now - timedelta(seconds=5)) == 0
+        assert policy.max_age(None) == 0
+        assert policy.cache_control(0) == "no-cache"
+
+    def test_cache_control_scope(self, policy):
+        assert policy.cache_control(30) == "private, max-age=30"
+        assert policy.cache_control(30, shared=True) == "max-age=30, s-maxage=30"
+
+    def test_etag_matches_conditional_request(self, policy):
+        etag = policy.etag(b'{"is_valid":true}')
+
+        assert policy.matches(f'"other", {etag}', etag) is True
+        assert policy.matches(etag.removeprefix("W/"), etag) is True
+        assert policy.matches("*", etag) is True
+        assert policy.matches('"other"', etag) is False
+        assert policy.matches(None, etag) is False
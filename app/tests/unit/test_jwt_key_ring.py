@@ -0,0 +1,168 @@
+from datetime import timedelta
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+
+from app.domain.exceptions import TokenInvalidException, TokenSignatureInvalidException
+from app.shared.DateTime import DateTimeConverter
+from app.shared.JwtKeyRing import JwtKeyRing
+from app.shared.TokenGenerator import JwtTokenGenerator
+
+
+SECRET = "legacy-hs256-secret-used-before-key-rotation"
+
+
+def _write_private(directory, kid, private_key):
+    (directory / f"{kid}.pem").write_bytes(
+        private_key.private_bytes(Encoding.PEM, PrivateFormat.PKCS8, NoEncryption())
+    )
+
+
+def _write_public(directory, kid, private_key):
+    (directory / f"{kid}.pub.pem").write_bytes(
+        private_key.public_key().public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo)
+    )
+
+
+def _generator(key_ring, accept_legacy_tokens=True):
+    return JwtTokenGenerator(
+        secret_key=SECRET,
+        datetime_converter=DateTimeConverter(),
+        key_ring=key_ring,
+        accept_legacy_tokens=accept_legacy_tokens,
+    )
+
+
+@pytest.fixture
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+class TestJwtKeyRingLoading:
+    def test_loads_supported_key_types(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "rsa", rsa_key)
+        _write_private(tmp_path, "p256", ec.generate_private_key(ec.SECP256R1()))
+        _write_private(tmp_path, "p384", ec.generate_private_key(ec.SECP384R1()))
+        _write_private(tmp_path, "ed", ed25519.Ed25519PrivateKey.generate())
+
+        key_ring = JwtKeyRing.from_directory(str(tmp_path), active_kid="rsa")
+
+        assert key_ring.signing_key().algorithm == "RS256"
+        assert key_ring.verification_key("p256").algorithm == "ES256"
+        assert key_ring.verification_key("p384").algorithm == "ES384"
+        assert key_ring.verification_key("ed").algorithm == "EdDSA"
+
+    def test_public_only_key_verifies_but_cannot_sign(self, tmp_path, rsa_key):
+        retired = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        _write_private(tmp_path, "current", rsa_key)
+        _write_public(tmp_path, "retired", retired)
+
+        key_ring = JwtKeyRing.from_directory(str(tmp_path), active_kid="current")
+
+        assert key_ring.verification_key("retired").can_sign() is False
+        with pytest.raises(ValueError):
+            JwtKeyRing.from_directory(str(tmp_path), active_kid="retired")
+
+    def test_private_key_wins_over_its_public_file(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "current", rsa_key)
+        _write_public(tmp_path, "current", rsa_key)
+
+        key_ring = JwtKeyRing.from_directory(str(tmp_path), active_kid="current")
+
+        assert key_ring.signing_key().can_sign() is True
+        assert len(key_ring.jwks()["keys"]) == 1
+
+    def test_unsupported_curve_is_rejected(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "current", rsa_key)
+        _write_private(tmp_path, "k1", ec.generate_private_key(ec.SECP256K1()))
+
+        with pytest.raises(ValueError, match="secp256k1"):
+            JwtKeyRing.from_directory(str(tmp_path), active_kid="current")
+
+    def test_unknown_active_kid_is_rejected(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "current", rsa_key)
+
+        with pytest.raises(ValueError):
+            JwtKeyRing.from_directory(str(tmp_path), active_kid="missing")
+
+
+class TestJwtKeyRingTokens:
+    def test_tokens_carry_the_active_kid_and_verify(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "current", rsa_key)
+        generator = _generator(JwtKeyRing.from_directory(str(tmp_path), active_kid="current"))
+
+        token = generator.generate({"sub": "user"}, timedelta(minutes=5))
+
+        assert jwt.get_unverified_header(token) == {"alg": "RS256", "kid": "current", "typ": "JWT"}
+        assert generator.decode(token)["sub"] == "user"
+
+    def test_rotation_keeps_tokens_from_the_retired_key_valid(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "old", rsa_key)
+        old_token = _generator(JwtKeyRing.from_directory(str(tmp_path), active_kid="old")).generate({"sub": "user"})
+
+        (tmp_path / "old.pem").unlink()
+        _write_public(tmp_path, "old", rsa_key)
+        _write_private(tmp_path, "new", ec.generate_private_key(ec.SECP256R1()))
+        generator = _generator(JwtKeyRing.from_directory(str(tmp_path), active_kid="new"))
+        new_token = generator.generate({"sub": "user"})
+
+        assert jwt.get_unverified_header(new_token)["kid"] == "new"
+        assert generator.decode(old_token)["sub"] == "user"
+        assert generator.decode(new_token)["sub"] == "user"
+
+    def test_unknown_kid_is_rejected(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "current", rsa_key)
+        generator = _generator(JwtKeyRing.from_directory(str(tmp_path), active_kid="current"))
+        token = jwt.encode({"sub": "user"}, rsa_key, algorithm="RS256", headers={"kid": "other"})
+
+        with pytest.raises(TokenSignatureInvalidException):
+            generator.decode(token)
+
+    def test_legacy_tokens_follow_the_config_flag(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "current", rsa_key)
+        key_ring = JwtKeyRing.from_directory(str(tmp_path), active_kid="current")
+        legacy_token = JwtTokenGenerator(SECRET, DateTimeConverter()).generate({"sub": "user"})
+
+        assert _generator(key_ring).decode(legacy_token)["sub"] == "user"
+        with pytest.raises(TokenSignatureInvalidException):
+            _generator(key_ring, accept_legacy_tokens=False).decode(legacy_token)
+
+    def test_hs_token_cannot_claim_a_ring_kid(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "current", rsa_key)
+        generator = _generator(JwtKeyRing.from_directory(str(tmp_path), active_kid="current"))
+        token = jwt.encode({"sub": "user"}, SECRET, algorithm="HS256", headers={"kid": "current"})
+
+        with pytest.raises(TokenInvalidException):
+            generator.decode(token)
+
+
+class TestJwks:
+    def test_publishes_every_public_key_without_private_material(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "rsa", rsa_key)
+        _write_private(tmp_path, "p256", ec.generate_private_key(ec.SECP256R1()))
+        _write_public(tmp_path, "ed", ed25519.Ed25519PrivateKey.generate())
+
+        keys = {jwk["kid"]: jwk for jwk in JwtKeyRing.from_directory(str(tmp_path), active_kid="rsa").jwks()["keys"]}
+
+        assert {kid: (jwk["kty"], jwk["alg"], jwk["use"]) for kid, jwk in keys.items()} == {
+            "rsa": ("RSA", "RS256", "sig"),
+            "p256": ("EC", "ES256", "sig"),
+            "ed": ("OKP", "EdDSA", "sig"),
+        }
+        assert all("d" not in jwk for jwk in keys.values())
+
+    def test_published_key_verifies_issued_tokens(self, tmp_path, rsa_key):
+        _write_private(tmp_path, "current", rsa_key)
+        key_ring = JwtKeyRing.from_directory(str(tmp_path), active_kid="current")
+        token = _generator(key_ring).generate({"sub": "user"})
+
+        public_key = jwt.PyJWK.from_dict(key_ring.jwks()["keys"][0])
+
+        assert jwt.decode(token, public_key, algorithms=["RS256"])["sub"] == "user"
@@ -0,0 +1,130 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.dto.ServiceAccessDTO import ServiceAccessResult
+from app.application.service.QuotaManagementService import QuotaManagementService
+from app.domain.exceptions import AccessDeniedException, InsufficientQuotaException
+from app.domain.service.QuotaCharge import QuotaCharge
+from app.domain.service.QuotaConsumption import QuotaConsumption
+from app.domain.service.QuotaCounter import QuotaCounterBatchResult
+from app.domain.ValueObjects import QuotaCounterOutcome
+
+
+CHARGES = [
+    QuotaCharge(service_name="ocr", quota_type="api_calls_per_day", amount=1),
+    QuotaCharge(service_name="ocr", quota_type="storage_mb", amount=20),
+    QuotaCharge(service_name="export", quota_type="exports_per_day", amount=1),
+]
+
+
+@pytest.fixture
+def charge_counter(counter_factory):
+    def build(user_id, charge, current_usage, limit=100):
+        return counter_factory(user_id, current_usage, limit, charge.service_name, charge.quota_type)
+    return build
+
+
+class TestQuotaCharge:
+    def test_combine_sums_repeated_quotas_in_first_seen_order(self):
+        combined = QuotaCharge.combine([CHARGES[0], CHARGES[1], CHARGES[0]])
+
+        assert combined == [
+            QuotaCharge(service_name="ocr", quota_type="api_calls_per_day", amount=2),
+            QuotaCharge(service_name="ocr", quota_type="storage_mb", amount=20),
+        ]
+
+
+class TestQuotaBatchConsume:
+
+    @pytest.mark.asyncio
+    async def test_denied_service_rejects_whole_batch(self, dependencies):
+        dependencies['service_access_validator'].execute_bulk.side_effect = None
+        dependencies['service_access_validator'].execute_bulk.return_value = {
+            "ocr": ServiceAccessResult(is_allowed=True),
+            "export": ServiceAccessResult(is_allowed=False),
+        }
+        service = QuotaManagementService(**dependencies)
+
+        with pytest.raises(AccessDeniedException):
+            await service.consume_many(uuid4(), CHARGES)
+
+        dependencies['quota_repository'].consume_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_database_batch_returns_result_per_charge(self, dependencies, quota_factory):
+        user_id = uuid4()
+        dependencies['quota_repository'].consume_many.return_value = [
+            QuotaConsumption(quota=quota_factory(user_id, 2, limit=100), consumed=True),
+            QuotaConsumption(
+                quota=quota_factory(user_id, 20, limit=100, quota_type="storage_mb"), consumed=True, created=True
+            ),
+        ]
+        service = QuotaManagementService(**dependencies)
+
+        results = await service.consume_many(user_id, [CHARGES[0], CHARGES[1], CHARGES[0]])
+
+        assert [result.current_usage for result in results] == [2, 20, 2]
+        combined = dependencies['quota_repository'].consume_many.await_args.args[1]
+        assert [charge.amount for charge in combined] == [2, 20]
+        assert dependencies['transaction_logger'].log_database_transaction.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_database_batch_rejection_raises_for_exhausted_quota(self, dependencies, quota_factory):
+        user_id = uuid4()
+        dependencies['quota_repository'].consume_many.return_value = [
+            QuotaConsumption(quota=quota_factory(user_id, 1, limit=100), consumed=False),
+            QuotaConsumption(quota=quota_factory(user_id, 90, limit=100, quota_type="storage_mb"), consumed=False),
+            QuotaConsumption(
+                quota=quota_factory(user_id, 0, limit=100, service_name="export", quota_type="exports_per_day"),
+                consumed=False,
+            ),
+        ]
+        service = QuotaManagementService(**dependencies)
+
+        with pytest.raises(InsufficientQuotaException) as exc_info:
+            await service.consume_many(user_id, CHARGES)
+
+        assert exc_info.value.details["quota_type"] == "storage_mb"
+        dependencies['transaction_logger'].log_database_transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_counter_store_seeds_missing_counters_and_retries(self, dependencies, quota_factory, charge_counter):
+        user_id = uuid4()
+        counter_store = AsyncMock()
+        counter_store.apply_many.side_effect = [
+            QuotaCounterBatchResult(outcome=QuotaCounterOutcome.NOT_LOADED, missing=[CHARGES[2]]),
+            QuotaCounterBatchResult(
+                outcome=QuotaCounterOutcome.ACCEPTED,
+                counters=[charge_counter(user_id, charge, 5) for charge in CHARGES],
+            ),
+        ]
+        seed = quota_factory(user_id, 4, limit=100, service_name="export", quota_type="exports_per_day")
+        dependencies['quota_repository'].find_by_user_and_service.return_value = seed
+        service = QuotaManagementService(**dependencies, quota_counter_store=counter_store)
+
+        results = await service.consume_many(user_id, CHARGES)
+
+        assert [result.current_usage for result in results] == [5, 5, 5]
+        assert counter_store.apply_many.await_args_list[1].kwargs['seeds'] == {("export", "exports_per_day"): seed}
+        dependencies['quota_repository'].consume_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_counter_store_rejection_raises(self, dependencies, charge_counter):
+        user_id = uuid4()
+        counter_store = AsyncMock()
+        counter_store.apply_many.return_value = QuotaCounterBatchResult(
+            outcome=QuotaCounterOutcome.EXCEEDED,
+            counters=[
+                charge_counter(user_id, CHARGES[0], 5),
+                charge_counter(user_id, CHARGES[1], 5),
+                charge_counter(user_id, CHARGES[2], 1, limit=1),
+            ],
+        )
+        service = QuotaManagementService(**dependencies, quota_counter_store=counter_store)
+
+        with pytest.raises(InsufficientQuotaException) as exc_info:
+            await service.consume_many(user_id, CHARGES)
+
+        assert exc_info.value.details["quota_type"] == "exports_per_day"
@@ -0,0 +1,62 @@
+from uuid import uuid4
+
+import pytest
+
+from app.application.service.QuotaManagementService import QuotaManagementService
+from app.domain.exceptions import InsufficientQuotaException
+from app.domain.service.QuotaConsumption import QuotaConsumption
+from app.domain.ValueObjects import DatabaseOperation
+
+
+def _logged_operations(transaction_logger):
+    return [call.args[0].operation for call in transaction_logger.log_database_transaction.await_args_list]
+
+
+class TestQuotaConsumeInPostgres:
+
+    @pytest.mark.asyncio
+    async def test_consume_returns_usage_from_upserted_row(self, dependencies, quota_factory, now):
+        user_id = uuid4()
+        dependencies['quota_repository'].consume.return_value = QuotaConsumption(
+            quota=quota_factory(user_id, current_usage=4), consumed=True
+        )
+        service = QuotaManagementService(**dependencies)
+
+        result = await service.consume(user_id, "ocr", "api_calls_per_day", 2)
+
+        assert result.can_proceed is True
+        assert result.current_usage == 4
+        assert result.remaining == 6
+        dependencies['quota_repository'].consume.assert_awaited_once_with(
+            user_id, "ocr", "api_calls_per_day", 2, now, dependencies['quota_defaults']
+        )
+        dependencies['quota_repository'].find_by_user_and_service.assert_not_called()
+        assert _logged_operations(dependencies['transaction_logger']) == [DatabaseOperation.UPDATE]
+
+    @pytest.mark.asyncio
+    async def test_created_quota_is_logged_as_insert(self, dependencies, quota_factory):
+        user_id = uuid4()
+        dependencies['quota_repository'].consume.return_value = QuotaConsumption(
+            quota=quota_factory(user_id, current_usage=1), consumed=True, created=True
+        )
+        service = QuotaManagementService(**dependencies)
+
+        await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+
+        assert _logged_operations(dependencies['transaction_logger']) == [
+            DatabaseOperation.INSERT,
+            DatabaseOperation.UPDATE,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rejected_consumption_raises_without_usage_log(self, dependencies, quota_factory):
+        user_id = uuid4()
+        dependencies['quota_repository'].consume.return_value = QuotaConsumption(
+            quota=quota_factory(user_id, current_usage=10), consumed=False
+        )
+        service = QuotaManagementService(**dependencies)
+
+        with pytest.raises(InsufficientQuotaException):
+            await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+
+        dependencies['transaction_logger'].log_database_transaction.assert_not_called()
@@ -0,0 +1,196 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.service.QuotaManagementService import QuotaManagementService
+from app.application.service.QuotaWriteBackService import QuotaWriteBackService
+from app.domain.exceptions import InsufficientQuotaException
+from app.domain.service.QuotaConsumption import QuotaConsumption
+from app.domain.service.QuotaCounter import QuotaCounterResult
+from app.domain.ValueObjects import DatabaseOperation, QuotaCounterOutcome
+from app.infrastructure.adapter.input.worker.QuotaWriteBackWorker import QuotaWriteBackWorker
+
+
+@pytest.fixture
+def dependencies(dependencies):
+    return {**dependencies, 'quota_counter_store': AsyncMock()}
+
+
+class TestQuotaManagementWithCounterStore:
+
+    @pytest.mark.asyncio
+    async def test_consume_is_answered_by_counter_store(self, dependencies, counter_factory):
+        user_id = uuid4()
+        dependencies['quota_counter_store'].apply.return_value = QuotaCounterResult(
+            outcome=QuotaCounterOutcome.ACCEPTED, counter=counter_factory(user_id, 3)
+        )
+        service = QuotaManagementService(**dependencies)
+
+        result = await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+
+        assert result.can_proceed is True
+        assert result.remaining == 7
+        dependencies['quota_repository'].find_by_user_and_service.assert_not_called()
+        dependencies['quota_repository'].consume.assert_not_called()
+        dependencies['transaction_logger'].log_database_transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_counter_is_seeded_from_database_on_first_use(self, dependencies, quota_factory, counter_factory):
+        user_id = uuid4()
+        quota = quota_factory(user_id, current_usage=4)
+        dependencies['quota_repository'].find_by_user_and_service.return_value = quota
+        dependencies['quota_counter_store'].apply.side_effect = [
+            QuotaCounterResult.not_loaded(),
+            QuotaCounterResult(outcome=QuotaCounterOutcome.ACCEPTED, counter=counter_factory(user_id, 5)),
+        ]
+        service = QuotaManagementService(**dependencies)
+
+        await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+
+        assert dependencies['quota_counter_store'].apply.await_args_list[1].kwargs['seed'] == quota
+
+    @pytest.mark.asyncio
+    async def test_first_use_seeds_a_virtual_quota_without_inserting(self, dependencies, counter_factory):
+        user_id = uuid4()
+        dependencies['quota_repository'].find_by_user_and_service.return_value = None
+        dependencies['user_plan_repository'].find_active_by_user.return_value = None
+        dependencies['quota_counter_store'].apply.side_effect = [
+            QuotaCounterResult.not_loaded(),
+            QuotaCounterResult(outcome=QuotaCounterOutcome.EXCEEDED, counter=counter_factory(user_id, 0, limit=1)),
+        ]
+        service = QuotaManagementService(**dependencies)
+
+        with pytest.raises(InsufficientQuotaException):
+            await service.consume(user_id, "ocr", "api_calls_per_day", 2)
+
+        seed = dependencies['quota_counter_store'].apply.await_args_list[1].kwargs['seed']
+        assert (seed.current_usage, seed.limit) == (0, 1)
+        dependencies['quota_repository'].save.assert_not_called()
+        dependencies['transaction_logger'].log_database_transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_exceeded_counter_raises(self, dependencies, counter_factory):
+        user_id = uuid4()
+        dependencies['quota_counter_store'].apply.return_value = QuotaCounterResult(
+            outcome=QuotaCounterOutcome.EXCEEDED, counter=counter_factory(user_id, 10)
+        )
+        service = QuotaManagementService(**dependencies)
+
+        with pytest.raises(InsufficientQuotaException):
+            await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+
+    @pytest.mark.asyncio
+    async def test_unavailable_counter_store_falls_back_to_database(self, dependencies, quota_factory):
+        user_id = uuid4()
+        dependencies['quota_counter_store'].apply.return_value = QuotaCounterResult.unavailable()
+        dependencies['quota_repository'].consume.return_value = QuotaConsumption(
+            quota=quota_factory(user_id, current_usage=1), consumed=True
+        )
+        service = QuotaManagementService(**dependencies)
+
+        result = await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+
+        assert result.can_proceed is True
+        dependencies['quota_repository'].consume.assert_awaited_once()
+
+
+    @pytest.mark.asyncio
+    async def test_check_on_unloaded_counter_reads_without_creating_quota(self, dependencies):
+        user_id = uuid4()
+        dependencies['quota_counter_store'].apply.return_value = QuotaCounterResult.not_loaded()
+        dependencies['quota_repository'].find_by_user_and_service.return_value = None
+        dependencies['user_plan_repository'].find_active_by_user.return_value = None
+        service = QuotaManagementService(**dependencies)
+
+        result = await service.execute(user_id, "ocr", "api_calls_per_day", 1)
+
+        assert result.can_proceed is True
+        assert result.limit == 1
+        dependencies['quota_counter_store'].apply.assert_awaited_once()
+        dependencies['quota_repository'].save.assert_not_called()
+        dependencies['transaction_logger'].log_database_transaction.assert_not_called()
+
+
+class TestQuotaWriteBackWorker:
+
+    @staticmethod
+    def _worker(counter_store, write_back_service):
+        @asynccontextmanager
+        async def session_factory():
+            yield MagicMock()
+
+        return QuotaWriteBackWorker(
+            counter_store=counter_store,
+            session_factory=session_factory,
+            service_factory=lambda session: write_back_service,
+            logger=MagicMock(),
+            interval_seconds=1.0,
+            batch_size=10,
+        )
+
+    @pytest.mark.asyncio
+    async def test_flushed_counters_are_not_requeued(self, counter_factory):
+        counters = [counter_factory(uuid4(), 3)]
+        counter_store = AsyncMock()
+        counter_store.drain.return_value = counters
+        write_back_service = AsyncMock()
+
+        flushed = await self._worker(counter_store, write_back_service).flush()
+
+        assert flushed == 1
+        write_back_service.execute.assert_awaited_once_with(counters)
+        counter_store.requeue.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_back_requeues_counters(self, counter_factory):
+        counters = [counter_factory(uuid4(), 3)]
+        counter_store = AsyncMock()
+        counter_store.drain.return_value = counters
+        write_back_service = AsyncMock()
+        write_back_service.execute.side_effect = RuntimeError("database unavailable")
+
+        flushed = await self._worker(counter_store, write_back_service).flush()
+
+        assert flushed == 0
+        counter_store.requeue.assert_awaited_once_with(counters)
+
+
+class TestQuotaWriteBackService:
+
+    @staticmethod
+    def _service(dependencies, logger):
+        logger.bind.return_value = logger
+        return QuotaWriteBackService(
+            quota_repository=dependencies['quota_repository'],
+            transaction_logger=dependencies['transaction_logger'],
+            datetime_converter=dependencies['datetime_converter'],
+            uuid_generator=dependencies['uuid_generator'],
+            logger=logger,
+        )
+
+    @pytest.mark.asyncio
+    async def test_created_row_is_audited_as_insert_then_update(self, dependencies, quota_factory, counter_factory):
+        user_id = uuid4()
+        counter = counter_factory(user_id, 0)
+        dependencies['quota_repository'].write_back.return_value = [
+            QuotaConsumption(quota=quota_factory(user_id, current_usage=3), consumed=True, created=True)
+        ]
+
+        await self._service(dependencies, MagicMock()).execute([counter])
+
+        logged = dependencies['transaction_logger'].log_database_transaction.await_args_list
+        assert [call.args[0].operation for call in logged] == [DatabaseOperation.INSERT, DatabaseOperation.UPDATE]
+
+    @pytest.mark.asyncio
+    async def test_counter_without_a_row_is_reported(self, dependencies, counter_factory):
+        counter = counter_factory(uuid4(), 0)
+        dependencies['quota_repository'].write_back.return_value = []
+        logger = MagicMock()
+
+        await self._service(dependencies, logger).execute([counter])
+
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.args == ("quota_write_back_row_missing",)
+        dependencies['transaction_logger'].log_database_transaction.assert_not_called()
@@ -1,4 +1,4 @@
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 
 import pytest
 
@@ -81,6 +81,20 @@ class TestQuotaDefaults:
 
         assert result == timedelta(days=30)
 
+    def test_next_reset_at_is_aligned_to_window_boundary(self):
+        quota_defaults = QuotaDefaults.default()
+
+        result = quota_defaults.next_reset_at(datetime(2026, 3, 14, 15, 9, tzinfo=UTC))
+
+        assert result == datetime(2026, 3, 15, tzinfo=UTC)
+
+    def test_next_reset_at_on_boundary_starts_next_window(self):
+        quota_defaults = QuotaDefaults.default()
+
+        result = quota_defaults.next_reset_at(datetime(2026, 3, 15, tzinfo=UTC))
+
+        assert result == datetime(2026, 3, 16, tzinfo=UTC)
+
     def test_multiple_instances_independent(self):
         default_1 = QuotaDefaults.default()
         default_2 = QuotaDefaults.from_config(
@@ -0,0 +1,140 @@
+from dataclasses import asdict
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.dto.QuotaCheckDTO import QuotaCheckResult
+from app.application.service.QuotaManagementService import QuotaManagementService
+from app.domain.exceptions import (
+    IdempotencyKeyInProgressException,
+    IdempotencyKeyReusedException,
+    InsufficientQuotaException,
+)
+from app.domain.service.IdempotencyClaim import IdempotencyClaim
+from app.domain.service.QuotaConsumption import QuotaConsumption
+from app.infrastructure.adapter.output.database.DatabaseTransactionHooks import DatabaseTransactionHooks
+from app.infrastructure.config.database.DatabaseSession import run_after_commit, run_after_rollback
+
+
+@pytest.fixture
+def dependencies(dependencies):
+    return {**dependencies, 'idempotency_store': AsyncMock()}
+
+
+class TestIdempotentQuotaConsume:
+
+    @pytest.mark.asyncio
+    async def test_first_request_stores_outcome(self, dependencies, quota_factory):
+        user_id = uuid4()
+        dependencies['idempotency_store'].claim.return_value = IdempotencyClaim.claimed()
+        dependencies['quota_repository'].consume.return_value = QuotaConsumption(
+            quota=quota_factory(user_id, current_usage=3), consumed=True
+        )
+        service = QuotaManagementService(**dependencies)
+
+        result = await service.consume(user_id, "ocr", "api_calls_per_day", 1, idempotency_key="retry-1")
+
+        dependencies['idempotency_store'].claim.assert_awaited_once_with(
+            f"quota_consume:{user_id}:retry-1", "ocr:api_calls_per_day:1"
+        )
+        dependencies['idempotency_store'].complete.assert_awaited_once_with(
+            f"quota_consume:{user_id}:retry-1", "ocr:api_calls_per_day:1", {"result": asdict(result)}
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_replays_stored_result_without_consuming(self, dependencies):
+        stored = QuotaCheckResult(can_proceed=True, current_usage=3, limit=10, remaining=7, reset_at="2026-01-02")
+        dependencies['idempotency_store'].claim.return_value = IdempotencyClaim.completed({"result": asdict(stored)})
+        service = QuotaManagementService(**dependencies)
+
+        result = await service.consume(uuid4(), "ocr", "api_calls_per_day", 1, idempotency_key="retry-1")
+
+        assert result == stored
+        dependencies['service_access_validator'].execute.assert_not_called()
+        dependencies['quota_repository'].consume.assert_not_called()
+        dependencies['transaction_logger'].log_database_transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejection_is_stored_and_replayed(self, dependencies, quota_factory):
+        user_id = uuid4()
+        dependencies['idempotency_store'].claim.return_value = IdempotencyClaim.claimed()
+        dependencies['quota_repository'].consume.return_value = QuotaConsumption(
+            quota=quota_factory(user_id, current_usage=10), consumed=False
+        )
+        service = QuotaManagementService(**dependencies)
+
+        with pytest.raises(InsufficientQuotaException):
+            await service.consume(user_id, "ocr", "api_calls_per_day", 1, idempotency_key="retry-1")
+
+        outcome = dependencies['idempotency_store'].complete.await_args.args[2]
+        dependencies['idempotency_store'].claim.return_value = IdempotencyClaim.completed(outcome)
+
+        with pytest.raises(InsufficientQuotaException) as exc_info:
+            await service.consume(user_id, "ocr", "api_calls_per_day", 1, idempotency_key="retry-1")
+
+        assert exc_info.value.details == {"quota_type": "api_calls_per_day", "current": 10, "required": 1}
+        dependencies['quota_repository'].consume.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_request_in_flight_conflicts(self, dependencies):
+        dependencies['idempotency_store'].claim.return_value = IdempotencyClaim.in_progress()
+        service = QuotaManagementService(**dependencies)
+
+        with pytest.raises(IdempotencyKeyInProgressException):
+            await service.consume(uuid4(), "ocr", "api_calls_per_day", 1, idempotency_key="retry-1")
+
+    @pytest.mark.asyncio
+    async def test_key_reused_for_different_request_is_rejected(self, dependencies):
+        dependencies['idempotency_store'].claim.return_value = IdempotencyClaim.mismatch()
+        service = QuotaManagementService(**dependencies)
+
+        with pytest.raises(IdempotencyKeyReusedException):
+            await service.consume(uuid4(), "ocr", "api_calls_per_day", 5, idempotency_key="retry-1")
+
+    @pytest.mark.asyncio
+    async def test_unexpected_failure_releases_key(self, dependencies):
+        dependencies['idempotency_store'].claim.return_value = IdempotencyClaim.claimed()
+        dependencies['quota_repository'].consume.side_effect = RuntimeError("database unavailable")
+        service = QuotaManagementService(**dependencies)
+
+        with pytest.raises(RuntimeError):
+            await service.consume(uuid4(), "ocr", "api_calls_per_day", 1, idempotency_key="retry-1")
+
+        dependencies['idempotency_store'].release.assert_awaited_once()
+        dependencies['idempotency_store'].complete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_outcome_is_stored_only_after_commit(self, dependencies, quota_factory):
+        user_id = uuid4()
+        hooks = DatabaseTransactionHooks(MagicMock(info={}))
+        dependencies['idempotency_store'].claim.return_value = IdempotencyClaim.claimed()
+        dependencies['quota_repository'].consume.return_value = QuotaConsumption(
+            quota=quota_factory(user_id, current_usage=3), consumed=True
+        )
+        service = QuotaManagementService(**dependencies, transaction_hooks=hooks)
+
+        result = await service.consume(user_id, "ocr", "api_calls_per_day", 1, idempotency_key="retry-1")
+
+        dependencies['idempotency_store'].complete.assert_not_called()
+        await run_after_commit(hooks._session)
+        dependencies['idempotency_store'].complete.assert_awaited_once_with(
+            f"quota_consume:{user_id}:retry-1", "ocr:api_calls_per_day:1", {"result": asdict(result)}
+        )
+        dependencies['idempotency_store'].release.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_releases_key(self, dependencies, quota_factory):
+        user_id = uuid4()
+        hooks = DatabaseTransactionHooks(MagicMock(info={}))
+        dependencies['idempotency_store'].claim.return_value = IdempotencyClaim.claimed()
+        dependencies['quota_repository'].consume.return_value = QuotaConsumption(
+            quota=quota_factory(user_id, current_usage=3), consumed=True
+        )
+        service = QuotaManagementService(**dependencies, transaction_hooks=hooks)
+
+        await service.consume(user_id, "ocr", "api_calls_per_day", 1, idempotency_key="retry-1")
+        await run_after_rollback(hooks._session)
+
+        dependencies['idempotency_store'].release.assert_awaited_once_with(f"quota_consume:{user_id}:retry-1")
+        dependencies['idempotency_store'].complete.assert_not_called()
@@ -0,0 +1,145 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.service.QuotaManagementService import QuotaManagementService
+from app.domain.exceptions import InsufficientQuotaException
+from app.domain.service.QuotaCounter import QuotaCounterResult
+from app.domain.ValueObjects import QuotaCounterOutcome
+from app.shared.QuotaLeasePool import QuotaLeasePool
+
+
+@pytest.fixture
+def dependencies(dependencies):
+    return {
+        **dependencies,
+        'quota_counter_store': AsyncMock(),
+        'quota_lease_pool': QuotaLeasePool(lease_ttl_seconds=10, min_block=5, max_block=50),
+    }
+
+
+class TestQuotaLeasePool:
+    def test_rejects_invalid_block_sizes(self):
+        with pytest.raises(ValueError):
+            QuotaLeasePool(lease_ttl_seconds=10, min_block=10, max_block=5)
+
+    def test_lease_is_consumed_locally_until_exhausted(self, counter_factory, now):
+        user_id = uuid4()
+        pool = QuotaLeasePool(lease_ttl_seconds=10, min_block=1, max_block=10)
+        pool.install(counter_factory(user_id, 3), 3, now)
+
+        assert pool.take(user_id, "ocr", "api_calls_per_day", 2, now) is not None
+        assert pool.take(user_id, "ocr", "api_calls_per_day", 2, now) is None
+        assert pool.stats().local_hits == 1
+
+    def test_expired_lease_returns_unused_units(self, counter_factory, now):
+        user_id = uuid4()
+        pool = QuotaLeasePool(lease_ttl_seconds=10, min_block=1, max_block=10)
+        lease = pool.install(counter_factory(user_id, 4), 4, now)
+        lease.take(1, now)
+
+        assert pool.release_expired(now + timedelta(seconds=9)) == []
+        released = pool.release_expired(now + timedelta(seconds=10))
+
+        assert [lease.available() for lease in released] == [3]
+        assert pool.take(user_id, "ocr", "api_calls_per_day", 1, now + timedelta(seconds=10)) is None
+
+    def test_block_size_follows_observed_demand(self, counter_factory, now):
+        user_id = uuid4()
+        pool = QuotaLeasePool(lease_ttl_seconds=10, min_block=2, max_block=40)
+        assert pool.block_size(user_id, "ocr", "api_calls_per_day", 1, now) == 2
+
+        lease = pool.install(counter_factory(user_id, 2), 2, now)
+        lease.take(2, now)
+        pool.install(counter_factory(user_id, 4), 2, now + timedelta(seconds=1))
+
+        assert pool.block_size(user_id, "ocr", "api_calls_per_day", 1, now) == 20
+        assert pool.block_size(user_id, "ocr", "api_calls_per_day", 60, now) == 60
+
+    def test_replaced_lease_is_returned(self, counter_factory, now):
+        user_id = uuid4()
+        pool = QuotaLeasePool(lease_ttl_seconds=10, min_block=1, max_block=10)
+        pool.install(counter_factory(user_id, 5), 5, now)
+        pool.install(counter_factory(user_id, 10), 5, now)
+
+        assert [lease.available() for lease in pool.release_all(now)] == [5, 5]
+
+    def test_retired_lease_is_handed_back_once(self, counter_factory, now):
+        user_id = uuid4()
+        pool = QuotaLeasePool(lease_ttl_seconds=10, min_block=1, max_block=10)
+        lease = pool.install(counter_factory(user_id, 5), 5, now)
+        lease.take(2, now)
+
+        retired = pool.retire(user_id, "ocr", "api_calls_per_day", now)
+
+        assert retired is lease
+        assert retired.available() == 3
+        assert pool.retire(user_id, "ocr", "api_calls_per_day", now) is None
+        assert pool.release_all(now) == []
+
+
+class TestQuotaManagementWithLeases:
+
+    @pytest.mark.asyncio
+    async def test_consume_reserves_block_once_and_serves_locally(self, dependencies, counter_factory):
+        user_id = uuid4()
+        dependencies['quota_counter_store'].reserve.return_value = QuotaCounterResult(
+            outcome=QuotaCounterOutcome.ACCEPTED, counter=counter_factory(user_id, 5, limit=100), granted=5
+        )
+        service = QuotaManagementService(**dependencies)
+
+        first = await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+        second = await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+
+        assert first.current_usage == 1
+        assert second.current_usage == 2
+        assert second.remaining == 98
+        dependencies['quota_counter_store'].reserve.assert_awaited_once()
+        assert dependencies['quota_counter_store'].reserve.await_args.args[3:6] == (5, 1, 0)
+        dependencies['quota_counter_store'].apply.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_short_lease_is_released_before_reserving(self, dependencies, counter_factory, now):
+        user_id = uuid4()
+        counter_store = dependencies['quota_counter_store']
+        counter_store.reserve.side_effect = [
+            QuotaCounterResult(outcome=QuotaCounterOutcome.ACCEPTED, counter=counter_factory(user_id, 5), granted=5),
+            QuotaCounterResult(outcome=QuotaCounterOutcome.ACCEPTED, counter=counter_factory(user_id, 7), granted=6),
+        ]
+        service = QuotaManagementService(**dependencies)
+
+        await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+        result = await service.consume(user_id, "ocr", "api_calls_per_day", 6)
+
+        assert [call[0] for call in counter_store.mock_calls] == ["reserve", "release", "reserve"]
+        released = counter_store.release.await_args.args[0]
+        assert [lease.available() for lease in released] == [4]
+        assert result.current_usage == 7
+        assert dependencies['quota_lease_pool'].release_all(now) == []
+
+    @pytest.mark.asyncio
+    async def test_exhausted_central_counter_raises(self, dependencies, counter_factory):
+        user_id = uuid4()
+        dependencies['quota_counter_store'].reserve.return_value = QuotaCounterResult(
+            outcome=QuotaCounterOutcome.EXCEEDED, counter=counter_factory(user_id, 100)
+        )
+        service = QuotaManagementService(**dependencies)
+
+        with pytest.raises(InsufficientQuotaException):
+            await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+
+    @pytest.mark.asyncio
+    async def test_unavailable_counter_store_skips_leasing(self, dependencies, counter_factory):
+        user_id = uuid4()
+        dependencies['quota_counter_store'].reserve.return_value = QuotaCounterResult.unavailable()
+        dependencies['quota_counter_store'].apply.return_value = QuotaCounterResult(
+            outcome=QuotaCounterOutcome.ACCEPTED, counter=counter_factory(user_id, 1)
+        )
+        service = QuotaManagementService(**dependencies)
+
+        result = await service.consume(user_id, "ocr", "api_calls_per_day", 1)
+
+        assert result.current_usage == 1
+        assert dependencies['quota_lease_pool'].stats().size == 0
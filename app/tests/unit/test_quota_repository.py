@@ -0,0 +1,233 @@
+from dataclasses import asdict
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.service.QuotaCharge import QuotaCharge
+from app.domain.service.QuotaCounter import QuotaCounter
+from app.domain.service.QuotaDefaults import QuotaDefaults
+from app.infrastructure.adapter.output.database.repositories.QuotaRepository import QuotaRepository
+
+
+class _Rows:
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+        self.rowcount = len(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def scalars(self):
+        return self
+
+
+def _row(quota, **extra):
+    return SimpleNamespace(**{**asdict(quota), **extra})
+
+
+def _sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.flush = AsyncMock()
+    return session
+
+
+def _statements(session):
+    return [call.args[0] for call in session.execute.await_args_list]
+
+
+class TestConsumeStatement:
+
+    @pytest.mark.asyncio
+    async def test_upsert_is_guarded_by_the_window_limit(self, session, quota_factory, now):
+        user_id = uuid4()
+        session.execute.return_value = _Rows([_row(quota_factory(user_id, current_usage=3), inserted=False)])
+
+        consumption = await QuotaRepository(session, MagicMock()).consume(
+            user_id, "ocr", "api_calls_per_day", 2, now, QuotaDefaults.default()
+        )
+
+        assert consumption.consumed is True
+        assert consumption.quota.current_usage == 3
+        sql = _sql(_statements(session)[0])
+        assert "ON CONFLICT (user_id, service_name, quota_type) DO UPDATE" in sql
+        assert 'THEN excluded."limit" ELSE quotas."limit" END' in sql
+        assert "<= CASE WHEN (quotas.reset_at <= " in sql
+        assert "xmax = 0 AS inserted" in sql
+
+    @pytest.mark.asyncio
+    async def test_rejected_upsert_reads_the_current_row(self, session, quota_factory, now):
+        user_id = uuid4()
+        quota = quota_factory(user_id, current_usage=10)
+        session.execute.side_effect = [_Rows(), _Rows([quota])]
+
+        consumption = await QuotaRepository(session, MagicMock()).consume(
+            user_id, "ocr", "api_calls_per_day", 1, now, QuotaDefaults.default()
+        )
+
+        assert consumption.consumed is False
+        assert consumption.quota.current_usage == 10
+        assert _sql(_statements(session)[1]).startswith("SELECT quotas.user_id")
+
+
+class TestConsumeManyStatements:
+
+    @staticmethod
+    def _charges():
+        return [
+            QuotaCharge(service_name="ocr", quota_type="api_calls_per_day", amount=2),
+            QuotaCharge(service_name="ocr", quota_type="storage_mb", amount=5),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rows_are_locked_with_their_window_limit_then_charged_together(self, session, quota_factory, now):
+        user_id = uuid4()
+        calls = quota_factory(user_id, current_usage=1)
+        storage = quota_factory(user_id, current_usage=4, quota_type="storage_mb")
+        session.execute.side_effect = [
+            _Rows([SimpleNamespace(service_name="ocr", quota_type="storage_mb")]),
+            _Rows([_row(calls, window_limit=10), _row(storage, window_limit=10)]),
+            _Rows([
+                _row(quota_factory(user_id, current_usage=3), id=calls.id),
+                _row(quota_factory(user_id, current_usage=9, quota_type="storage_mb"), id=storage.id),
+            ]),
+        ]
+
+        consumptions = await QuotaRepository(session, MagicMock()).consume_many(
+            user_id, self._charges(), now, QuotaDefaults.default()
+        )
+
+        assert [(c.consumed, c.created, c.quota.current_usage) for c in consumptions] == [
+            (True, False, 3),
+            (True, True, 9),
+        ]
+        insert_sql, lock_sql, update_sql = (_sql(statement) for statement in _statements(session))
+        assert "ON CONFLICT (user_id, service_name, quota_type) DO NOTHING" in insert_sql
+        assert "AS window_limit" in lock_sql
+        assert lock_sql.endswith("ORDER BY quotas.id FOR UPDATE OF quotas")
+        assert "FROM (VALUES " in update_sql
+        assert 'AS charged (id, current_usage, "limit", reset_at) WHERE quotas.id = charged.id' in update_sql
+
+    @pytest.mark.asyncio
+    async def test_due_row_is_charged_against_the_fresh_window(self, session, quota_factory, now):
+        user_id = uuid4()
+        due = quota_factory(user_id, current_usage=9)
+        due.reset_at = now - timedelta(minutes=1)
+        session.execute.side_effect = [_Rows(), _Rows([_row(due, window_limit=50)]), _Rows([_row(due)])]
+
+        await QuotaRepository(session, MagicMock()).consume_many(
+            user_id, self._charges()[:1], now, QuotaDefaults.default()
+        )
+
+        charged = _statements(session)[2].compile(dialect=postgresql.dialect()).params
+        assert [charged[f"param_{index}"] for index in (2, 3)] == [2, 50]
+        assert charged["param_4"] > now
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_issues_no_update(self, session, quota_factory, now):
+        user_id = uuid4()
+        calls = quota_factory(user_id, current_usage=9)
+        storage = quota_factory(user_id, current_usage=0, quota_type="storage_mb")
+        session.execute.side_effect = [
+            _Rows(),
+            _Rows([_row(calls, window_limit=10), _row(storage, window_limit=10)]),
+        ]
+
+        consumptions = await QuotaRepository(session, MagicMock()).consume_many(
+            user_id, self._charges(), now, QuotaDefaults.default()
+        )
+
+        assert [consumption.consumed for consumption in consumptions] == [False, False]
+        assert session.execute.await_count == 2
+
+
+class TestResetDueStatement:
+
+    @pytest.mark.asyncio
+    async def test_due_rows_take_the_plan_limit_in_one_update(self, session, now):
+        session.execute.return_value = _Rows([None, None])
+
+        reset = await QuotaRepository(session, MagicMock()).reset_due(now, QuotaDefaults.default(), 100)
+
+        assert reset == 2
+        sql = _sql(_statements(session)[0])
+        assert sql.startswith("UPDATE quotas SET current_usage=")
+        assert "plans.quota_limits ->> quotas.quota_type" in sql
+        assert "user_plans.user_id = quotas.user_id" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+
+
+class TestWriteBackStatement:
+
+    @staticmethod
+    def _counter(quota, pending_usage=3):
+        return QuotaCounter(
+            quota_id=quota.id,
+            user_id=quota.user_id,
+            service_name=quota.service_name,
+            quota_type=quota.quota_type,
+            current_usage=quota.current_usage,
+            limit=quota.limit,
+            reset_at=quota.reset_at,
+            pending_usage=pending_usage,
+        )
+
+    @pytest.mark.asyncio
+    async def test_drained_counters_are_applied_per_window(self, session, quota_factory, now):
+        quota = quota_factory(uuid4(), current_usage=7)
+        session.execute.side_effect = [_Rows(), _Rows([_row(quota)])]
+
+        consumptions = await QuotaRepository(session, MagicMock()).write_back([self._counter(quota)], now)
+
+        assert [(c.quota.id, c.created) for c in consumptions] == [(quota.id, False)]
+        statement = _statements(session)[1]
+        sql = _sql(statement)
+        assert (
+            "current_usage=CASE WHEN (quotas.reset_at = drained.reset_at) "
+            "THEN greatest(quotas.current_usage + drained.pending, "
+        ) in sql
+        assert "WHEN (quotas.reset_at < drained.reset_at) THEN greatest(drained.pending, " in sql
+        assert '"limit"=CASE WHEN (quotas.reset_at < drained.reset_at) THEN drained."limit"' in sql
+        assert "reset_at=greatest(quotas.reset_at, drained.reset_at)" in sql
+        assert (
+            'AS drained (id, user_id, service_name, quota_type, pending, "limit", reset_at) '
+            "WHERE quotas.user_id = drained.user_id AND quotas.service_name = drained.service_name "
+            "AND quotas.quota_type = drained.quota_type"
+        ) in sql
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert [params[f"param_{index}"] for index in range(1, 8)] == [
+            quota.id, quota.user_id, "ocr", "api_calls_per_day", 3, 10, quota.reset_at
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_rows_are_created_for_existing_users_only(self, session, quota_factory, now):
+        quota = quota_factory(uuid4(), current_usage=3)
+        session.execute.side_effect = [
+            _Rows([SimpleNamespace(user_id=quota.user_id, service_name="ocr", quota_type="api_calls_per_day")]),
+            _Rows([_row(quota)]),
+        ]
+
+        consumptions = await QuotaRepository(session, MagicMock()).write_back([self._counter(quota)], now)
+
+        assert [c.created for c in consumptions] == [True]
+        sql = _sql(_statements(session)[0])
+        assert sql.startswith('INSERT INTO quotas (id, user_id, service_name, quota_type, current_usage, "limit", ')
+        assert "JOIN users ON users.id = drained.user_id" in sql
+        assert "ON CONFLICT (user_id, service_name, quota_type) DO NOTHING" in sql
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_write_skips_the_query(self, session, now):
+        assert await QuotaRepository(session, MagicMock()).write_back([], now) == []
+        session.execute.assert_not_called()
@@ -0,0 +1,109 @@
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.dto.ServiceAccessDTO import ServiceAccessResult
+from app.application.service.QuotaManagementService import QuotaManagementService
+from app.application.service.QuotaResetService import QuotaResetService
+from app.domain.service.Quota import Quota
+from app.domain.service.QuotaDefaults import QuotaDefaults
+from app.infrastructure.adapter.input.worker.QuotaResetWorker import QuotaResetWorker
+
+
+NOW = datetime(2026, 1, 1, 13, 30, tzinfo=UTC)
+
+
+def _worker(service):
+    @asynccontextmanager
+    async def session_factory():
+        yield MagicMock()
+
+    return QuotaResetWorker(
+        session_factory=session_factory,
+        service_factory=lambda session: service,
+        logger=MagicMock(),
+        interval_seconds=1.0,
+        batch_size=100,
+    )
+
+
+class TestQuotaReset:
+
+    @pytest.mark.asyncio
+    async def test_due_quotas_move_to_next_aligned_window(self):
+        quota_repository = AsyncMock()
+        quota_repository.reset_due.return_value = 3
+        datetime_converter = MagicMock()
+        datetime_converter.now_utc.return_value = NOW
+        quota_defaults = QuotaDefaults.default()
+        service = QuotaResetService(quota_repository, datetime_converter, quota_defaults)
+
+        reset = await service.execute(100)
+
+        assert reset == 3
+        quota_repository.reset_due.assert_awaited_once_with(NOW, quota_defaults, 100)
+        assert quota_defaults.next_reset_at(NOW) == datetime(2026, 1, 2, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_worker_resets_batches_until_drained(self):
+        service = AsyncMock()
+        service.execute.side_effect = [100, 100, 7]
+
+        reset = await _worker(service).reset_due()
+
+        assert reset == 207
+        assert service.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_worker_stops_on_failed_batch(self):
+        service = AsyncMock()
+        service.execute.side_effect = [100, RuntimeError("database unavailable")]
+
+        reset = await _worker(service).reset_due()
+
+        assert reset == 100
+
+    @pytest.mark.asyncio
+    async def test_quota_check_reads_due_window_without_writing(self):
+        user_id = uuid4()
+        quota_repository = AsyncMock()
+        quota_repository.find_by_user_and_service.return_value = Quota(
+            id=uuid4(),
+            user_id=user_id,
+            service_name="ocr",
+            quota_type="api_calls_per_day",
+            current_usage=10,
+            limit=10,
+            reset_at=NOW - timedelta(hours=1),
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        datetime_converter = MagicMock()
+        datetime_converter.now_utc.return_value = NOW
+        datetime_converter.to_iso_string.side_effect = lambda value: value.isoformat()
+        service_access_validator = AsyncMock()
+        service_access_validator.execute.return_value = ServiceAccessResult(is_allowed=True)
+        user_plan_repository = AsyncMock()
+        user_plan_repository.find_active_by_user.return_value = None
+        service = QuotaManagementService(
+            quota_repository=quota_repository,
+            user_plan_repository=user_plan_repository,
+            plan_repository=AsyncMock(),
+            transaction_logger=AsyncMock(),
+            datetime_converter=datetime_converter,
+            uuid_generator=MagicMock(),
+            service_access_validator=service_access_validator,
+            quota_defaults=QuotaDefaults.default(),
+        )
+
+        result = await service.execute(user_id, "ocr", "api_calls_per_day", 1)
+
+        assert result.can_proceed is True
+        assert result.current_usage == 0
+        assert result.limit == QuotaDefaults.default().get_anonymous_limit()
+        assert result.reset_at == "2026-01-02T00:00:00+00:00"
+        quota_repository.reset_due.assert_not_called()
+        quota_repository.save.assert_not_called()
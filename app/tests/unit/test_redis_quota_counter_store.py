@@ -0,0 +1,279 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from app.domain.service.Quota import Quota
+from app.domain.service.QuotaCharge import QuotaCharge
+from app.domain.service.QuotaLease import QuotaLease
+from app.domain.ValueObjects import QuotaCounterOutcome
+from app.infrastructure.adapter.output.cache.RedisQuotaCounterStore import RedisQuotaCounterStore
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.infrastructure.config.EnvConfig import RedisConfig
+from app.shared.DateTime import DateTimeConverter
+
+
+NOW = datetime(2026, 1, 1, 12, tzinfo=UTC)
+PERIOD = timedelta(days=1)
+RESET_AT = datetime(2026, 1, 2, tzinfo=UTC)
+
+
+def _seed(user_id, current_usage=0, limit=10, reset_at=RESET_AT, service_name="ocr"):
+    return Quota(
+        id=uuid4(),
+        user_id=user_id,
+        service_name=service_name,
+        quota_type="api_calls_per_day",
+        current_usage=current_usage,
+        limit=limit,
+        reset_at=reset_at,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def store(redis):
+    redis_client = RedisClient(
+        RedisConfig(url="redis://localhost:6379/0", pool_size=1, max_connections=1, decode_responses=True)
+    )
+    redis_client._client = redis
+    return RedisQuotaCounterStore(redis_client, datetime_converter=DateTimeConverter(), logger=MagicMock())
+
+
+async def _apply(store, user_id, amount, consume=True, current_time=NOW, seed=None):
+    return await store.apply(user_id, "ocr", "api_calls_per_day", amount, consume, current_time, PERIOD, seed=seed)
+
+
+class TestApply:
+
+    @pytest.mark.asyncio
+    async def test_missing_counter_asks_for_a_seed(self, store):
+        result = await _apply(store, uuid4(), 1)
+
+        assert result.outcome == QuotaCounterOutcome.NOT_LOADED
+
+    @pytest.mark.asyncio
+    async def test_consume_increments_usage_and_marks_counter_dirty(self, store, redis):
+        user_id = uuid4()
+        seed = _seed(user_id, current_usage=4)
+
+        result = await _apply(store, user_id, 3, seed=seed)
+
+        assert result.outcome == QuotaCounterOutcome.ACCEPTED
+        assert result.counter.quota_id == seed.id
+        assert result.counter.current_usage == 7
+        assert result.counter.reset_at == RESET_AT
+        assert await redis.smembers(RedisQuotaCounterStore.DIRTY_KEY) == {store._key(user_id, "ocr", "api_calls_per_day")}
+
+    @pytest.mark.asyncio
+    async def test_check_does_not_consume(self, store, redis):
+        user_id = uuid4()
+
+        result = await _apply(store, user_id, 3, consume=False, seed=_seed(user_id, current_usage=4))
+
+        assert result.outcome == QuotaCounterOutcome.ACCEPTED
+        assert result.counter.current_usage == 4
+        assert await redis.scard(RedisQuotaCounterStore.DIRTY_KEY) == 0
+
+    @pytest.mark.asyncio
+    async def test_exceeding_the_limit_leaves_usage_unchanged(self, store):
+        user_id = uuid4()
+        await _apply(store, user_id, 9, seed=_seed(user_id))
+
+        result = await _apply(store, user_id, 2)
+
+        assert result.outcome == QuotaCounterOutcome.EXCEEDED
+        assert result.counter.current_usage == 9
+
+    @pytest.mark.asyncio
+    async def test_due_counter_is_reseeded_with_the_new_limit(self, store):
+        user_id = uuid4()
+        await _apply(store, user_id, 9, seed=_seed(user_id))
+        next_window = RESET_AT + timedelta(hours=1)
+
+        unseeded = await _apply(store, user_id, 1, current_time=next_window)
+        result = await _apply(
+            store, user_id, 1, current_time=next_window,
+            seed=_seed(user_id, limit=50, reset_at=RESET_AT + PERIOD)
+        )
+
+        assert unseeded.outcome == QuotaCounterOutcome.NOT_LOADED
+        assert result.outcome == QuotaCounterOutcome.ACCEPTED
+        assert result.counter.current_usage == 1
+        assert result.counter.limit == 50
+        assert result.counter.reset_at == RESET_AT + PERIOD
+
+
+class TestApplyMany:
+
+    @pytest.mark.asyncio
+    async def test_reports_only_the_missing_counters(self, store):
+        user_id = uuid4()
+        await _apply(store, user_id, 1, seed=_seed(user_id))
+        charges = [QuotaCharge("ocr", "api_calls_per_day", 1), QuotaCharge("scan", "api_calls_per_day", 1)]
+
+        result = await store.apply_many(user_id, charges, NOW, PERIOD)
+
+        assert result.outcome == QuotaCounterOutcome.NOT_LOADED
+        assert result.missing == [charges[1]]
+
+    @pytest.mark.asyncio
+    async def test_charges_every_counter_when_all_fit(self, store):
+        user_id = uuid4()
+        charges = [QuotaCharge("ocr", "api_calls_per_day", 2), QuotaCharge("scan", "api_calls_per_day", 3)]
+        seeds = {charge.key: _seed(user_id, service_name=charge.service_name) for charge in charges}
+
+        result = await store.apply_many(user_id, charges, NOW, PERIOD, seeds=seeds)
+
+        assert result.outcome == QuotaCounterOutcome.ACCEPTED
+        assert [counter.current_usage for counter in result.counters] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_charges_nothing_when_one_counter_is_exceeded(self, store):
+        user_id = uuid4()
+        charges = [QuotaCharge("ocr", "api_calls_per_day", 2), QuotaCharge("scan", "api_calls_per_day", 3)]
+        seeds = {
+            ("ocr", "api_calls_per_day"): _seed(user_id),
+            ("scan", "api_calls_per_day"): _seed(user_id, current_usage=8, service_name="scan"),
+        }
+
+        result = await store.apply_many(user_id, charges, NOW, PERIOD, seeds=seeds)
+
+        assert result.outcome == QuotaCounterOutcome.EXCEEDED
+        assert [counter.current_usage for counter in result.counters] == [0, 8]
+
+
+class TestReserveAndRelease:
+
+    @staticmethod
+    async def _reserve(store, user_id, block, minimum=1, tolerance=0, seed=None):
+        return await store.reserve(
+            user_id, "ocr", "api_calls_per_day", block, minimum, tolerance, NOW, PERIOD, seed=seed
+        )
+
+    @staticmethod
+    def _lease(user_id, granted, used, reset_at=RESET_AT):
+        return QuotaLease(
+            user_id=user_id,
+            service_name="ocr",
+            quota_type="api_calls_per_day",
+            granted=granted,
+            limit=10,
+            central_usage=granted,
+            reset_at=reset_at,
+            leased_at=NOW,
+            expires_at=NOW + timedelta(seconds=5),
+            used=used,
+        )
+
+    @pytest.mark.asyncio
+    async def test_grants_at_most_the_remaining_quota(self, store):
+        user_id = uuid4()
+
+        result = await self._reserve(store, user_id, 50, seed=_seed(user_id, current_usage=7))
+
+        assert result.granted == 3
+        assert result.counter.current_usage == 10
+
+    @pytest.mark.asyncio
+    async def test_grants_nothing_below_the_minimum(self, store):
+        user_id = uuid4()
+
+        result = await self._reserve(store, user_id, 50, minimum=4, seed=_seed(user_id, current_usage=7))
+
+        assert result.outcome == QuotaCounterOutcome.EXCEEDED
+        assert result.granted == 0
+        assert result.counter.current_usage == 7
+
+    @pytest.mark.asyncio
+    async def test_tolerance_allows_overshoot(self, store):
+        user_id = uuid4()
+
+        result = await self._reserve(store, user_id, 50, tolerance=2, seed=_seed(user_id, current_usage=7))
+
+        assert result.granted == 5
+
+    @pytest.mark.asyncio
+    async def test_release_returns_unused_units(self, store):
+        user_id = uuid4()
+        await self._reserve(store, user_id, 5, seed=_seed(user_id))
+
+        await store.release([self._lease(user_id, granted=5, used=2)])
+        result = await _apply(store, user_id, 0, consume=False)
+
+        assert result.counter.current_usage == 2
+
+    @pytest.mark.asyncio
+    async def test_release_ignores_leases_from_another_window(self, store):
+        user_id = uuid4()
+        await self._reserve(store, user_id, 5, seed=_seed(user_id))
+
+        await store.release([self._lease(user_id, granted=5, used=2, reset_at=RESET_AT - PERIOD)])
+        result = await _apply(store, user_id, 0, consume=False)
+
+        assert result.counter.current_usage == 5
+
+
+class TestDrainAndRequeue:
+
+    @pytest.mark.asyncio
+    async def test_drain_takes_the_pending_delta(self, store):
+        user_id = uuid4()
+        seed = _seed(user_id, current_usage=4)
+        await _apply(store, user_id, 3, seed=seed)
+        await _apply(store, user_id, 2)
+
+        drained = await store.drain(10)
+
+        assert len(drained) == 1
+        assert drained[0].quota_id == seed.id
+        assert drained[0].current_usage == 9
+        assert drained[0].pending_usage == 5
+        assert drained[0].reset_at == RESET_AT
+        assert await store.drain(10) == []
+
+    @pytest.mark.asyncio
+    async def test_consumption_after_drain_is_pending_again(self, store):
+        user_id = uuid4()
+        await _apply(store, user_id, 3, seed=_seed(user_id))
+        await store.drain(10)
+
+        await _apply(store, user_id, 1)
+        drained = await store.drain(10)
+
+        assert drained[0].current_usage == 4
+        assert drained[0].pending_usage == 1
+
+    @pytest.mark.asyncio
+    async def test_requeue_restores_the_delta_in_the_same_window(self, store):
+        user_id = uuid4()
+        await _apply(store, user_id, 3, seed=_seed(user_id))
+        drained = await store.drain(10)
+        await _apply(store, user_id, 1)
+
+        await store.requeue(drained)
+        redrained = await store.drain(10)
+
+        assert redrained[0].pending_usage == 4
+
+    @pytest.mark.asyncio
+    async def test_requeue_drops_the_delta_after_a_window_reset(self, store):
+        user_id = uuid4()
+        await _apply(store, user_id, 3, seed=_seed(user_id))
+        drained = await store.drain(10)
+        next_window = RESET_AT + timedelta(hours=1)
+        await _apply(store, user_id, 1, current_time=next_window, seed=_seed(user_id, reset_at=RESET_AT + PERIOD))
+
+        await store.requeue(drained)
+        redrained = await store.drain(10)
+
+        assert redrained[0].pending_usage == 1
+        assert redrained[0].reset_at == RESET_AT + PERIOD
@@ -0,0 +1,80 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import fakeredis
+import pytest
+from redis.exceptions import RedisError
+
+from app.domain.authorization.SessionState import SessionState
+from app.infrastructure.adapter.output.cache.RedisSessionStateCache import RedisSessionStateCache
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.infrastructure.config.EnvConfig import RedisConfig
+from app.shared.DateTime import DateTimeConverter
+
+
+def _state(revoked=False):
+    now = datetime.now(UTC).replace(microsecond=0)
+    return SessionState(
+        session_id=uuid4(),
+        user_id=uuid4(),
+        expires_at=now + timedelta(days=1),
+        revoked_at=now if revoked else None,
+    )
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def logger():
+    logger = MagicMock()
+    logger.bind.return_value = logger
+    return logger
+
+
+@pytest.fixture
+def cache(redis, logger):
+    redis_client = RedisClient(
+        RedisConfig(url="redis://localhost:6379/0", pool_size=1, max_connections=1, decode_responses=True)
+    )
+    redis_client._client = redis
+    return RedisSessionStateCache(redis_client, DateTimeConverter(), logger)
+
+
+class TestRevokedStateWrite:
+
+    @pytest.mark.asyncio
+    async def test_failed_revocation_write_drops_the_cached_active_state(self, cache, redis, logger):
+        active = _state()
+        await cache.set(active)
+        revoked = SessionState(active.session_id, active.user_id, active.expires_at, datetime.now(UTC))
+        redis.set = AsyncMock(side_effect=RedisError("write failed"))
+
+        await cache.set(revoked)
+
+        assert await cache.get(active.session_id) is None
+        logger.error.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_is_reported_as_an_error(self, cache, redis, logger):
+        redis.set = AsyncMock(side_effect=RedisError("write failed"))
+        redis.delete = AsyncMock(side_effect=RedisError("delete failed"))
+        state = _state(revoked=True)
+
+        await cache.set(state)
+
+        logger.error.assert_called_once_with("session_state_revocation_not_cached", session_id=str(state.session_id))
+
+    @pytest.mark.asyncio
+    async def test_failed_active_write_leaves_existing_state(self, cache, redis, logger):
+        state = _state()
+        await cache.set(state)
+        redis.set = AsyncMock(side_effect=RedisError("write failed"))
+
+        await cache.set(state)
+
+        assert await cache.get(state.session_id) == state
+        logger.error.assert_not_called()
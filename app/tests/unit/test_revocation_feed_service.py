@@ -0,0 +1,82 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.service.RevocationFeedService import RevocationFeedService
+from app.domain.authorization.RevocationEvent import RevocationEvent
+from app.domain.ValueObjects import RevocationKind
+from app.infrastructure.adapter.output.cache.RedisRevocationFeed import RedisRevocationFeed
+from app.shared.DateTime import DateTimeConverter
+
+
+def _event(cursor: str) -> RevocationEvent:
+    return RevocationEvent(kind=RevocationKind.SESSION, user_id=uuid4(), session_id=uuid4(), cursor=cursor)
+
+
+class TestRevocationFeedService:
+
+    @pytest.mark.asyncio
+    async def test_page_cursor_advances_to_last_event(self):
+        feed = AsyncMock()
+        feed.read_after.return_value = [_event("1-0"), _event("2-0")]
+        service = RevocationFeedService(revocation_feed=feed, retention_seconds=3600)
+
+        page = await service.execute("0-0", 10)
+
+        assert page.cursor == "2-0"
+        assert page.retention_seconds == 3600
+
+    @pytest.mark.asyncio
+    async def test_empty_page_keeps_requested_cursor(self):
+        feed = AsyncMock()
+        feed.read_after.return_value = []
+        service = RevocationFeedService(revocation_feed=feed, retention_seconds=3600)
+
+        page = await service.execute("5-0", 10)
+
+        assert page.cursor == "5-0"
+        assert page.events == []
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_snapshot_then_tails_from_last_cursor(self):
+        feed = AsyncMock()
+        feed.read_after.return_value = [_event("1-0")]
+        feed.wait_after.side_effect = [[], [_event("2-0")]]
+        service = RevocationFeedService(revocation_feed=feed, retention_seconds=3600)
+
+        stream = service.stream(None, heartbeat_seconds=15)
+        snapshot = await anext(stream)
+        marker = await anext(stream)
+        heartbeat = await anext(stream)
+        tailed = await anext(stream)
+        await stream.aclose()
+
+        assert [event.cursor for event in snapshot.events] == ["1-0"]
+        assert marker.snapshot_complete is True
+        assert marker.cursor == "1-0"
+        assert heartbeat.events == []
+        assert tailed.cursor == "2-0"
+        assert feed.wait_after.await_args_list[0].args == ("1-0", RevocationFeedService.STREAM_PAGE_SIZE, 15)
+
+
+class TestRedisRevocationFeed:
+
+    @pytest.mark.asyncio
+    async def test_blocking_reads_use_the_stream_client(self):
+        redis_client = AsyncMock()
+        stream_client = AsyncMock()
+        stream_client.xread.return_value = [("revocations", [("1-0", {"kind": "session_epoch", "user_id": str(uuid4()), "session_epoch": "2"})])]
+        feed = RedisRevocationFeed(
+            redis_client,
+            retention_seconds=3600,
+            datetime_converter=DateTimeConverter(),
+            logger=MagicMock(),
+            stream_client=stream_client,
+        )
+
+        events = await feed.wait_after("0-0", 10, 15)
+
+        assert [event.cursor for event in events] == ["1-0"]
+        assert stream_client.xread.await_args.kwargs["block_ms"] == 15000
+        redis_client.xread.assert_not_called()
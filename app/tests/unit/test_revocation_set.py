@@ -0,0 +1,62 @@
+from kauth_client.RevocationSet import RevocationSet
+
+
+class FakeWallClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _page(events, cursor=None, retention_seconds=3600):
+    return {"events": events, "cursor": cursor, "retention_seconds": retention_seconds}
+
+
+class TestRevocationSet:
+    def test_revoked_session_is_reported(self):
+        clock = FakeWallClock(1_000.0)
+        revocations = RevocationSet(grace_seconds=0, clock=clock)
+
+        revocations.apply(_page(
+            [{"kind": "session", "user_id": "u1", "session_id": "s1", "cursor": "1000000-0"}],
+            cursor="1000000-0"
+        ))
+
+        assert revocations.is_session_revoked("s1") is True
+        assert revocations.is_session_revoked("s2") is False
+        assert revocations.cursor == "1000000-0"
+
+    def test_epoch_revokes_only_older_tokens(self):
+        clock = FakeWallClock(1_000.0)
+        revocations = RevocationSet(grace_seconds=0, clock=clock)
+
+        revocations.apply(_page([
+            {"kind": "session_epoch", "user_id": "u1", "session_epoch": 3, "cursor": "1000000-0"},
+            {"kind": "session_epoch", "user_id": "u1", "session_epoch": 2, "cursor": "1000000-1"},
+        ]))
+
+        assert revocations.is_epoch_revoked("u1", 2) is True
+        assert revocations.is_epoch_revoked("u1", 3) is False
+        assert revocations.is_epoch_revoked("u2", 0) is False
+
+    def test_events_are_forgotten_after_retention(self):
+        clock = FakeWallClock(1_000.0)
+        revocations = RevocationSet(grace_seconds=10, clock=clock)
+        revocations.apply(_page(
+            [{"kind": "session", "user_id": "u1", "session_id": "s1", "cursor": "1000000-0"}],
+            retention_seconds=60
+        ))
+
+        clock.now = 1_070.0
+        revocations.apply(_page([]))
+
+        assert revocations.is_session_revoked("s1") is False
+        assert len(revocations) == 0
+
+    def test_empty_page_keeps_cursor(self):
+        revocations = RevocationSet()
+        revocations.apply(_page([], cursor="5-0"))
+        revocations.apply(_page([], cursor=None))
+
+        assert revocations.cursor == "5-0"
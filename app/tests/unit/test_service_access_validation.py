@@ -0,0 +1,158 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.service.ServiceAccessValidationService import ServiceAccessValidationService
+from app.domain.authorization.ServiceAccess import ServiceAccess
+from app.domain.authorization.ServiceAccessDecision import ServiceAccessDecision
+
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def dependencies():
+    return {
+        'service_access_repository': AsyncMock(),
+        'user_plan_repository': AsyncMock(),
+        'datetime_converter': MagicMock(now_utc=MagicMock(return_value=NOW)),
+    }
+
+
+def _decision(is_allowed=True, is_revoked=False, has_plan=True, plan_expires_at=None):
+    return ServiceAccessDecision(
+        service_name="ocr",
+        is_allowed=is_allowed,
+        is_revoked=is_revoked,
+        allowed_features=("scan",),
+        has_plan=has_plan,
+        plan_expires_at=plan_expires_at,
+    )
+
+
+def _service_access(user_id, service_name, allowed_features=None, revoked=False):
+    return ServiceAccess(
+        id=uuid4(),
+        user_id=user_id,
+        service_name=service_name,
+        is_allowed=not revoked,
+        allowed_features=allowed_features,
+        granted_at=NOW,
+        revoked_at=NOW if revoked else None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def _user_plan():
+    user_plan = MagicMock()
+    user_plan.expires_at = None
+    return user_plan
+
+
+class TestServiceAccessValidationService:
+
+    @pytest.mark.asyncio
+    async def test_allows_with_single_decision_query(self, dependencies):
+        dependencies['service_access_repository'].find_decision.return_value = _decision()
+        service = ServiceAccessValidationService(**dependencies)
+        user_id = uuid4()
+
+        result = await service.execute(user_id, "ocr")
+
+        assert result.is_allowed is True
+        assert result.allowed_features == ["scan"]
+        dependencies['service_access_repository'].find_decision.assert_awaited_once_with(user_id, "ocr")
+        dependencies['user_plan_repository'].find_active_by_user.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_access_is_denied(self, dependencies):
+        dependencies['service_access_repository'].find_decision.return_value = None
+        service = ServiceAccessValidationService(**dependencies)
+
+        result = await service.execute(uuid4(), "ocr")
+
+        assert result.is_allowed is False
+        assert result.error_message == "No access configured for service: ocr"
+
+    @pytest.mark.asyncio
+    async def test_revoked_access_is_denied_before_plan_check(self, dependencies):
+        dependencies['service_access_repository'].find_decision.return_value = _decision(
+            is_revoked=True, has_plan=False
+        )
+        service = ServiceAccessValidationService(**dependencies)
+
+        result = await service.execute(uuid4(), "ocr")
+
+        assert result.error_message == "Service access has been revoked or disabled"
+
+    @pytest.mark.asyncio
+    async def test_missing_plan_is_denied(self, dependencies):
+        dependencies['service_access_repository'].find_decision.return_value = _decision(has_plan=False)
+        service = ServiceAccessValidationService(**dependencies)
+
+        result = await service.execute(uuid4(), "ocr")
+
+        assert result.is_allowed is False
+        assert result.error_message == "User has no active plan"
+
+    @pytest.mark.asyncio
+    async def test_plan_expired_since_the_query_is_reported_separately(self, dependencies):
+        dependencies['service_access_repository'].find_decision.return_value = _decision(plan_expires_at=NOW)
+        service = ServiceAccessValidationService(**dependencies)
+
+        result = await service.execute(uuid4(), "ocr")
+
+        assert result.is_allowed is False
+        assert result.error_message == "User plan has expired or is inactive"
+
+    @pytest.mark.asyncio
+    async def test_plan_with_future_expiry_is_allowed(self, dependencies):
+        dependencies['service_access_repository'].find_decision.return_value = _decision(
+            plan_expires_at=NOW + timedelta(days=1)
+        )
+        service = ServiceAccessValidationService(**dependencies)
+
+        result = await service.execute(uuid4(), "ocr")
+
+        assert result.is_allowed is True
+
+
+class TestServiceAccessBulkValidation:
+
+    @pytest.mark.asyncio
+    async def test_answers_every_service_from_two_queries(self, dependencies):
+        user_id = uuid4()
+        dependencies['service_access_repository'].find_by_user_and_services.return_value = [
+            _service_access(user_id, "ocr", ["scan"]),
+            _service_access(user_id, "tts", revoked=True),
+        ]
+        dependencies['user_plan_repository'].find_active_by_user.return_value = _user_plan()
+        service = ServiceAccessValidationService(**dependencies)
+
+        results = await service.execute_bulk(user_id, ["ocr", "tts", "stt", "ocr"])
+
+        assert list(results) == ["ocr", "tts", "stt"]
+        assert results["ocr"].is_allowed is True
+        assert results["ocr"].allowed_features == ["scan"]
+        assert results["tts"].error_message == "Service access has been revoked or disabled"
+        assert results["stt"].error_message == "No access configured for service: stt"
+        dependencies['service_access_repository'].find_by_user_and_services.assert_awaited_once_with(
+            user_id, ["ocr", "tts", "stt"]
+        )
+        dependencies['user_plan_repository'].find_active_by_user.assert_awaited_once_with(user_id)
+
+    @pytest.mark.asyncio
+    async def test_missing_plan_denies_every_configured_service(self, dependencies):
+        user_id = uuid4()
+        dependencies['service_access_repository'].find_by_user_and_services.return_value = [
+            _service_access(user_id, "ocr")
+        ]
+        dependencies['user_plan_repository'].find_active_by_user.return_value = None
+        service = ServiceAccessValidationService(**dependencies)
+
+        results = await service.execute_bulk(user_id, ["ocr"])
+
+        assert results["ocr"].error_message == "User has no active plan"
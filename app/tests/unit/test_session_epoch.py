@@ -0,0 +1,179 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import fakeredis
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.application.service.SessionEpochService import SessionEpochService
+from app.application.service.TokenValidationService import TokenValidationService
+from app.domain.authorization.RevocationEvent import RevocationEvent
+from app.domain.authorization.Session import Session
+from app.domain.authorization.SessionEpoch import SessionEpoch
+from app.infrastructure.adapter.output.cache.RedisSessionEpochStore import RedisSessionEpochStore
+from app.infrastructure.adapter.output.database.repositories.UserRepository import UserRepository
+from app.infrastructure.config.database.redis.RedisClient import RedisClient
+from app.infrastructure.config.EnvConfig import RedisConfig
+
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class TestSessionEpoch:
+    def test_from_claims_reads_epoch(self):
+        epoch = SessionEpoch.from_claims({SessionEpoch.CLAIM: 4})
+
+        assert epoch.value == 4
+
+    def test_from_claims_defaults_to_zero_for_legacy_tokens(self):
+        epoch = SessionEpoch.from_claims({"user_id": "u"})
+
+        assert epoch.value == 0
+
+    def test_from_claims_ignores_non_integer_values(self):
+        epoch = SessionEpoch.from_claims({SessionEpoch.CLAIM: "7"})
+
+        assert epoch.value == 0
+
+    def test_current_epoch_admits_token_from_same_epoch(self):
+        assert SessionEpoch(3).admits(SessionEpoch(3)) is True
+
+    def test_current_epoch_admits_token_from_newer_epoch(self):
+        assert SessionEpoch(3).admits(SessionEpoch(4)) is True
+
+    def test_current_epoch_rejects_token_from_older_epoch(self):
+        assert SessionEpoch(3).admits(SessionEpoch(2)) is False
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def epoch_store(redis):
+    redis_client = RedisClient(
+        RedisConfig(url="redis://localhost:6379/0", pool_size=1, max_connections=1, decode_responses=True)
+    )
+    redis_client._client = redis
+    return RedisSessionEpochStore(redis_client, ttl_seconds=3600, logger=MagicMock())
+
+
+class TestSessionEpochService:
+
+    @pytest.mark.asyncio
+    async def test_current_seeds_redis_from_the_database(self, epoch_store, redis):
+        user_id = uuid4()
+        user_repository = AsyncMock()
+        user_repository.find_session_epoch.return_value = 3
+        service = SessionEpochService(epoch_store, user_repository)
+
+        assert (await service.current(user_id)).value == 3
+        assert (await service.current(user_id)).value == 3
+        user_repository.find_session_epoch.assert_awaited_once_with(user_id)
+        assert await redis.get(f"session_epoch:{user_id}") == "3"
+
+    @pytest.mark.asyncio
+    async def test_bump_increments_in_redis_and_mirrors_to_the_database(self, epoch_store, redis):
+        user_id = uuid4()
+        user_repository = AsyncMock()
+        user_repository.find_session_epoch.return_value = 3
+        revocation_feed = AsyncMock()
+        service = SessionEpochService(epoch_store, user_repository, revocation_feed)
+
+        epoch = await service.bump(user_id)
+
+        assert epoch.value == 4
+        assert await redis.get(f"session_epoch:{user_id}") == "4"
+        assert await redis.ttl(f"session_epoch:{user_id}") > 0
+        user_repository.mirror_session_epoch.assert_awaited_once_with(user_id, 4)
+        user_repository.increment_session_epoch.assert_not_called()
+        revocation_feed.publish.assert_awaited_once_with(RevocationEvent.session_epoch_bumped(user_id, 4))
+
+    @pytest.mark.asyncio
+    async def test_bump_falls_back_to_the_database_when_redis_fails(self):
+        user_id = uuid4()
+        epoch_store = AsyncMock()
+        epoch_store.get.return_value = 3
+        epoch_store.increment.return_value = None
+        user_repository = AsyncMock()
+        user_repository.increment_session_epoch.return_value = 4
+        service = SessionEpochService(epoch_store, user_repository)
+
+        epoch = await service.bump(user_id)
+
+        assert epoch.value == 4
+        user_repository.mirror_session_epoch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_database_mirror_never_moves_the_epoch_backwards(self):
+        session = MagicMock(execute=AsyncMock(), flush=AsyncMock())
+
+        await UserRepository(session, MagicMock()).mirror_session_epoch(uuid4(), 4)
+
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "session_epoch=greatest(users.session_epoch, " in sql
+
+
+class TestTokenValidationSessionEpoch:
+
+    @staticmethod
+    def _service(user_id, session_id, current_epoch):
+        token_generator = MagicMock()
+        token_generator.decode.side_effect = lambda token: {
+            "user_id": str(user_id),
+            "session_id": str(session_id),
+            SessionEpoch.CLAIM: int(token),
+        }
+        session_repository = AsyncMock()
+        session_repository.find_by_id.return_value = Session(
+            id=session_id,
+            user_id=user_id,
+            refresh_token_hash="hash",
+            device_info="test",
+            ip_address="127.0.0.1",
+            expires_at=NOW + timedelta(days=1),
+            revoked_at=None,
+            created_at=NOW,
+        )
+        session_epoch_service = AsyncMock()
+        session_epoch_service.current.return_value = SessionEpoch(current_epoch)
+        return TokenValidationService(
+            session_repository=session_repository,
+            token_generator=token_generator,
+            datetime_converter=MagicMock(now_utc=MagicMock(return_value=NOW)),
+            session_epoch_service=session_epoch_service,
+        )
+
+    @pytest.mark.asyncio
+    async def test_token_from_an_older_epoch_is_rejected_without_a_session_lookup(self):
+        service = self._service(uuid4(), uuid4(), current_epoch=2)
+
+        result = await service.execute("1")
+
+        assert result.is_valid is False
+        assert result.error_message == "Session revoked by logout from all devices"
+        service.session_repository.find_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_token_from_the_current_epoch_is_accepted(self):
+        service = self._service(uuid4(), uuid4(), current_epoch=2)
+
+        result = await service.execute("2")
+
+        assert result.is_valid is True
+
+    @pytest.mark.asyncio
+    async def test_batch_reads_each_user_epoch_once(self):
+        service = self._service(uuid4(), uuid4(), current_epoch=2)
+        service.session_repository.find_by_ids.return_value = []
+
+        results = await service.execute_batch(["1", "2", "1"])
+
+        assert [result.error_message for result in results] == [
+            "Session revoked by logout from all devices",
+            "Session not found",
+            "Session revoked by logout from all devices",
+        ]
+        service.session_epoch_service.current.assert_awaited_once()
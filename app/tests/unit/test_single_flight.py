@@ -0,0 +1,196 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.port.output.IReadScope import IReadScope, ReadRepositories
+from app.application.service.TokenValidationService import TokenValidationService
+from app.domain.authorization.Session import Session
+from app.shared.SingleFlight import SingleFlight
+
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_lookups_run_once(self):
+        single_flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "value"
+
+        waiters = [asyncio.create_task(single_flight.do("key", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["value"] * 5
+        assert calls == 1
+        stats = single_flight.stats()
+        assert stats.executions == 1
+        assert stats.coalesced == 4
+        assert stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_distinct_keys_are_not_coalesced(self):
+        single_flight = SingleFlight()
+
+        async def loader():
+            return 1
+
+        await asyncio.gather(single_flight.do("a", loader), single_flight.do("b", loader))
+
+        assert single_flight.stats().executions == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter_and_are_not_cached(self):
+        single_flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            single_flight.do("key", failing),
+            single_flight.do("key", failing),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        async def succeeding():
+            return "ok"
+
+        assert await single_flight.do("key", succeeding) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return "value"
+
+        leader = asyncio.create_task(single_flight.do("key", loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do("key", loader))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        release.set()
+
+        assert await follower == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+
+class _ReadScope(IReadScope):
+    def __init__(self, name, session_repository):
+        self._name = name
+        self.repositories = ReadRepositories(
+            session_repository=session_repository,
+            service_access_repository=AsyncMock(),
+            user_plan_repository=AsyncMock(),
+            plan_repository=AsyncMock(),
+        )
+        self.opened = 0
+
+    @property
+    def name(self):
+        return self._name
+
+    @asynccontextmanager
+    async def open(self):
+        self.opened += 1
+        yield self.repositories
+
+
+def _session(user_id, session_id):
+    return Session(
+        id=session_id,
+        user_id=user_id,
+        refresh_token_hash="hash",
+        device_info="test",
+        ip_address="127.0.0.1",
+        expires_at=NOW + timedelta(days=1),
+        revoked_at=None,
+        created_at=NOW,
+    )
+
+
+def _token_validator(single_flight, read_scope, user_id, session_id):
+    token_generator = MagicMock()
+    token_generator.decode.return_value = {"user_id": str(user_id), "session_id": str(session_id)}
+    return TokenValidationService(
+        session_repository=AsyncMock(),
+        token_generator=token_generator,
+        datetime_converter=MagicMock(now_utc=MagicMock(return_value=NOW)),
+        single_flight=single_flight,
+        read_scope=read_scope,
+    )
+
+
+class TestCoalescedSessionLookups:
+
+    @pytest.mark.asyncio
+    async def test_coalesced_lookup_runs_on_the_flight_scope_not_the_request_session(self):
+        user_id, session_id = uuid4(), uuid4()
+        release = asyncio.Event()
+
+        async def find_by_id(_):
+            await release.wait()
+            return _session(user_id, session_id)
+
+        scope = _ReadScope("primary", AsyncMock(find_by_id=AsyncMock(side_effect=find_by_id)))
+        single_flight = SingleFlight()
+        validators = [_token_validator(single_flight, scope, user_id, session_id) for _ in range(3)]
+
+        leader = asyncio.create_task(validators[0].execute("token"))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(validator.execute("token")) for validator in validators[1:]]
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+
+        results = await asyncio.gather(*followers)
+
+        assert all(result.is_valid for result in results)
+        assert scope.opened == 1
+        for validator in validators:
+            validator.session_repository.find_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flights_are_keyed_by_scope(self):
+        user_id, session_id = uuid4(), uuid4()
+        primary = _ReadScope("primary", AsyncMock(find_by_id=AsyncMock(return_value=_session(user_id, session_id))))
+        replica = _ReadScope("replica", AsyncMock(find_by_id=AsyncMock(return_value=_session(user_id, session_id))))
+        single_flight = SingleFlight()
+
+        await asyncio.gather(
+            _token_validator(single_flight, primary, user_id, session_id).execute("token"),
+            _token_validator(single_flight, replica, user_id, session_id).execute("token"),
+        )
+
+        assert primary.opened == 1
+        assert replica.opened == 1
+
+    @pytest.mark.asyncio
+    async def test_without_a_scope_the_request_repository_is_used(self):
+        user_id, session_id = uuid4(), uuid4()
+        validator = _token_validator(SingleFlight(), None, user_id, session_id)
+        validator.session_repository.find_by_id.return_value = _session(user_id, session_id)
+
+        result = await validator.execute("token")
+
+        assert result.is_valid is True
+        validator.session_repository.find_by_id.assert_awaited_once_with(session_id)
@@ -0,0 +1,108 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.dto.QuotaCheckDTO import QuotaCheckResult
+from app.application.dto.ServiceAccessDTO import ServiceAccessResult
+from app.application.dto.TokenValidationDTO import TokenValidationResult
+from app.application.service.TokenIntrospectionService import TokenIntrospectionService
+from app.domain.exceptions import InsufficientQuotaException
+
+
+@pytest.fixture
+def validators():
+    return {
+        'token_validator': AsyncMock(),
+        'service_access_validator': AsyncMock(),
+        'quota_manager': AsyncMock(),
+    }
+
+
+def _valid_token():
+    return TokenValidationResult(is_valid=True, user_id=uuid4(), session_id=uuid4())
+
+
+class TestTokenIntrospectionService:
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_short_circuits(self, validators):
+        validators['token_validator'].execute.return_value = TokenValidationResult(
+            is_valid=False, error_message="Token has expired"
+        )
+        service = TokenIntrospectionService(**validators)
+
+        result = await service.execute("token", "svc", "api_calls_per_day", 1, True)
+
+        assert result.is_valid is False
+        assert result.error_message == "Token has expired"
+        validators['service_access_validator'].execute.assert_not_called()
+        validators['quota_manager'].consume.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_denied_service_access_skips_quota(self, validators):
+        validators['token_validator'].execute.return_value = _valid_token()
+        validators['service_access_validator'].execute.return_value = ServiceAccessResult(
+            is_allowed=False, error_message="User has no active plan"
+        )
+        service = TokenIntrospectionService(**validators)
+
+        result = await service.execute("token", "svc", "api_calls_per_day", 1, True)
+
+        assert result.is_valid is True
+        assert result.is_allowed is False
+        assert result.quota is None
+        validators['quota_manager'].consume.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_consumes_quota_and_reports_usage(self, validators):
+        token = _valid_token()
+        validators['token_validator'].execute.return_value = token
+        validators['service_access_validator'].execute.return_value = ServiceAccessResult(
+            is_allowed=True, allowed_features=["read"]
+        )
+        validators['quota_manager'].consume.return_value = QuotaCheckResult(
+            can_proceed=True, current_usage=3, limit=10, remaining=7, reset_at="2026-01-01T00:00:00+00:00"
+        )
+        service = TokenIntrospectionService(**validators)
+
+        result = await service.execute("token", "svc", "api_calls_per_day", 1, True)
+
+        validators['quota_manager'].consume.assert_awaited_once_with(token.user_id, "svc", "api_calls_per_day", 1)
+        validators['quota_manager'].execute.assert_not_called()
+        assert result.is_allowed is True
+        assert result.allowed_features == ["read"]
+        assert result.quota.can_proceed is True
+        assert result.quota.remaining == 7
+        assert result.error_message is None
+
+    @pytest.mark.asyncio
+    async def test_insufficient_quota_is_returned_as_decision(self, validators):
+        validators['token_validator'].execute.return_value = _valid_token()
+        validators['service_access_validator'].execute.return_value = ServiceAccessResult(is_allowed=True)
+        validators['quota_manager'].consume.side_effect = InsufficientQuotaException(
+            quota_type="api_calls_per_day", current=10, required=1
+        )
+        validators['quota_manager'].execute.return_value = QuotaCheckResult(
+            can_proceed=False, current_usage=10, limit=10, remaining=0, error_message="Quota limit exceeded"
+        )
+        service = TokenIntrospectionService(**validators)
+
+        result = await service.execute("token", "svc", "api_calls_per_day", 1, True)
+
+        assert result.is_allowed is True
+        assert result.quota.can_proceed is False
+        assert result.error_message == "Quota limit exceeded"
+
+    @pytest.mark.asyncio
+    async def test_check_only_does_not_consume(self, validators):
+        validators['token_validator'].execute.return_value = _valid_token()
+        validators['service_access_validator'].execute.return_value = ServiceAccessResult(is_allowed=True)
+        validators['quota_manager'].execute.return_value = QuotaCheckResult(
+            can_proceed=True, current_usage=0, limit=10, remaining=10
+        )
+        service = TokenIntrospectionService(**validators)
+
+        await service.execute("token", "svc", "api_calls_per_day", 1, False)
+
+        validators['quota_manager'].consume.assert_not_called()
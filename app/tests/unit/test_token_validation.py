@@ -0,0 +1,237 @@
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.application.dto.TokenValidationDTO import TokenValidationResult
+from app.application.service.TokenValidationService import TokenValidationService
+from app.domain.authorization.Session import Session
+from app.domain.authorization.SessionState import SessionState
+from app.domain.exceptions import TokenExpiredException, TokenInvalidException
+from app.infrastructure.adapter.output.database.repositories.SessionRepository import SessionRepository
+from app.infrastructure.adapter.input.middleware.TokenValidationFastPath import TokenValidationFastPath
+from app.infrastructure.config.database.persistence.SessionModel import SessionModel
+
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _session(user_id, session_id, revoked=False):
+    return Session(
+        id=session_id,
+        user_id=user_id,
+        refresh_token_hash="hash",
+        device_info="test",
+        ip_address="127.0.0.1",
+        expires_at=NOW + timedelta(days=1),
+        revoked_at=NOW if revoked else None,
+        created_at=NOW,
+    )
+
+
+@pytest.fixture
+def dependencies():
+    session_state_cache = AsyncMock()
+    session_state_cache.get.return_value = None
+    session_state_cache.get_many.return_value = {}
+    return {
+        'session_repository': AsyncMock(),
+        'token_generator': MagicMock(),
+        'datetime_converter': MagicMock(now_utc=MagicMock(return_value=NOW)),
+        'session_state_cache': session_state_cache,
+    }
+
+
+class TestSessionStateFill:
+
+    @pytest.mark.asyncio
+    async def test_read_through_fill_never_overwrites_a_cached_state(self, dependencies):
+        user_id, session_id = uuid4(), uuid4()
+        dependencies['token_generator'].decode.return_value = {"user_id": str(user_id), "session_id": str(session_id)}
+        dependencies['session_repository'].find_by_id.return_value = _session(user_id, session_id)
+        service = TokenValidationService(**dependencies)
+
+        result = await service.execute("token")
+
+        assert result.is_valid is True
+        cache = dependencies['session_state_cache']
+        cache.set_if_absent.assert_awaited_once_with(SessionState.from_session(_session(user_id, session_id)))
+        cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cached_revoked_state_is_honoured(self, dependencies):
+        user_id, session_id = uuid4(), uuid4()
+        dependencies['token_generator'].decode.return_value = {"user_id": str(user_id), "session_id": str(session_id)}
+        dependencies['session_state_cache'].get.return_value = SessionState.from_session(
+            _session(user_id, session_id, revoked=True)
+        )
+        service = TokenValidationService(**dependencies)
+
+        result = await service.execute("token")
+
+        assert result.is_valid is False
+        assert result.error_message == "Session expired or revoked"
+        dependencies['session_repository'].find_by_id.assert_not_called()
+
+
+class TestBatchValidation:
+
+    @staticmethod
+    def _decoder(payloads):
+        def decode(token):
+            payload = payloads[token]
+            if isinstance(payload, Exception):
+                raise payload
+            return payload
+        return decode
+
+    @pytest.mark.asyncio
+    async def test_results_follow_token_order_with_one_lookup_per_session(self, dependencies):
+        user_id, session_id, other_session_id = uuid4(), uuid4(), uuid4()
+        dependencies['token_generator'].decode.side_effect = self._decoder({
+            "valid": {"user_id": str(user_id), "session_id": str(session_id)},
+            "other": {"user_id": str(user_id), "session_id": str(other_session_id)},
+            "expired": TokenExpiredException(),
+            "garbage": TokenInvalidException(),
+            "no-session": {"user_id": str(user_id)},
+        })
+        dependencies['session_repository'].find_by_ids.return_value = [
+            _session(user_id, session_id),
+            _session(user_id, other_session_id, revoked=True),
+        ]
+        service = TokenValidationService(**dependencies)
+
+        results = await service.execute_batch(["valid", "expired", "valid", "garbage", "other", "no-session", "valid"])
+
+        assert [result.is_valid for result in results] == [True, False, True, False, False, False, True]
+        assert results[1].error_message == "Token has expired"
+        assert results[3].error_message == "Token is invalid"
+        assert results[4].error_message == "Session expired or revoked"
+        assert results[5].error_message == "Token payload missing session_id"
+        assert {results[0].session_id, results[2].session_id, results[6].session_id} == {session_id}
+        dependencies['session_repository'].find_by_ids.assert_awaited_once()
+        assert sorted(dependencies['session_repository'].find_by_ids.await_args.args[0]) == sorted(
+            [session_id, other_session_id]
+        )
+        dependencies['session_repository'].find_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cached_and_unknown_sessions_skip_or_fail_the_lookup(self, dependencies):
+        user_id, cached_id, unknown_id = uuid4(), uuid4(), uuid4()
+        dependencies['token_generator'].decode.side_effect = self._decoder({
+            "cached": {"user_id": str(user_id), "session_id": str(cached_id)},
+            "unknown": {"user_id": str(user_id), "session_id": str(unknown_id)},
+        })
+        dependencies['session_state_cache'].get_many.return_value = {
+            cached_id: SessionState.from_session(_session(user_id, cached_id))
+        }
+        dependencies['session_repository'].find_by_ids.return_value = []
+        service = TokenValidationService(**dependencies)
+
+        results = await service.execute_batch(["cached", "unknown", "cached"])
+
+        assert [result.is_valid for result in results] == [True, False, True]
+        assert results[1].error_message == "Session not found"
+        dependencies['session_repository'].find_by_ids.assert_awaited_once_with([unknown_id])
+        dependencies['session_state_cache'].set_if_absent.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_tokens_only_never_touch_the_database(self, dependencies):
+        dependencies['token_generator'].decode.side_effect = TokenInvalidException()
+        service = TokenValidationService(**dependencies)
+
+        results = await service.execute_batch(["garbage", "garbage"])
+
+        assert [result.error_message for result in results] == ["Token is invalid", "Token is invalid"]
+        dependencies['session_repository'].find_by_ids.assert_not_called()
+
+
+class TestSessionRepositoryFindByIds:
+
+    @staticmethod
+    def _repository(models):
+        statements = []
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = models
+
+        async def execute(statement):
+            statements.append(statement)
+            return result
+
+        return SessionRepository(MagicMock(execute=execute), MagicMock()), statements
+
+    @pytest.mark.asyncio
+    async def test_loads_every_session_in_one_array_query(self):
+        user_id, session_ids = uuid4(), [uuid4(), uuid4()]
+        models = [
+            SessionModel(
+                id=session_id,
+                user_id=user_id,
+                refresh_token_hash="hash",
+                device_info="test",
+                ip_address="127.0.0.1",
+                expires_at=NOW + timedelta(days=1),
+                revoked_at=None,
+                created_at=NOW,
+            )
+            for session_id in session_ids
+        ]
+        repository, statements = self._repository(models)
+
+        sessions = await repository.find_by_ids(session_ids)
+
+        assert [session.id for session in sessions] == session_ids
+        compiled = statements[0].compile(dialect=postgresql.dialect())
+        assert "sessions.id = ANY (%(session_ids)s::UUID[])" in str(compiled)
+        assert compiled.params["session_ids"] == session_ids
+
+    @pytest.mark.asyncio
+    async def test_empty_id_list_skips_the_query(self):
+        repository, statements = self._repository([])
+
+        assert await repository.find_by_ids([]) == []
+        assert statements == []
+
+
+class TestTokenValidationFastPath:
+
+    @staticmethod
+    async def _post(headers):
+        validator = AsyncMock()
+        validator.execute.return_value = TokenValidationResult(
+            is_valid=True, user_id=uuid4(), session_id=uuid4(), expires_at=NOW + timedelta(hours=1)
+        )
+
+        @asynccontextmanager
+        async def session_factory():
+            yield MagicMock()
+
+        middleware = TokenValidationFastPath(
+            AsyncMock(),
+            path="/api/v1/validate/token",
+            session_factory=session_factory,
+            service_factory=lambda session: validator,
+        )
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": json.dumps({"token": "token"}).encode(), "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "method": "POST", "path": "/api/v1/validate/token", "headers": headers}
+        await middleware(scope, receive, send)
+        return messages[0]["status"], dict(messages[0]["headers"])
+
+    @pytest.mark.asyncio
+    async def test_post_response_is_not_stored_or_revalidated(self):
+        status, headers = await self._post([(b"if-none-match", b"*")])
+
+        assert status == 200
+        assert headers[b"cache-control"] == b"no-store"
+        assert b"etag" not in headers
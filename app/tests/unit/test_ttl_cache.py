@@ -0,0 +1,133 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.domain.authorization.TokenRejection import TokenRejection
+from app.shared.TokenClaimsCache import TokenClaimsCache, TokenDigest
+from app.shared.TokenRejectionCache import TokenRejectionCache
+from app.shared.TtlCache import TtlCache
+
+
+class FakeClock:
+    def __init__(self, start: datetime):
+        self.current = start
+
+    def now_utc(self) -> datetime:
+        return self.current
+
+    def advance(self, seconds: int) -> None:
+        self.current = self.current + timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock(datetime(2026, 1, 1, tzinfo=UTC))
+
+
+class TestTtlCache:
+    def test_rejects_non_positive_capacity(self, clock):
+        with pytest.raises(ValueError):
+            TtlCache(max_entries=0, datetime_converter=clock)
+
+    def test_get_returns_stored_value_and_counts_hit(self, clock):
+        cache = TtlCache(max_entries=2, datetime_converter=clock)
+        cache.set("a", 1, clock.now_utc().timestamp() + 60)
+
+        assert cache.get("a") == 1
+        assert cache.stats().hits == 1
+        assert cache.stats().misses == 0
+
+    def test_missing_key_counts_miss(self, clock):
+        cache = TtlCache(max_entries=2, datetime_converter=clock)
+
+        assert cache.get("missing") is None
+        assert cache.stats().misses == 1
+
+    def test_entry_expires_at_deadline(self, clock):
+        cache = TtlCache(max_entries=2, datetime_converter=clock)
+        cache.set("a", 1, clock.now_utc().timestamp() + 10)
+
+        clock.advance(10)
+
+        assert cache.get("a") is None
+        stats = cache.stats()
+        assert stats.expirations == 1
+        assert stats.size == 0
+
+    def test_already_expired_value_is_not_stored(self, clock):
+        cache = TtlCache(max_entries=2, datetime_converter=clock)
+        cache.set("a", 1, clock.now_utc().timestamp() - 1)
+
+        assert cache.stats().size == 0
+
+    def test_least_recently_used_entry_is_evicted(self, clock):
+        cache = TtlCache(max_entries=2, datetime_converter=clock)
+        expires_at = clock.now_utc().timestamp() + 60
+        cache.set("a", 1, expires_at)
+        cache.set("b", 2, expires_at)
+        cache.get("a")
+        cache.set("c", 3, expires_at)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats().evictions == 1
+
+    def test_hit_ratio(self, clock):
+        cache = TtlCache(max_entries=2, datetime_converter=clock)
+        cache.set("a", 1, clock.now_utc().timestamp() + 60)
+        cache.get("a")
+        cache.get("b")
+
+        assert cache.stats().hit_ratio() == 0.5
+
+
+class TestTokenClaimsCache:
+    def test_claims_are_keyed_by_token_digest(self, clock):
+        backend = TtlCache(max_entries=10, datetime_converter=clock)
+        cache = TokenClaimsCache(backend)
+        claims = {"user_id": "u", "exp": int(clock.now_utc().timestamp()) + 60}
+
+        cache.put("token-value", claims)
+
+        assert backend.get(TokenDigest.compute("token-value")) == claims
+        assert cache.get("token-value") == claims
+
+    def test_claims_expire_with_token(self, clock):
+        cache = TokenClaimsCache(TtlCache(max_entries=10, datetime_converter=clock))
+        cache.put("token-value", {"exp": int(clock.now_utc().timestamp()) + 5})
+
+        clock.advance(5)
+
+        assert cache.get("token-value") is None
+
+    def test_claims_without_exp_are_not_cached(self, clock):
+        cache = TokenClaimsCache(TtlCache(max_entries=10, datetime_converter=clock))
+        cache.put("token-value", {"user_id": "u"})
+
+        assert cache.get("token-value") is None
+
+
+class TestTokenRejectionCache:
+    def test_rejection_is_replayed_until_ttl(self, clock):
+        cache = TokenRejectionCache(TtlCache(max_entries=10, datetime_converter=clock), clock, ttl_seconds=30)
+        cache.put("forged", TokenRejection.invalid_signature())
+
+        assert cache.get("forged") == TokenRejection.invalid_signature()
+
+        clock.advance(30)
+
+        assert cache.get("forged") is None
+
+    def test_counts_fresh_and_absorbed_rejections_per_reason(self, clock):
+        cache = TokenRejectionCache(TtlCache(max_entries=10, datetime_converter=clock), clock, ttl_seconds=30)
+        cache.put("expired", TokenRejection.expired())
+        cache.put("garbage", TokenRejection.malformed("Token is invalid"))
+        cache.get("expired")
+        cache.get("expired")
+        cache.absorb("forged", TokenRejection.invalid_signature())
+
+        stats = cache.stats()
+        assert stats.rejected == {"expired": 1, "malformed_claims": 1}
+        assert stats.absorbed == {"expired": 2, "invalid_signature": 1}
+        assert stats.size == 3
@@ -0,0 +1,62 @@
+import base64
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class EntitlementRegistry:
+    version: str
+    services: tuple[str, ...]
+
+    @staticmethod
+    def from_response(data: dict[str, Any]) -> "EntitlementRegistry":
+        return EntitlementRegistry(version=data["version"], services=tuple(data["services"]))
+
+
+@dataclass(frozen=True)
+class Entitlements:
+    services: dict[str, frozenset[str] | None] = field(default_factory=dict)
+    plan_expires_at: float | None = None
+
+    CLAIM = "ent"
+
+    @staticmethod
+    def claim_version(payload: dict[str, Any]) -> str | None:
+        claim = payload.get(Entitlements.CLAIM)
+        if not isinstance(claim, dict):
+            return None
+        version = claim.get("v")
+        return version if isinstance(version, str) else None
+
+    @staticmethod
+    def decode(payload: dict[str, Any], registry: EntitlementRegistry) -> "Entitlements | None":
+        claim = payload.get(Entitlements.CLAIM)
+        if not isinstance(claim, dict) or claim.get("v") != registry.version:
+            return None
+
+        try:
+            encoded = claim["b"]
+            bitmap = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+            features = claim.get("f", {})
+            services: dict[str, frozenset[str] | None] = {}
+            for index, service_name in enumerate(registry.services):
+                byte_index = index // 8
+                if byte_index < len(bitmap) and bitmap[byte_index] & (1 << (index % 8)):
+                    allowed = features.get(str(index))
+                    services[service_name] = frozenset(allowed) if allowed is not None else None
+            return Entitlements(services=services, plan_expires_at=claim.get("x"))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def allows(self, service_name: str, clock: Callable[[], float] = time.time) -> bool:
+        if self.plan_expires_at is not None and clock() >= self.plan_expires_at:
+            return False
+        return service_name in self.services
+
+    def has_feature(self, service_name: str, feature: str, clock: Callable[[], float] = time.time) -> bool:
+        if not self.allows(service_name, clock):
+            return False
+        allowed_features = self.services[service_name]
+        return allowed_features is None or feature in allowed_features
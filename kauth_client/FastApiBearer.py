@@ -0,0 +1,26 @@
+from fastapi import Header, HTTPException, status
+
+from kauth_client.KAuthClient import KAuthClient
+from kauth_client.VerifiedToken import VerifiedToken
+
+
+class KAuthBearer:
+    def __init__(self, client: KAuthClient):
+        self._client = client
+
+    async def __call__(self, authorization: str = Header(..., alias="Authorization")) -> VerifiedToken:
+        if not authorization.startswith("Bearer "):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authorization header format. Expected 'Bearer <token>'"
+            )
+
+        result = await self._client.verify(authorization.removeprefix("Bearer "))
+
+        if not result.is_valid:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=result.error_message or "Invalid or expired token"
+            )
+
+        return result
@@ -0,0 +1,66 @@
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import jwt
+import structlog
+
+
+class JwksCache:
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        jwks_path: str = "/.well-known/jwks.json",
+        refresh_seconds: float = 300.0,
+        min_refetch_seconds: float = 30.0,
+        hmac_secret: str | None = None,
+        hmac_algorithm: str = "HS256",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._http = http_client
+        self._jwks_path = jwks_path
+        self._refresh_seconds = refresh_seconds
+        self._min_refetch_seconds = min_refetch_seconds
+        self._hmac_secret = hmac_secret
+        self._hmac_algorithm = hmac_algorithm
+        self._clock = clock
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at: float | None = None
+        self._attempted_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._logger = structlog.get_logger().bind(component="kauth_jwks_cache")
+
+    async def key_for(self, kid: str | None) -> tuple[Any, str] | None:
+        if kid is None:
+            return (self._hmac_secret, self._hmac_algorithm) if self._hmac_secret else None
+
+        if self._is_stale() or (kid not in self._keys and self._may_refetch()):
+            await self.refresh()
+
+        key = self._keys.get(kid)
+        return (key.key, key.algorithm_name) if key else None
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            if self._attempted_at is not None and not self._may_refetch():
+                return
+            self._attempted_at = self._clock()
+
+            try:
+                response = await self._http.get(self._jwks_path)
+                response.raise_for_status()
+                keys = {jwk["kid"]: jwt.PyJWK(jwk) for jwk in response.json().get("keys", []) if "kid" in jwk}
+            except (httpx.HTTPError, ValueError, KeyError, jwt.PyJWKError) as e:
+                self._logger.warning("jwks_refresh_failed", error=str(e))
+                return
+
+            self._keys = keys
+            self._fetched_at = self._attempted_at
+
+    def _is_stale(self) -> bool:
+        return self._fetched_at is None or self._clock() - self._fetched_at >= self._refresh_seconds
+
+    def _may_refetch(self) -> bool:
+        return self._attempted_at is None or self._clock() - self._attempted_at >= self._min_refetch_seconds
@@ -0,0 +1,220 @@
+import asyncio
+import contextlib
+import time
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+import httpx
+import jwt
+import structlog
+
+from kauth_client.Entitlements import EntitlementRegistry, Entitlements
+from kauth_client.JwksCache import JwksCache
+from kauth_client.RevocationSet import RevocationSet
+from kauth_client.VerifiedToken import VerifiedToken
+
+
+class KAuthClient:
+    VALIDATE_PATH = "/api/v1/validate/token"
+    REVOCATIONS_PATH = "/api/v1/validate/revocations"
+    ENTITLEMENT_REGISTRY_PATH = "/api/v1/validate/entitlements/registry"
+    REVOCATION_PAGE_SIZE = 500
+
+    def __init__(
+        self,
+        base_url: str,
+        hmac_secret: str | None = None,
+        hmac_algorithm: str = "HS256",
+        http_client: httpx.AsyncClient | None = None,
+        jwks_refresh_seconds: float = 300.0,
+        revocation_sync_seconds: float = 2.0,
+        max_staleness_seconds: float = 30.0,
+        remote_fallback: bool = True,
+        entitlement_registry_refresh_seconds: float = 30.0,
+        api_key: str | None = None,
+    ):
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(base_url=base_url, timeout=5.0)
+        self._jwks = JwksCache(
+            self._http,
+            refresh_seconds=jwks_refresh_seconds,
+            hmac_secret=hmac_secret,
+            hmac_algorithm=hmac_algorithm,
+        )
+        self._revocations = RevocationSet()
+        self._service_headers = {"X-API-Key": api_key} if api_key else {}
+        self._revocation_sync_seconds = revocation_sync_seconds
+        self._max_staleness_seconds = max_staleness_seconds
+        self._remote_fallback = remote_fallback
+        self._synced_at: float | None = None
+        self._entitlement_registry: EntitlementRegistry | None = None
+        self._entitlement_registry_refresh_seconds = entitlement_registry_refresh_seconds
+        self._entitlement_registry_fetched_at: float | None = None
+        self._sync_task: asyncio.Task[None] | None = None
+        self._logger = structlog.get_logger().bind(component="kauth_client")
+
+    async def __aenter__(self) -> "KAuthClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        await self._jwks.refresh()
+        await self._sync_quietly()
+        self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def close(self) -> None:
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sync_task
+            self._sync_task = None
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def sync_revocations(self) -> None:
+        while True:
+            params: dict[str, Any] = {"limit": self.REVOCATION_PAGE_SIZE}
+            if self._revocations.cursor:
+                params["cursor"] = self._revocations.cursor
+
+            response = await self._http.get(self.REVOCATIONS_PATH, params=params, headers=self._service_headers)
+            response.raise_for_status()
+            page = response.json()
+            self._revocations.apply(page)
+
+            if len(page["events"]) < self.REVOCATION_PAGE_SIZE:
+                break
+
+        self._synced_at = time.monotonic()
+
+    async def refresh_entitlement_registry(self) -> None:
+        self._entitlement_registry_fetched_at = time.monotonic()
+        response = await self._http.get(self.ENTITLEMENT_REGISTRY_PATH)
+        response.raise_for_status()
+        self._entitlement_registry = EntitlementRegistry.from_response(response.json())
+
+    async def verify(self, token: str) -> VerifiedToken:
+        result = await self._verify_locally(token)
+        if result is not None:
+            return result
+
+        if self._remote_fallback:
+            return await self._verify_remotely(token)
+
+        return VerifiedToken.rejected("Token cannot be verified locally")
+
+    async def _verify_locally(self, token: str) -> VerifiedToken | None:
+        if self._is_revocation_set_stale():
+            return None
+
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except jwt.InvalidTokenError:
+            return VerifiedToken.rejected("Token is invalid")
+
+        key = await self._jwks.key_for(kid)
+        if key is None:
+            return None
+
+        verification_key, algorithm = key
+        try:
+            payload = jwt.decode(token, verification_key, algorithms=[algorithm])
+        except jwt.ExpiredSignatureError:
+            return VerifiedToken.rejected("Token has expired")
+        except jwt.InvalidTokenError:
+            return VerifiedToken.rejected("Token is invalid")
+
+        return self._evaluate(payload, await self._decode_entitlements(payload))
+
+    async def _decode_entitlements(self, payload: dict[str, Any]) -> Entitlements | None:
+        version = Entitlements.claim_version(payload)
+        if version is None:
+            return None
+
+        registry = self._entitlement_registry
+        if (registry is None or registry.version != version) and self._can_refresh_entitlement_registry():
+            try:
+                await self.refresh_entitlement_registry()
+            except (httpx.HTTPError, ValueError, KeyError) as e:
+                self._logger.warning("entitlement_registry_refresh_failed", error=str(e))
+            registry = self._entitlement_registry
+
+        if registry is None:
+            return None
+        return Entitlements.decode(payload, registry)
+
+    def _can_refresh_entitlement_registry(self) -> bool:
+        return (
+            self._entitlement_registry_fetched_at is None
+            or time.monotonic() - self._entitlement_registry_fetched_at >= self._entitlement_registry_refresh_seconds
+        )
+
+    def _evaluate(self, payload: dict[str, Any], entitlements: Entitlements | None = None) -> VerifiedToken:
+        user_id_str = payload.get("user_id")
+        session_id_str = payload.get("session_id")
+
+        if not user_id_str:
+            return VerifiedToken.rejected("Token payload missing user_id")
+
+        if not session_id_str:
+            return VerifiedToken.rejected("Token payload missing session_id")
+
+        try:
+            user_id = UUID(user_id_str)
+            session_id = UUID(session_id_str)
+        except (ValueError, TypeError):
+            return VerifiedToken.rejected("Invalid user_id or session_id format in token")
+
+        session_epoch = payload.get("session_epoch", 0)
+        if not isinstance(session_epoch, int):
+            session_epoch = 0
+
+        if self._revocations.is_epoch_revoked(str(user_id), session_epoch):
+            return VerifiedToken.rejected("Session revoked by logout from all devices")
+
+        if self._revocations.is_session_revoked(str(session_id)):
+            return VerifiedToken.rejected("Session expired or revoked")
+
+        return VerifiedToken(
+            is_valid=True,
+            user_id=user_id,
+            session_id=session_id,
+            session_epoch=session_epoch,
+            expires_at=datetime.fromtimestamp(payload["exp"], tz=UTC) if "exp" in payload else None,
+            entitlements=entitlements,
+        )
+
+    async def _verify_remotely(self, token: str) -> VerifiedToken:
+        try:
+            response = await self._http.post(self.VALIDATE_PATH, json={"token": token})
+            response.raise_for_status()
+            data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            self._logger.warning("remote_validation_failed", error=str(e))
+            return VerifiedToken.rejected("Token validation service unavailable", source="remote")
+
+        return VerifiedToken(
+            is_valid=data["is_valid"],
+            user_id=UUID(data["user_id"]) if data.get("user_id") else None,
+            session_id=UUID(data["session_id"]) if data.get("session_id") else None,
+            error_message=data.get("error_message"),
+            source="remote",
+        )
+
+    def _is_revocation_set_stale(self) -> bool:
+        return self._synced_at is None or time.monotonic() - self._synced_at > self._max_staleness_seconds
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._revocation_sync_seconds)
+            await self._sync_quietly()
+
+    async def _sync_quietly(self) -> None:
+        try:
+            await self.sync_revocations()
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            self._logger.warning("revocation_sync_failed", error=str(e))
@@ -0,0 +1,48 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+class RevocationSet:
+    def __init__(self, grace_seconds: float = 60.0, clock: Callable[[], float] = time.time):
+        self._grace_seconds = grace_seconds
+        self._clock = clock
+        self._sessions: dict[str, float] = {}
+        self._epochs: dict[str, tuple[int, float]] = {}
+        self.cursor: str | None = None
+
+    def __len__(self) -> int:
+        return len(self._sessions) + len(self._epochs)
+
+    def apply(self, page: dict[str, Any]) -> None:
+        retention_seconds = page["retention_seconds"]
+        for event in page["events"]:
+            forget_at = self._event_time(event["cursor"]) + retention_seconds + self._grace_seconds
+            if event["kind"] == "session" and event.get("session_id"):
+                self._sessions[event["session_id"]] = forget_at
+            elif event["kind"] == "session_epoch" and event.get("session_epoch") is not None:
+                current = self._epochs.get(event["user_id"])
+                if current is None or event["session_epoch"] >= current[0]:
+                    self._epochs[event["user_id"]] = (event["session_epoch"], forget_at)
+
+        if page.get("cursor"):
+            self.cursor = page["cursor"]
+        self._prune()
+
+    def is_session_revoked(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def is_epoch_revoked(self, user_id: str, session_epoch: int) -> bool:
+        current = self._epochs.get(user_id)
+        return current is not None and session_epoch < current[0]
+
+    def _prune(self) -> None:
+        now = self._clock()
+        self._sessions = {key: forget_at for key, forget_at in self._sessions.items() if forget_at > now}
+        self._epochs = {key: value for key, value in self._epochs.items() if value[1] > now}
+
+    def _event_time(self, cursor: str) -> float:
+        try:
+            return int(cursor.split("-", 1)[0]) / 1000
+        except (ValueError, AttributeError):
+            return self._clock()
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from kauth_client.Entitlements import Entitlements
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    is_valid: bool
+    user_id: UUID | None = None
+    session_id: UUID | None = None
+    session_epoch: int | None = None
+    expires_at: datetime | None = None
+    error_message: str | None = None
+    entitlements: Entitlements | None = None
+    source: str = "local"
+
+    @staticmethod
+    def rejected(message: str, source: str = "local") -> "VerifiedToken":
+        return VerifiedToken(is_valid=False, error_message=message, source=source)
@@ -0,0 +1,14 @@
+from kauth_client.Entitlements import EntitlementRegistry, Entitlements
+from kauth_client.JwksCache import JwksCache
+from kauth_client.KAuthClient import KAuthClient
+from kauth_client.RevocationSet import RevocationSet
+from kauth_client.VerifiedToken import VerifiedToken
+
+__all__ = [
+    "EntitlementRegistry",
+    "Entitlements",
+    "JwksCache",
+    "KAuthClient",
+    "RevocationSet",
+    "VerifiedToken",
+]
@@ -0,0 +1,85 @@
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import httpx
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from jwt.algorithms import OKPAlgorithm
+
+from kauth_client import KAuthClient
+
+KID = "bench"
+
+
+def build_local_fixture() -> tuple[str, httpx.MockTransport]:
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    jwk = OKPAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update({"kid": KID, "alg": "EdDSA", "use": "sig"})
+
+    now = datetime.now(UTC)
+    token = jwt.encode(
+        {
+            "user_id": str(uuid4()),
+            "session_id": str(uuid4()),
+            "session_epoch": 0,
+            "type": "access",
+            "iat": now,
+            "exp": now + timedelta(hours=1),
+        },
+        private_key,
+        algorithm="EdDSA",
+        headers={"kid": KID},
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/.well-known/jwks.json":
+            return httpx.Response(200, json={"keys": [jwk]})
+        if request.url.path == KAuthClient.REVOCATIONS_PATH:
+            return httpx.Response(200, json={"events": [], "cursor": None, "retention_seconds": 3600})
+        return httpx.Response(404)
+
+    return token, httpx.MockTransport(handler)
+
+
+async def measure(label: str, client: KAuthClient, token: str, iterations: int) -> None:
+    samples: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = await client.verify(token)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+
+    samples.sort()
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(
+        f"  {label:<7} p50 {statistics.median(samples):9.1f} us  p99 {p99:9.1f} us  "
+        f"valid={result.is_valid} source={result.source}"
+    )
+
+
+async def main(iterations: int, base_url: str | None, token: str | None):
+    print(f"Token verification latency, {iterations} iterations")
+
+    local_token, transport = build_local_fixture()
+    async with (
+        httpx.AsyncClient(transport=transport, base_url="http://kauth") as http_client,
+        KAuthClient("http://kauth", http_client=http_client) as client,
+    ):
+        await measure("local", client, local_token, iterations)
+
+    if base_url and token:
+        async with KAuthClient(base_url, max_staleness_seconds=0) as client:
+            await measure("remote", client, token, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure kauth_client local and remote verification latency")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--base-url", help="running auth service to measure the remote path against")
+    parser.add_argument("--token", help="access token issued by --base-url")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations, args.base_url, args.token))
@@ -0,0 +1,66 @@
+import secrets
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+ITERATIONS = 2000
+
+
+def build_keys() -> dict[str, tuple[object, object]]:
+    hmac_secret = secrets.token_urlsafe(32)
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ec_key = ec.generate_private_key(ec.SECP256R1())
+    ed_key = ed25519.Ed25519PrivateKey.generate()
+
+    return {
+        "HS256": (hmac_secret, hmac_secret),
+        "RS256": (rsa_key, rsa_key.public_key()),
+        "ES256": (ec_key, ec_key.public_key()),
+        "EdDSA": (ed_key, ed_key.public_key()),
+    }
+
+
+def build_payload() -> dict:
+    now = datetime.now(UTC)
+    return {
+        "user_id": str(uuid4()),
+        "session_id": str(uuid4()),
+        "session_epoch": 0,
+        "type": "access",
+        "iat": now,
+        "exp": now + timedelta(hours=1),
+    }
+
+
+def measure(label: str, func) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    elapsed = time.perf_counter() - start
+    per_op_us = elapsed / ITERATIONS * 1_000_000
+    print(f"  {label:<7} {per_op_us:10.1f} us/op  {ITERATIONS / elapsed:12.0f} ops/s")
+    return per_op_us
+
+
+def main():
+    payload = build_payload()
+    print(f"JWT sign/verify cost, {ITERATIONS} iterations per measurement")
+
+    for algorithm, (signing_key, verification_key) in build_keys().items():
+        token = jwt.encode(payload, signing_key, algorithm=algorithm, headers={"kid": "bench"})
+        print(f"{algorithm} (token {len(token)} bytes)")
+        measure(
+            "sign",
+            lambda key=signing_key, alg=algorithm: jwt.encode(payload, key, algorithm=alg, headers={"kid": "bench"})
+        )
+        measure(
+            "verify",
+            lambda key=verification_key, alg=algorithm, tok=token: jwt.decode(tok, key, algorithms=[alg])
+        )
+
+
+if __name__ == "__main__":
+    main()
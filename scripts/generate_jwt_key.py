@@ -0,0 +1,51 @@
+import argparse
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+
+def generate_private_key(algorithm: str):
+    if algorithm == "RS256":
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    if algorithm == "ES256":
+        return ec.generate_private_key(ec.SECP256R1())
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    raise ValueError(f"Unsupported algorithm: {algorithm}")
+
+
+def write_key_pair(algorithm: str, kid: str, out_dir: Path) -> None:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    private_key = generate_private_key(algorithm)
+
+    private_path = out_dir / f"{kid}.pem"
+    private_path.write_bytes(
+        private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+    )
+    private_path.chmod(0o600)
+
+    public_path = out_dir / f"{kid}.pub.pem"
+    public_path.write_bytes(
+        private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+    )
+
+    print(f"Generated {algorithm} key '{kid}' in {out_dir}")
+    print("Publish it first, then set JWT_ACTIVE_KID once downstream JWKS caches have refreshed.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a kid-tagged JWT signing key for the key ring")
+    parser.add_argument("--algorithm", choices=["RS256", "ES256", "EdDSA"], default="ES256")
+    parser.add_argument("--kid", required=True)
+    parser.add_argument("--out-dir", default="env/jwt_keys")
+    args = parser.parse_args()
+
+    write_key_pair(args.algorithm, args.kid, Path(args.out_dir))